@@ -25,6 +25,13 @@ automation.
 # ....................{ IMPORTS                            }....................
 # Subject all subsequent imports to @beartype-based hybrid runtime-static
 # type-checking *BEFORE* importing anything further.
+#
+# Callables called once for each log record (e.g., the filter(), format(),
+# and emit() methods of the filters, formatters, and handlers defined by the
+# "betse.util.io.log" subpackage) are intentionally excluded from this
+# type-checking by the standard @typing.no_type_check decorator. Since logging
+# is ubiquitous, type-checking these callables would otherwise add overhead to
+# every logging call comparable to the cost of those callables themselves.
 # from beartype import BeartypeConf
 from beartype.claw import beartype_this_package
 beartype_this_package()
@@ -203,6 +203,44 @@ class BetsePyDotException(BetseLibException):
     pass
 
 
+class BetseLibRequirementVersionException(BetseLibException):
+    '''
+    Exception raised on the currently installed version of a third-party
+    dependency failing to satisfy the version constraints of a
+    :mod:`setuptools`-specific requirement for that dependency.
+
+    Attributes
+    ----------
+    requirement : str
+        Human-readable string describing this requirement (e.g.,
+        ``PyYAML>=3.10``).
+    version : str
+        Currently installed version of this dependency (e.g., ``3.09``).
+    '''
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(self, requirement: str, version: str) -> None:
+        '''
+        Initialize this exception.
+
+        Parameters
+        ----------
+        requirement : str
+            Human-readable string describing this requirement.
+        version : str
+            Currently installed version of this dependency.
+        '''
+
+        # Classify all passed parameters.
+        self.requirement = requirement
+        self.version = version
+
+        # Initialize our superclass with a human-readable exception message.
+        super().__init__(
+            'Dependency "{}" unsatisfied by installed version {}.'.format(
+                requirement, version))
+
+
 class BetseVersionException(BetseLibException):
     '''
     Version specifier-specific exception applicable to third-party dependency.
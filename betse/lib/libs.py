@@ -40,6 +40,22 @@ from betse.util.type.types import (
     # SequenceTypes,
 )
 
+# ....................{ GLOBALS                            }....................
+_DEPENDENCY_NAME_TO_IS_SATISFIED = {}
+'''
+Dictionary mapping the name of each optional runtime dependency previously
+passed to the :func:`is_runtime_optional` function to ``True`` only if that
+dependency was satisfiable.
+
+Testing satisfiability searches both the module import path (i.e.,
+:data:`sys.path`) for the top-level module defining each dependency *and* the
+current ``${PATH}`` for each external command required by each dependency. Since
+these searches typically require filesystem access and since neither the set of
+installed modules nor commands changes in practice over the lifetime of the
+active Python process, each dependency is tested at most once and the result
+cached here for reuse by subsequent calls.
+'''
+
 # ....................{ EXCEPTIONS                         }....................
 def die_unless_runtime_mandatory_all() -> None:
     '''
@@ -99,18 +115,19 @@ def die_unless_runtime_optional(*dependency_names: str) -> None:
         Further details.
     '''
 
-    # If one or more of these optional runtime dependencies are unsatisfied...
-    if not is_runtime_optional(*dependency_names):
-        # For the name of each such dependency...
-        for dependency_name in dependency_names:
-            # If this optional runtime dependencies is unsatisfied, raise an
-            # exception.
-            if not is_runtime_optional(dependency_name):
-                #FIXME: Non-ideal. We should explicitly inform the user *WHY*
-                #this dependency is unsatisfies. Good enough for now, though!
-                raise BetseLibException(
-                    f'Dependency "{dependency_name}" unsatisfied.')
-            # Else, this optional runtime dependencies is satisfied.
+    # For the name of each such dependency, test this dependency exactly once
+    # in a single pass short-circuiting on the first unsatisfied dependency
+    # rather than first testing all of these dependencies collectively and
+    # then retesting each individually on failure.
+    for dependency_name in dependency_names:
+        # If this optional runtime dependencies is unsatisfied, raise an
+        # exception.
+        if not is_runtime_optional(dependency_name):
+            #FIXME: Non-ideal. We should explicitly inform the user *WHY*
+            #this dependency is unsatisfies. Good enough for now, though!
+            raise BetseLibException(
+                f'Dependency "{dependency_name}" unsatisfied.')
+        # Else, this optional runtime dependencies is satisfied.
     # Else, *ALL* of these optional runtime dependencies are satisfied.
 
     #FIXME: Resurrect this when refactoring to "importlib.metadata", please.
@@ -310,20 +327,28 @@ def is_runtime_optional(*dependency_names: str) -> bool:
 
     # For the name of each passed optional runtime dependency...
     for dependency_name in dependency_names:
-        # Fully-qualified name of the top-level package or module defining this
-        # dependency, defaulting to the name of this dependency.
-        module_name = DEPENDENCY_TO_MODULE_NAME.get(
-            dependency_name, dependency_name)
-
-        # If it is *NOT* the case that...
-        if not (
-            # This dependency is importable *AND*...
-            is_module(module_name) and
-            # All external commands required by this dependency are installed in
-            # the current "${PATH}"...
-            is_commands(dependency_name)
-        # Then immediately return false.
-        ):
+        # Attempt to reuse the previously cached satisfiability of this
+        # dependency. (See the "_DEPENDENCY_NAME_TO_IS_SATISFIED" docstring.)
+        try:
+            is_satisfied = _DEPENDENCY_NAME_TO_IS_SATISFIED[dependency_name]
+        # If this dependency has yet to be tested...
+        except KeyError:
+            # Fully-qualified name of the top-level package or module defining
+            # this dependency, defaulting to the name of this dependency.
+            module_name = DEPENDENCY_TO_MODULE_NAME.get(
+                dependency_name, dependency_name)
+
+            # True only if...
+            is_satisfied = _DEPENDENCY_NAME_TO_IS_SATISFIED[dependency_name] = (
+                # This dependency is importable *AND*...
+                is_module(module_name) and
+                # All external commands required by this dependency are
+                # installed in the current "${PATH}".
+                is_commands(dependency_name)
+            )
+
+        # If this dependency is unsatisfied, immediately return false.
+        if not is_satisfied:
             return False
         # Else, this dependency is importable *AND* all external commands
         # required by this dependency are installed in the current "${PATH}".
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright 2014-2025 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level :mod:`matplotlib`-specific animation functionality.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To allow matplotlib defaults (e.g., backend, logging) to be replaced
+# with application-specific preferences, the unsafe "matplotlib.pyplot"
+# submodule must *NOT* be imported here at the top-level.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+from betse.util.type.numeric import versions
+from matplotlib.animation import FuncAnimation
+
+# ....................{ CONSTANTS                          }....................
+_BLIT_FIGURE_MATPLOTLIB_VERSION_MAX = '3.12.0'
+'''
+Exclusive maximum version of matplotlib under which the private
+:class:`FuncAnimation` blitting hooks overridden by the
+:class:`FuncAnimationBlitFigure` subclass are known to retain their current
+names and signatures.
+
+These hooks are private and hence subject to change between matplotlib
+releases. Since this application requires no maximum version of matplotlib,
+this subclass is only used under matplotlib versions verified to be
+compatible with this subclass. This maximum should be bumped after verifying
+this subclass against each newer minor release of matplotlib.
+'''
+
+# ....................{ TESTERS                            }....................
+def is_blit_figure_supported() -> bool:
+    '''
+    ``True`` only if the currently installed version of matplotlib supports
+    blitting with the :class:`FuncAnimationBlitFigure` subclass.
+
+    Specifically, this tester returns ``True`` only if this version is strictly
+    less than the :data:`_BLIT_FIGURE_MATPLOTLIB_VERSION_MAX` version *and* the
+    :class:`FuncAnimation` superclass still defines all private hooks
+    overridden by that subclass. If this tester returns ``False``, callers
+    should instead disable blitting and fall back to fully redrawing each
+    frame.
+    '''
+
+    # Avoid circular import dependencies.
+    from betse.lib.matplotlib.matplotlibs import mpl_config
+
+    # Return true only if...
+    return (
+        # This version is known to be compatible with this subclass *AND*...
+        versions.is_less_than(
+            mpl_config.version, _BLIT_FIGURE_MATPLOTLIB_VERSION_MAX) and
+        # The superclass still defines all hooks overridden by this subclass.
+        all(
+            callable(getattr(FuncAnimation, hook_name, None))
+            for hook_name in ('_blit_clear', '_blit_draw', '_on_resize')
+        )
+    )
+
+# ....................{ CLASSES                            }....................
+class FuncAnimationBlitFigure(FuncAnimation):
+    '''
+    Function-based animation blitting the bounding box of the entire figure
+    rather than merely the bounding boxes of axes containing animated artists.
+
+    When blitting is enabled, the :class:`FuncAnimation` superclass caches and
+    restores only the background of each axes containing one or more animated
+    artists. Since the titles, colorbars, and other decorations of axes reside
+    *outside* these bounding boxes, animated artists of that sort (e.g., axes
+    titles interpolating the current simulation time) are never visibly
+    updated. This subclass instead caches the background of the entire figure
+    once after each full redraw of that figure, restores that background at
+    the start of each frame, draws all animated artists returned by the frame
+    callable over that background, and then blits the entire figure.
+
+    Blitting the entire figure is only marginally slower than blitting each
+    axes, as the dominant cost of redrawing is re-rendering static artists
+    (e.g., cell meshes, axes ticks) rather than copying pixel buffers.
+
+    Caveats
+    ----------
+    **This subclass overrides private superclass hooks.** Callers should only
+    enable blitting for instances of this subclass if the
+    :func:`is_blit_figure_supported` tester returns ``True``. Since the
+    superclass only calls these hooks when blitting, instances of this
+    subclass are otherwise safely usable with blitting disabled.
+
+    Attributes
+    ----------
+    _blit_background : object
+        Backend-specific pixel buffer of the figure background (i.e., the
+        figure with all animated artists omitted) if cached *or* ``None``
+        otherwise (e.g., before the first frame is drawn and after each resize).
+    '''
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(self, *args, **kwargs) -> None:
+
+        # Nullify all instance variables for safety *BEFORE* initializing our
+        # superclass, which may already begin blitting.
+        self._blit_background = None
+
+        # Initialize our superclass with all passed parameters.
+        super().__init__(*args, **kwargs)
+
+    # ..................{ SUPERCLASS ~ blit                  }..................
+    def _blit_clear(self, artists) -> None:
+
+        # If the figure background has been cached, restore this background
+        # over the entire figure; else, silently noop.
+        if self._blit_background is not None:
+            self._fig.canvas.restore_region(self._blit_background)
+
+
+    def _blit_draw(self, artists) -> None:
+
+        # Canvas of this figure, localized for negligible efficiency.
+        canvas = self._fig.canvas
+
+        # If the figure background has yet to be cached, do so *BEFORE*
+        # drawing any animated artists over this background. Since animated
+        # artists are omitted by full redraws, this background is guaranteed
+        # to contain only static artists.
+        if self._blit_background is None:
+            self._blit_background = canvas.copy_from_bbox(self._fig.bbox)
+
+        # Draw each animated artist onto the parent axes of that artist.
+        for artist in artists:
+            artist.axes.draw_artist(artist)
+
+        # Blit the entire figure to the screen.
+        canvas.blit(self._fig.bbox)
+
+
+    def _on_resize(self, event) -> None:
+
+        # Invalidate the cached figure background, which no longer reflects
+        # the dimensions of this figure.
+        self._blit_background = None
+
+        # Defer to the superclass implementation.
+        super()._on_resize(event)
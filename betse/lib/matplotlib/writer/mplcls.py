@@ -13,8 +13,21 @@ Matplotlib-specific classes writing animations as frames.
 from betse.exceptions import BetseMatplotlibException
 from betse.util.io.log import logs
 from betse.util.path import dirs, pathnames
+from betse.util.type.types import NumericSimpleTypes
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from matplotlib.animation import writers, MovieWriter
 
+# ....................{ CONSTANTS                          }....................
+_FRAME_FORMATS_ASYNC = frozenset(('png', 'tif', 'tiff'))
+'''
+Frozen set of all image filetypes that the :class:`ImageMovieWriter` class
+asynchronously compresses frames into.
+
+Each such filetype is required to both preserve alpha transparency *and* be
+writable by Pillow from a raw RGBA buffer without conversion.
+'''
+
 # ....................{ CLASSES                            }....................
 @writers.register('noop')
 class NoopMovieWriter(MovieWriter):
@@ -84,9 +97,14 @@ class NoopMovieWriter(MovieWriter):
         '''
         Prevent the superclass :meth:`finish` method from attempting to capture
         output from an external process no longer forked by this subclass.
+
+        For safety, this method instead releases the figure previously passed
+        to the :meth:`setup` method, permitting a single instance of this
+        writer to be reused across animations *without* prolonging the
+        lifetime of the figures of prior animations.
         '''
 
-        pass
+        self.fig = None
 
 
     def _run(self) -> None:
@@ -113,10 +131,79 @@ class ImageMovieWriter(NoopMovieWriter):
 
     Attributes
     -----------
+    _frame_buffer : list
+        List of all frames rendered but *not* yet submitted to
+        :attr:`_frame_executor`, where each item is a 3-tuple
+        ``(frame_filename, frame_rgba, frame_size)`` as documented by the
+        :func:`_write_frames_rgba` function.
+    _frame_buffer_len : int
+        Maximum number of frames retained in :attr:`_frame_buffer` before
+        all such frames are submitted to :attr:`_frame_executor`.
+    _frame_executor : ThreadPoolExecutor
+        Single-threaded executor compressing and writing frames to image files
+        in the background if doing so *or* ``None`` otherwise (i.e., if
+        writing frames synchronously).
+    _frame_future : Future
+        Future of the prior frames previously submitted to
+        :attr:`_frame_executor` if any *or* ``None`` otherwise.
     _frame_number : int
         0-based index of the next frame to be written.
+    _is_async : bool
+        ``True`` only if asynchronously writing frames whose filetype is
+        writable in the background.
     '''
 
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(
+        self,
+        *args,
+        is_async: bool = True,
+        frames_in_memory: int = 0,
+        **kwargs
+    ) -> None:
+        '''
+        Initialize this writer.
+
+        Parameters
+        -----------
+        is_async : optional[bool]
+            ``True`` only if asynchronously writing frames whose filetype is
+            writable in the background (e.g., ``png``). Specifically, if this
+            boolean is ``True``, each frame is rendered by the calling thread
+            into a raw RGBA buffer that is then compressed and written by a
+            background thread while the calling thread plots the next frame.
+            Disabling this boolean is principally useful for debugging.
+            Defaults to ``True``.
+        frames_in_memory : optional[int]
+            Maximum number of rendered frames to be retained in memory before
+            writing all such frames to disk in a single batch. If ``0``, each
+            frame is written to disk immediately after being rendered,
+            minimizing memory consumption. Increasing this number trades
+            memory for reduced disk contention (e.g., on network filesystems
+            or slow storage devices), as disk writes are then concentrated
+            into infrequent bursts. Ignored if ``is_async`` is ``False`` *or*
+            the output filetype is *not* writable in the background. Defaults
+            to ``0``.
+
+        See the superclass :meth:`__init__` method for all remaining
+        parameters.
+        '''
+
+        # Initialize our superclass with all remaining parameters.
+        super().__init__(*args, **kwargs)
+
+        # Classify all passed parameters.
+        self._is_async = is_async
+
+        # Since at least one frame is always rendered before being written,
+        # retaining no frames is equivalent to retaining exactly one frame.
+        self._frame_buffer_len = max(frames_in_memory, 1)
+
+        # Nullify all remaining instance variables for safety.
+        self._frame_buffer = []
+        self._frame_executor = None
+        self._frame_future = None
+
     # ..................{ SUPERCLASS                        }..................
     def setup(self, *args, **kwargs) -> None:
         '''
@@ -183,6 +270,15 @@ class ImageMovieWriter(NoopMovieWriter):
         # Create this directory if needed.
         dirs.make_parent_unless_dir(out_dirname)
 
+        # If asynchronously writing frames of this filetype, create a
+        # single-threaded executor doing so. Since the Pillow-based compression
+        # performed by this thread releases the GIL, this thread compresses
+        # each frame in parallel with the plotting of the next frame by the
+        # calling thread. Since matplotlib is *NOT* thread-safe, frames are
+        # still rendered by the calling thread.
+        if self._is_async and self.frame_format in _FRAME_FORMATS_ASYNC:
+            self._frame_executor = ThreadPoolExecutor(max_workers=1)
+
 
     def grab_frame(self, **kwargs) -> None:
         '''
@@ -218,23 +314,153 @@ class ImageMovieWriter(NoopMovieWriter):
         # Increment the number of the next frame to be written *AFTER* logging.
         self._frame_number += 1
 
-        # Write the current frame.
-        self.fig.savefig(
-            # The public matplotlib API expects the first argument to this
-            # method to be passed positionally rather than as a keyword
-            # argument. We know this both because:
-            #
-            # * This argument is *ALWAYS* passed positionally by the matplotlib
-            #   codebase itself.
-            # * The name of this argument has changed between matplotlib
-            #   versions (notably, from "filename" to "fname"), preventing this
-            #   argument from being reliably passed as a keyword argument. To
-            #   preserve forward compatibility with multiple matplotlib
-            #   versions, this argument *MUST* be passed positionally.
-            frame_filename,
-
-            # All remaining arguments are expected to be keyword arguments.
-            format=self.frame_format,
-            dpi=self.dpi,
-            **kwargs
-        )
+        # If synchronously writing frames, write the current frame.
+        if self._frame_executor is None:
+            self.fig.savefig(
+                # The public matplotlib API expects the first argument to this
+                # method to be passed positionally rather than as a keyword
+                # argument. We know this both because:
+                #
+                # * This argument is *ALWAYS* passed positionally by the
+                #   matplotlib codebase itself.
+                # * The name of this argument has changed between matplotlib
+                #   versions (notably, from "filename" to "fname"), preventing
+                #   this argument from being reliably passed as a keyword
+                #   argument. To preserve forward compatibility with multiple
+                #   matplotlib versions, this argument *MUST* be passed
+                #   positionally.
+                frame_filename,
+
+                # All remaining arguments are expected to be keyword arguments.
+                format=self.frame_format,
+                dpi=self.dpi,
+                **kwargs
+            )
+
+            # Halt.
+            return
+        # Else, asynchronously write frames.
+
+        # Render the current frame into an in-memory raw RGBA buffer. Since
+        # this format is uncompressed, doing so is substantially faster than
+        # rendering this frame directly into a compressed image file.
+        frame_buffer = BytesIO()
+        self.fig.savefig(frame_buffer, format='rgba', dpi=self.dpi, **kwargs)
+
+        # Zero-copy view of this buffer. Since the background thread resides in
+        # the same process as the calling thread, this view is directly shared
+        # with that thread. Unlike the BytesIO.getvalue() method, this view
+        # avoids copying the entire frame for each frame. Since this buffer is
+        # never written to again, exporting this view is safe.
+        frame_rgba = frame_buffer.getbuffer()
+
+        # Width and height in pixels of this frame. The height is derived from
+        # the buffer size rather than the figure size to avoid rounding errors.
+        frame_width = int(self.fig.get_figwidth() * self.dpi)
+        frame_height = len(frame_rgba) // (4 * frame_width)
+
+        # Retain this frame in memory.
+        self._frame_buffer.append(
+            (frame_filename, frame_rgba, (frame_width, frame_height)))
+
+        # If the maximum number of frames are now retained in memory, write all
+        # such frames to disk.
+        if len(self._frame_buffer) >= self._frame_buffer_len:
+            self._flush_frames()
+
+
+    def finish(self) -> None:
+        '''
+        Finalize writing animation frames.
+
+        If asynchronously writing frames, this method blocks until the last
+        frame has been written and then shuts down the background thread doing
+        so.
+        '''
+
+        # If *NOT* asynchronously writing frames, silently reduce to a noop.
+        if self._frame_executor is None:
+            return
+
+        # Write all frames still retained in memory if any to disk *AND* wait
+        # for these frames to be written.
+        self._flush_frames()
+        self._wait_frame()
+
+        # Shutdown the background thread writing frames.
+        self._frame_executor.shutdown()
+        self._frame_executor = None
+
+
+    def _flush_frames(self) -> None:
+        '''
+        Submit all frames retained in memory to the background thread, which
+        then compresses and writes these frames to disk in a single batch.
+        '''
+
+        # If no frames are retained in memory, silently reduce to a noop.
+        if not self._frame_buffer:
+            return
+
+        # Wait for all prior frames to be written *BEFORE* submitting these
+        # frames, bounding memory consumption to at most two batches of frames.
+        self._wait_frame()
+
+        # Compress and write these frames in the background.
+        self._frame_future = self._frame_executor.submit(
+            _write_frames_rgba, self._frame_buffer, self.dpi)
+
+        # Release these frames from the perspective of the calling thread.
+        self._frame_buffer = []
+
+
+    def _wait_frame(self) -> None:
+        '''
+        Block until the prior frames submitted to the background thread have
+        been written if any *or* silently reduce to a noop otherwise.
+
+        Any exception raised by that thread while writing these frames is
+        reraised in the calling thread.
+        '''
+
+        # If prior frames were submitted, wait for these frames to be written,
+        # reraising any exception raised while doing so.
+        if self._frame_future is not None:
+            self._frame_future.result()
+            self._frame_future = None
+
+# ....................{ PRIVATE ~ writers                  }....................
+def _write_frames_rgba(frames: list, dpi: NumericSimpleTypes) -> None:
+    '''
+    Compress and write each passed raw RGBA buffer to the image file with the
+    corresponding filename.
+
+    This function is intended to be called only by a background thread of the
+    :class:`ImageMovieWriter` class.
+
+    Parameters
+    -----------
+    frames : list
+        List of all frames to be written, where each item is a 3-tuple
+        ``(frame_filename, frame_rgba, frame_size)`` such that:
+
+        * ``frame_filename`` is the absolute or relative filename of the image
+          file to be written, whose filetype is required to be in
+          :data:`_FRAME_FORMATS_ASYNC`.
+        * ``frame_rgba`` is the raw RGBA buffer of the frame to be written,
+          typically as a zero-copy :class:`memoryview` of the in-memory buffer
+          this frame was rendered into.
+        * ``frame_size`` is the 2-tuple ``(width, height)`` of the dimensions
+          in pixels of this frame.
+    dpi : NumericSimpleTypes
+        Dots per inch (DPI) to be embedded in these image files.
+    '''
+
+    # Defer heavyweight imports. Pillow is a mandatory matplotlib dependency.
+    from PIL import Image
+
+    # Compress and write each frame.
+    for frame_filename, frame_rgba, frame_size in frames:
+        Image.frombuffer(
+            'RGBA', frame_size, frame_rgba, 'raw', 'RGBA', 0, 1).save(
+            frame_filename, dpi=(dpi, dpi))
@@ -12,7 +12,8 @@ dependency simplifying inspection of application dependencies.
 #required, due to importing deprecated functionality.
 
 # ....................{ IMPORTS                           }....................
-from betse.exceptions import BetseLibException
+from betse.exceptions import (
+    BetseLibException, BetseLibRequirementVersionException)
 from betse.util.io.log import logs
 from betse.util.type.types import (
     type_check,
@@ -23,14 +24,29 @@ from betse.util.type.types import (
     ModuleOrSequenceTypes,
     SequenceTypes,
 )
-from collections import OrderedDict
-from setuptools import pkg_resources
-from setuptools.pkg_resources import (
-    DistributionNotFound,
-    Requirement,
-    UnknownExtra,
-    VersionConflict,
-)
+import importlib
+from importlib import metadata as importlib_metadata
+
+# Import *ONLY* the top-level "pkg_resources" package, whose attributes (e.g.,
+# "pkg_resources.Requirement") are then accessed through that package rather
+# than imported by a separate "from pkg_resources import" statement. Since
+# importing this package enumerates all "sys.path" entries and is thus
+# notoriously slow, this package is imported exactly once here. Note that
+# modern setuptools releases no longer expose this package as the
+# "setuptools.pkg_resources" attribute.
+import pkg_resources
+
+# ....................{ GLOBALS                           }....................
+_REQUIREMENT_STR_TO_REQUIREMENT = {}
+'''
+Dictionary mapping from each :mod:`setuptools`-formatted requirement string
+(e.g., ``Numpy >= 1.8.0``) previously passed to the
+:func:`iter_requirements_str` function to the :class:`pkg_resources.Requirement`
+object parsed from that string.
+
+Since parsing requirement strings is non-trivial and since requirement objects
+are effectively immutable, each such string is parsed at most once.
+'''
 
 # ....................{ EXCEPTIONS                        }....................
 @type_check
@@ -124,7 +140,7 @@ def die_unless_requirements_str(*requirements_str: str) -> None:
 
 
 @type_check
-def die_unless_requirement(requirement: Requirement) -> None:
+def die_unless_requirement(requirement: pkg_resources.Requirement) -> None:
     '''
     Raise an exception unless the passed :mod:`setuptools`-specific requirement
     is satisfiable, implying the corresponding third-party module or package to
@@ -147,9 +163,6 @@ def die_unless_requirement(requirement: Requirement) -> None:
     from betse.util.py.module.pymodname import (
         DEPENDENCY_TO_MODULE_NAME)
 
-    # Human-readable exception to be raised below if any.
-    betse_exception = None
-
     # Human-readable name of this module or package.
     requirement_name = requirement.project_name
 
@@ -166,27 +179,21 @@ def die_unless_requirement(requirement: Requirement) -> None:
 
         # If this exception signifies the common case of a missing dependency,
         # avoid exposing this exception to end users. Doing so would convey no
-        # meaningful metadata.
-        if root_exception_message == (
-            "No module named '{}'".format(package_name)):
-            betse_exception = BetseLibException(
-                'Dependency "{}" not found.'.format(requirement_name))
+        # meaningful metadata. Suppressing exception chaining prevents Python
+        # from implicitly prepending this human-readable exception with the
+        # non-human-readable exception raised above.
+        if root_exception_message == f"No module named '{package_name}'":
+            raise BetseLibException(
+                f'Dependency "{requirement_name}" not found.') from None
         # Else, this exception signifies an unexpected edge-case. For
         # debuggability, expose this exception to end users.
         else:
             raise BetseLibException(
-                'Dependency "{}" unimportable.'.format(requirement_name))
+                f'Dependency "{requirement_name}" unimportable.')
     # Else if any other exception is raised, expose this exception as is.
     except Exception:
         raise BetseLibException(
-            'Dependency "{}" unimportable.'.format(requirement_name))
-
-    # If raising a human-readable exception, do so. Raising this exception in
-    # the handler above would be preferable but also incite Python 3 to
-    # implicitly prepend this exception with the non-human-readable exception
-    # raised above. This convoluted logic circumvents that. (...Ugh!)
-    if betse_exception:
-        raise betse_exception
+            f'Dependency "{requirement_name}" unimportable.')
 
     # If this requirement is unversioned, all possible versions of this package
     # satisfy this requirement, in which case this requirement is satisfied.
@@ -205,43 +212,32 @@ def die_unless_requirement(requirement: Requirement) -> None:
         # Else, this version fails to satisfy this requirement. In this case,
         # raise an exception.
         else:
-            raise BetseLibException(
-                'Dependency "{}" unsatisfied by installed version {}.'.format(
-                    requirement, package_version))
+            raise BetseLibRequirementVersionException(
+                requirement=str(requirement), version=package_version)
     # Else, this package declares *NO* version. In this case, fallback to
     # unreliable setuptools-specific logic.
 
     # Attempt to...
     try:
-        # Setuptools-specific object describing the current version of the
-        # package satisfying this requirement if any *OR* "None" if this
-        # requirement cannot be guaranteed to be unsatisfied.
+        # Distribution metadata describing the current version of the package
+        # satisfying this requirement if any *OR* "None" if this requirement
+        # cannot be guaranteed to be unsatisfied. If only an insufficient
+        # version of this package is installed, this getter raises a
+        # human-readable exception.
         distribution = get_requirement_distribution_or_none(requirement)
+    # If this package provides *NO* extra required by this requirement, raise
+    # a human-readable exception. Suppressing exception chaining prevents
+    # Python from prepending the non-human-readable exception raised above.
+    except pkg_resources.UnknownExtra as exception:
+        raise BetseLibException(
+            'Dependency "{}" unsatisfied, as {}.'.format(
+                requirement, exception)) from None
 
-        # If this requirement is satisfied, we're done here.
-        if distribution is not None:
-            return
-        # Else, this requirement is unsatisfied. In this case, raise a generic
-        # non-descript exception.
-        else:
-            raise BetseLibException(
-                'Dependency "{}" unsatisfied.'.format(requirement))
-    # If setuptools only found requirements of insufficient version, a
-    # non-human-readable exception resembling the following is raised:
-    #
-    #    pkg_resources.VersionConflict: (PyYAML 3.09 (/usr/lib64/python3.3/site-packages), Requirement.parse('PyYAML>=3.10'))
-    #
-    # Detect this and raise a human-readable exception instead.
-    except VersionConflict as version_conflict:
-        betse_exception = BetseLibException(
-            'Dependency "{}" unsatisfied by '
-            'installed dependency "{}".'.format(
-                version_conflict.req, version_conflict.dist))
-    #FIXME: Handle the "UnknownExtra" exception as well.
-
-    # If raising a human-readable exception, do so.
-    if betse_exception:
-        raise betse_exception
+    # If this requirement is unsatisfied, raise a generic non-descript
+    # exception.
+    if distribution is None:
+        raise BetseLibException(
+            'Dependency "{}" unsatisfied.'.format(requirement))
     # Else, this requirement is satisfied.
 
 # ....................{ TESTERS                           }....................
@@ -274,7 +270,7 @@ def is_requirement_str(*requirements_str: str) -> bool:
 
 
 @type_check
-def is_requirement(requirement: Requirement) -> bool:
+def is_requirement(requirement: pkg_resources.Requirement) -> bool:
     '''
     ``True`` only if the passed :mod:`setuptools`-specific requirement is
     satisfiable, implying the corresponding third-party module or package to be
@@ -295,7 +291,12 @@ def is_requirement(requirement: Requirement) -> bool:
     # Avoid circular import dependencies.
     from betse.util.py.module import pymodule
 
-    # Attempt to manually import this requirement's package.
+    # Attempt to manually import this requirement's package. Since a package
+    # found on the import path may still fail to be imported (e.g., due to a
+    # broken installation), this package is imported rather than merely
+    # searched for. Since most requirements tested here are satisfied and
+    # importing a package already searches the import path for that package,
+    # searching that path beforehand would only slow the common case.
     try:
         package = import_requirement(requirement)
     # If this package is unimportable, reduce this exception to a boolean.
@@ -321,22 +322,23 @@ def is_requirement(requirement: Requirement) -> bool:
 
     # Attempt to...
     try:
-        # Setuptools-specific object describing the current version of the
-        # package satisfying this requirement if any *OR* "None" if this
-        # requirement cannot be guaranteed to be unsatisfied.
+        # Distribution metadata describing the current version of the package
+        # satisfying this requirement if any *OR* "None" if this requirement
+        # cannot be guaranteed to be unsatisfied.
         distribution = get_requirement_distribution_or_none(requirement)
 
         # Return true only if this requirement is satisfied.
         return distribution is not None
-    # If setuptools found only requirements of insufficient version, reduce
+    # If only an insufficient version of this package is installed, reduce
     # this exception to a boolean.
-    except (UnknownExtra, VersionConflict):
+    except (
+        pkg_resources.UnknownExtra, BetseLibRequirementVersionException):
         return False
     # If any other exception is raised, expose this exception as is.
 
 # ....................{ TESTERS ~ private                 }....................
 @type_check
-def _is_requirement_versioned(requirement: Requirement) -> bool:
+def _is_requirement_versioned(requirement: pkg_resources.Requirement) -> bool:
     '''
     ``True`` only if the passed :mod:`setuptools`-specific requirement is
     **versioned** (i.e., constrained to require only a subset of all available
@@ -368,15 +370,17 @@ def _is_requirement_versioned(requirement: Requirement) -> bool:
 
 # ....................{ GETTERS ~ requirement              }....................
 @type_check
-def get_requirement_distribution_or_none(requirement: Requirement) -> object:  # DistributionOrNoneTypes:
+def get_requirement_distribution_or_none(
+    requirement: pkg_resources.Requirement) -> object:  # DistributionOrNoneTypes:
     '''
-    :class:`Distribution` instance describing the currently installed version
-    of the top-level third-party module or package satisfying the passed
-    :mod:`setuptools`-specific requirement if any *or* raise an exception if
-    this requirement is guaranteed to be unsatisfied (e.g., due to a version
-    mismatch) *or* ``None`` if this requirement cannot be guaranteed to be
-    unsatisfied (e.g., due to this requirement being installed either without
-    :mod:`setuptools` or with the :mod:`setuptools` subcommand ``develop``).
+    :class:`importlib.metadata.Distribution` instance describing the currently
+    installed version of the top-level third-party module or package
+    satisfying the passed :mod:`setuptools`-specific requirement if any *or*
+    raise an exception if this requirement is guaranteed to be unsatisfied
+    (e.g., due to a version mismatch) *or* ``None`` if this requirement cannot
+    be guaranteed to be unsatisfied (e.g., due to this requirement being
+    installed either without :mod:`setuptools` or with the :mod:`setuptools`
+    subcommand ``develop``).
 
     Caveats
     ----------
@@ -394,7 +398,8 @@ def get_requirement_distribution_or_none(requirement: Requirement) -> object:  #
     low-level :func:`pkg_resources.get_distribution` function, which raises
     spurious exceptions in common non-erroneous edge cases (e.g., packages
     installed via the :mod:`setuptools` subcommand ``develop``) and is thus
-    unsafe for general-purpose use.
+    unsafe for general-purpose use. For efficiency, this getter queries the
+    standard :mod:`importlib.metadata` API rather than that function.
 
     Parameters
     ----------
@@ -404,7 +409,8 @@ def get_requirement_distribution_or_none(requirement: Requirement) -> object:  #
     Returns
     -------
     DistributionOrNoneTypes
-        Object describing the currently installed version of the package or
+        :class:`importlib.metadata.Distribution` instance describing the
+        currently installed version of the package or
         module satisfying this requirement if any *or* ``None`` otherwise.
         Specifically, ``None`` is returned in all of the following conditions
         -- only one of which genuinely corresponds to an error:
@@ -415,68 +421,92 @@ def get_requirement_distribution_or_none(requirement: Requirement) -> object:  #
           exists. (**Non-error.**)
         * This requirement was installed with the :mod:`setuptools` subcommand
           ``develop``, in which case a :class:`Distribution` technically exists
-          but in a sufficiently inconsistent state that the low-level
-          :func:`pkg_resources.get_distribution` function raises an exception
-          on attempting to retrieve that object. (**Non-error.**)
+          but in a sufficiently inconsistent state that this distribution
+          records no version. (**Non-error.**)
 
         Since distinguishing the erroneous from non-erroneous cases exceeds the
         mandate of this getter, the caller is expected to do so.
 
     Raises
     ----------
-    VersionConflict
+    BetseLibRequirementVersionException
         If the currently installed version of this module or package fails to
         satisfy this requirement's version constraints.
+    pkg_resources.UnknownExtra
+        If the currently installed version of this module or package fails to
+        provide one or more extras required by this requirement.
     '''
 
-    # If setuptools finds this requirement, return its distribution as is.
+    # Attempt to find the distribution metadata for this requirement with the
+    # standard "importlib.metadata" API rather than the deprecated
+    # pkg_resources.get_distribution() function. The latter additionally
+    # resolves all transitive dependencies of this distribution against the
+    # global working set on each call and is thus substantially slower.
     try:
         # logs.log_debug(
         #     'Retrieving requirement "%r" distribution...', requirement)
-        return pkg_resources.get_distribution(requirement)
-    # If setuptools fails to find this requirement, this does *NOT* necessarily
-    # imply this requirement to be unimportable as a package. Rather, this only
-    # implies this requirement was *NOT* installed as a setuptools-managed egg.
-    # This requirement is still installable and hence importable (e.g., by
-    # manually copying this requirement's package into the "site-packages"
-    # subdirectory of the top-level directory for this Python interpreter).
-    # However, does this edge-case actually occur in reality? *YES.*
-    # PyInstaller-frozen applications embed requirements without corresponding
-    # setuptools-managed eggs. Hence, this edge-case *MUST* be handled.
-    except DistributionNotFound:
+        distribution = importlib_metadata.distribution(
+            requirement.project_name)
+    # If this requirement has *NO* distribution metadata, this does *NOT*
+    # necessarily imply this requirement to be unimportable as a package.
+    # Rather, this only implies this requirement was *NOT* installed with such
+    # metadata. This requirement is still installable and hence importable
+    # (e.g., by manually copying this requirement's package into the
+    # "site-packages" subdirectory of the top-level directory for this Python
+    # interpreter). However, does this edge-case actually occur in reality?
+    # *YES.* PyInstaller-frozen applications embed requirements without
+    # corresponding metadata. Hence, this edge-case *MUST* be handled.
+    except importlib_metadata.PackageNotFoundError:
         # logs.log_debug(
         #     'Requirement "%r" distribution not found.', requirement)
         return None
-    # If setuptools fails to find the distribution-packaged version of this
-    # requirement (e.g., due to having been editably installed with "sudo
-    # python3 setup.py develop"), this version may still be manually parseable
-    # from this requirement's package. Since setuptools fails to raise an
-    # exception whose type is unique to this error condition, the contents of
-    # this exception are parsed to distinguish this expected error condition
-    # from other unexpected error conditions. In the former case, a
-    # non-human-readable exception resembling the following is raised:
-    #
-    #     ValueError: ("Missing 'Version:' header and/or PKG-INFO file",
-    #     networkx [unknown version] (/home/leycec/py/networkx))
-    except ValueError as version_missing:
-        # If this exception was...
-        if (
-            # ...instantiated with two arguments...
-            len(version_missing.args) == 2 and
-            # ...whose second argument is suffixed by a string indicating the
-            # version of this distribution to have been ignored rather than
-            # recorded during installation...
-            str(version_missing.args[1]).endswith(' [unknown version]')
-        # ...this exception indicates an expected ignorable error condition.
-        # Silently ignore this edge case.
-        ):
-            # logs.log_debug(
-            #     'Requirement "%r" distribution version not found.', requirement)
-            return None
-
-        # Else, this exception indicates an unexpected and hence
-        # non-ignorable error condition. Reraise this exception!
-        raise
+
+    # Version recorded by this distribution if any *OR* "None" otherwise.
+    distribution_version = distribution.version
+
+    # If this distribution recorded *NO* version (e.g., due to having been
+    # editably installed with "sudo python3 setup.py develop"), this version
+    # may still be manually parseable from this requirement's package. Silently
+    # ignore this edge case.
+    if distribution_version is None:
+        # logs.log_debug(
+        #     'Requirement "%r" distribution version not found.', requirement)
+        return None
+
+    # If this version fails to satisfy this requirement, raise an exception.
+    if distribution_version not in requirement:
+        raise BetseLibRequirementVersionException(
+            requirement=str(requirement), version=distribution_version)
+    # Else, this version satisfies this requirement.
+
+    # If this requirement requires one or more extras (e.g., the "socks" in
+    # "requests[socks]"), raise an exception unless this distribution provides
+    # all of these extras. Unlike the deprecated
+    # pkg_resources.get_distribution() function, the "importlib.metadata" API
+    # does *NOT* validate these extras. Since extra names parsed by
+    # "pkg_resources.Requirement" are normalized by the
+    # pkg_resources.safe_extra() function, the names of the extras provided by
+    # this distribution are normalized by the same function before comparison.
+    if requirement.extras:
+        # Set of the normalized names of all extras this distribution provides.
+        distribution_extras = {
+            pkg_resources.safe_extra(extra)
+            for extra in distribution.metadata.get_all('Provides-Extra', ())
+        }
+
+        # For each extra required by this requirement...
+        for extra in requirement.extras:
+            # If this distribution fails to provide this extra, raise an
+            # exception of the same type as that raised by the
+            # pkg_resources.get_distribution() function.
+            if extra not in distribution_extras:
+                raise pkg_resources.UnknownExtra(
+                    '{} has no such extra feature {!r}'.format(
+                        requirement.project_name, extra))
+
+    # Else, this distribution satisfies this requirement. Return this
+    # distribution.
+    return distribution
 
 
 #FIXME: Rename to convert_requirements_dict_key_to_str() for parity with the
@@ -531,7 +561,7 @@ def get_requirement_str_from_dict_key(
 
 
 @type_check
-def get_requirement_synopsis(requirement: Requirement) -> str:
+def get_requirement_synopsis(requirement: pkg_resources.Requirement) -> str:
     '''
     Human-readable string describing the currently installed third-party
     module or package corresponding to (but *not* necessarily satisfying) the
@@ -578,12 +608,16 @@ def get_requirement_synopsis(requirement: Requirement) -> str:
         # module satisfying this requirement if any or "None" if this
         # requirement cannot be guaranteed to be unsatisfied.
         distribution = get_requirement_distribution_or_none(requirement)
-    # If setuptools found only requirements of insufficient version, return
+    # If only an insufficient version of this package is installed, return
     # this version regardless (with a suffix noting this to be the case).
-    except VersionConflict as version_conflict:
+    except BetseLibRequirementVersionException as exception:
         return '{} [fails to satisfy {}]'.format(
-            version_conflict.dist.version, version_conflict.req)
-    #FIXME: Handle the "UnknownExtra" exception as well.
+            exception.version, exception.requirement)
+    # If this package provides *NO* extra required by this requirement, return
+    # a string noting this to be the case.
+    except pkg_resources.UnknownExtra:
+        return '{} [fails to provide the extras of {}]'.format(
+            importlib_metadata.version(requirement.project_name), requirement)
 
     # Attempt to manually import this module or package.
     try:
@@ -760,9 +794,9 @@ def get_requirements_str_from_dict_keys(
 # ....................{ GETTERS ~ requirements : synopsis }....................
 @type_check
 def get_requirements_dict_synopsis(
-    requirements_dict: MappingType) -> OrderedDict:
+    requirements_dict: MappingType) -> dict:
     '''
-    Ordered dictionary synopsizing the currently installed third-party packages
+    Dictionary synopsizing the currently installed third-party packages
     corresponding to (but *not* necessarily satisfying) the
     :mod:`setuptools`-formatted requirements strings produced by concatenating
     each key and value of the passed dictionary (e.g., converting key ``Numpy``
@@ -775,8 +809,8 @@ def get_requirements_dict_synopsis(
 
     Returns
     ----------
-    OrderedDict
-        Ordered dictionary lexicographically presorted on keys in ascending
+    dict
+        Dictionary lexicographically presorted on keys in ascending
         order such that each:
 
         * Key is a string of the form ``{{requirement_name}} version``.
@@ -800,9 +834,9 @@ def get_requirements_dict_synopsis(
 
 
 @type_check
-def get_requirements_str_synopsis(*requirements_str: str) -> OrderedDict:
+def get_requirements_str_synopsis(*requirements_str: str) -> dict:
     '''
-    Ordered dictionary synopsizing the currently installed third-party packages
+    Dictionary synopsizing the currently installed third-party packages
     corresponding to (but *not* necessarily satisfying) the passed
     :mod:`setuptools`-formatted requirements strings (e.g., ``Numpy >= 1.8``).
 
@@ -813,23 +847,24 @@ def get_requirements_str_synopsis(*requirements_str: str) -> OrderedDict:
 
     Returns
     ----------
-    OrderedDict
-        Ordered dictionary lexicographically presorted on keys in ascending
+    dict
+        Dictionary lexicographically presorted on keys in ascending
         order (as detailed by the :func:`get_requirements_dict_synopsis`
         function).
     '''
 
-    # Avoid circular import dependencies.
-    from betse.util.type.iterable import itersort
-
-    # Lexicographically sorted tuple of these strings.
-    requirement_strs_sorted = itersort.sort_ascending(requirements_str)
+    # Lexicographically sorted list of these strings. Since these strings are
+    # guaranteed to be strings, the sorted() builtin suffices; the
+    # general-purpose itersort.sort_ascending() function would needlessly
+    # coerce the resulting list back into a tuple.
+    requirement_strs_sorted = sorted(requirements_str)
 
     # List of all requirement objects parsed from these requirement strings.
     requirements = iter_requirements_str(*requirement_strs_sorted)
 
-    # Ordered dictionary synopsizing these requirements.
-    return OrderedDict(
+    # Dictionary synopsizing these requirements. Since dictionaries preserve
+    # insertion order, this dictionary preserves the sort order above.
+    return dict(
         (requirement.project_name, get_requirement_synopsis(requirement))
         for requirement in requirements)
 
@@ -931,7 +966,7 @@ def import_requirements_str(*requirements_str: str) -> ModuleOrSequenceTypes:
 
 
 @type_check
-def import_requirement(requirement: Requirement) -> ModuleType:
+def import_requirement(requirement: pkg_resources.Requirement) -> ModuleType:
     '''
     Import and return the top-level module object satisfying the passed
     :mod:`setuptools`-specific requirement.
@@ -953,7 +988,6 @@ def import_requirement(requirement: Requirement) -> ModuleType:
     '''
 
     # Avoid circular import dependencies.
-    from betse.util.py.module import pymodname
     from betse.util.py.module.pymodname import (
         DEPENDENCY_TO_MODULE_NAME)
 
@@ -964,8 +998,12 @@ def import_requirement(requirement: Requirement) -> ModuleType:
     # Log this importation, which can often have unexpected side effects.
     logs.log_debug('Importing third-party package "%s"...', package_name)
 
-    # Import and return this package.
-    return pymodname.import_module(package_name)
+    # Import and return this package. The higher-level
+    # pymodname.import_module() function is intentionally avoided, as that
+    # function searches the import path for this package before importing
+    # this package -- which already does so, raising the standard
+    # "ModuleNotFoundError" exception if this package is not found.
+    return importlib.import_module(package_name)
 
 # ....................{ ITERATORS                         }....................
 @type_check
@@ -984,7 +1022,18 @@ def iter_requirements_str(*requirements_str: str) -> GeneratorType:
     ----------
     Requirement
         Requirement parsed from each passed requirement string (in the passed
-        order).
+        order). Each such requirement is parsed at most once and cached for
+        reuse by subsequent calls passed the same string.
     '''
 
-    yield from pkg_resources.parse_requirements(requirements_str)
+    # For each passed requirement string...
+    for requirement_str in requirements_str:
+        # Attempt to yield the requirement previously parsed from this string.
+        try:
+            yield _REQUIREMENT_STR_TO_REQUIREMENT[requirement_str]
+        # If this string has yet to be parsed, parse, cache, and yield this
+        # requirement.
+        except KeyError:
+            requirement = _REQUIREMENT_STR_TO_REQUIREMENT[requirement_str] = (
+                pkg_resources.Requirement.parse(requirement_str))
+            yield requirement
@@ -27,12 +27,12 @@ https://setuptools.readthedocs.io/en/latest/pkg_resources.html#resourcemanager-a
 
 # ....................{ IMPORTS                           }....................
 from betse.util.type.types import type_check
-from setuptools import pkg_resources
-from setuptools.pkg_resources import Requirement
+import pkg_resources
 
 # ....................{ TESTERS                           }....................
 @type_check
-def is_dir(module_name: (str, Requirement), dirname: str) -> bool:
+def is_dir(
+    module_name: (str, pkg_resources.Requirement), dirname: str) -> bool:
     '''
     ``True`` only if the resource whose pathname is the concatenation of the
     following strings is an existing directory (*in order*):
@@ -68,7 +68,8 @@ def is_dir(module_name: (str, Requirement), dirname: str) -> bool:
 
 # ....................{ GETTERS                           }....................
 @type_check
-def get_pathname(module_name: (str, Requirement), pathname: str) -> str:
+def get_pathname(
+    module_name: (str, pkg_resources.Requirement), pathname: str) -> str:
     '''
     Absolute path of the resource whose path the pathname of the module or
     requirement with passed name joined with the passed relative pathname is an
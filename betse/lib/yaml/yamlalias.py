@@ -198,3 +198,23 @@ def yaml_alias_int_positive(keys: str) -> YamlAliasABC:
         predicate_expr='value > 0',
         predicate_label='positive',
     )
+
+
+def yaml_alias_int_nonnegative(keys: str) -> YamlAliasABC:
+    '''
+    Simulation configuration expression alias data descriptor, dynamically
+    aliasing a target integer variable with values constrained to be
+    **non-negative** (i.e., greater than or equal to 0).
+
+    See Also
+    ----------
+    :func:`yaml_alias`
+        Further details.
+    '''
+
+    return yaml_alias(
+        keys=keys,
+        cls=int,
+        predicate_expr='value >= 0',
+        predicate_label='non-negative',
+    )
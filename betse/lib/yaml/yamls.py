@@ -12,6 +12,7 @@ file format encapsulating most input and output data for this application.
 #"ruamel.yaml" -- especially the non-trivial Numpy-to-YAML-type conversions.
 
 # ....................{ IMPORTS                           }....................
+import os
 from betse.util.io import iofiles
 from betse.util.io.error.errwarning import ignoring_warnings
 from betse.util.io.log import logs
@@ -20,15 +21,48 @@ from betse.util.type.contexts import noop_context
 from betse.util.type.obj import objects
 from betse.util.type.types import (
     type_check, MappingOrSequenceTypes, StrOrNoneTypes)
+from collections import OrderedDict
+from copy import deepcopy
 from ruamel import yaml as ruamel_yaml
 from ruamel.yaml.error import MantissaNoDotYAML1_1Warning
 
+# ....................{ CONSTANTS                         }....................
+_LOAD_CACHE_LEN_MAX = 8
+'''
+Maximum number of containers cached by the :func:`load` function, beyond
+which the least recently loaded container is evicted from this cache.
+'''
+
 # ....................{ GLOBALS                           }....................
 YAML_FILETYPES = {'yaml', 'yml',}
 '''
 Set of all YAML-compliant filetypes.
 '''
 
+
+_load_cache = OrderedDict()
+'''
+Ordered dictionary caching the most recently loaded YAML files *not* loaded
+for roundtripping, mapping from the **fingerprint** (i.e., 4-tuple
+``(filename, mtime_ns, size, yaml_version)`` of the canonical filename,
+modification time in nanoseconds, and size in bytes of each such file *and*
+the YAML specification version this file was loaded under) to a private deep
+copy of the container loaded from that file, ordered from least to most
+recently loaded.
+
+Read-only YAML files (e.g., gene expression data) are frequently reloaded from
+the same unmodified files (e.g., by scripts repeatedly running simulation
+phases). Since deeply copying a plain container is several times faster than
+reparsing that file, the :func:`load` function instead returns a deep copy of
+the container cached for any such unmodified file. Since only deep copies are
+ever returned, callers remain free to modify these containers.
+
+Roundtripped containers are intentionally *not* cached. Deeply copying
+:mod:`ruamel.yaml`-specific containers silently discards formatting metadata
+(e.g., the indentation of block sequences), in which case saving such a copy
+back to disk produces syntactically invalid YAML.
+'''
+
 # ....................{ LOADERS                           }....................
 @type_check
 def load(
@@ -37,6 +71,7 @@ def load(
 
     # Optional parameters.
     yaml_version: StrOrNoneTypes = None,
+    is_roundtrip: bool = True,
 ) -> MappingOrSequenceTypes:
     '''
     Load (i.e., open and read, deserialize) and return the contents of the
@@ -52,11 +87,30 @@ def load(
         this file to be compliant with, overriding any version directive
         prefacing this file (e.g., ``%YAML 1.2``). Defaults to ``None``, in
         which case the version directive prefacing this file is deferred to.
+    is_roundtrip : optional[bool]
+        Either:
+
+        * ``True`` if the returned container is to be **roundtrippable**
+          (i.e., preserve all comments and whitespace of this file on being
+          passed to the :func:`save` function), in which case this file is
+          loaded with the pure-Python roundtripping parser.
+        * ``False`` if this file is only to be read and never saved back to
+          disk, in which case this file is loaded as plain dictionaries and
+          lists with the safe parser. Since this parser preserves neither
+          comments nor whitespace *and* is implemented in C when the optional
+          ``ruamel.yaml.clib`` extension is installed, this parser is typically
+          substantially faster.
+
+        Defaults to ``True``.
 
     Returns
     ----------
     MappingOrSequenceTypes
-        Dictionary or list corresponding to the contents of this file.
+        Dictionary or list corresponding to the contents of this file. If
+        ``is_roundtrip`` is ``False`` and this file is unmodified since a
+        recent prior call to this function also passed ``False``, this is a
+        deep copy of the container cached by that call rather than the result
+        of reparsing this file. (See the :data:`_load_cache` docstring.)
     '''
 
     # If this filename has no YAML-compliant filetype, log a warning.
@@ -64,8 +118,38 @@ def load(
 
     # With this YAML file opened for character-oriented reading...
     with iofiles.reading_chars(filename) as yaml_file:
-        # Safe roundtripping YAML parser.
-        ruamel_parser = _make_ruamel_parser()
+        # If this file is *NOT* to be roundtripped...
+        if not is_roundtrip:
+            # Metadata describing this file, queried from this file's
+            # descriptor to guarantee this metadata to describe the file
+            # actually opened above.
+            yaml_file_stat = os.fstat(yaml_file.fileno())
+
+            # Fingerprint of this file. (See the "_load_cache" docstring.)
+            cache_key = (
+                pathnames.canonicalize(filename),
+                yaml_file_stat.st_mtime_ns,
+                yaml_file_stat.st_size,
+                yaml_version,
+            )
+
+            # Container previously loaded from this unmodified file if any
+            # *OR* "None" otherwise.
+            container = _load_cache.get(cache_key)
+
+            # If this container was previously loaded, mark this container as
+            # the most recently loaded and return a deep copy of this
+            # container.
+            if container is not None:
+                _load_cache.move_to_end(cache_key)
+                return deepcopy(container)
+        # Else, this file is either to be roundtripped *OR* has yet to be
+        # loaded (or has since been modified).
+
+        # Safe YAML parser, roundtripping only if requested.
+        ruamel_parser = (
+            _make_ruamel_parser() if is_roundtrip else
+            ruamel_yaml.YAML(typ='safe'))
 
         # Context manager with which to load this file from this parser,
         # defaulting to a noop context manager.
@@ -89,9 +173,20 @@ def load(
                 context_manager = ignoring_warnings(
                     MantissaNoDotYAML1_1Warning)
 
-        # Load and return the contents of this file with this context manager.
+        # Load the contents of this file with this context manager.
         with context_manager:
-            return ruamel_parser.load(yaml_file)
+            container = ruamel_parser.load(yaml_file)
+
+    # If this file is *NOT* to be roundtripped, cache a private deep copy of
+    # this container, evicting the least recently loaded container if this
+    # cache is now full.
+    if not is_roundtrip:
+        _load_cache[cache_key] = deepcopy(container)
+        if len(_load_cache) > _LOAD_CACHE_LEN_MAX:
+            _load_cache.popitem(last=False)
+
+    # Return this container.
+    return container
 
 # ....................{ SAVERS                            }....................
 @type_check
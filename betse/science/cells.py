@@ -2821,6 +2821,46 @@ class Cells(object):
         return np.dot(
             membranes_midpoint_data, self.membranes_midpoint_to_cells_centre)
 
+
+    @type_check
+    def average_membranes_to_cells(self, membranes_data: ndarray) -> ndarray:
+        '''
+        One-dimensional Numpy array indexing each cell such that each element
+        is the average of the passed one-dimensional Numpy array of arbitrary
+        data spatially situated at cell membrane midpoints over all membranes
+        of that cell.
+
+        This method is functionally equivalent to (but substantially faster
+        than) the ``np.dot(cells.M_sum_mems, membranes_data) / cells.num_mems``
+        idiom. Whereas that dot product iterates over all ``m x n`` elements of
+        the dense :attr:`M_sum_mems` matrix, this method sums each membrane
+        into its parent cell in a single pass over the :attr:`mem_to_cells`
+        array and hence scales linearly with the number of membranes ``n``.
+        Since this average is typically computed for each simulation time step,
+        this is non-negligible.
+
+        Parameters
+        -----------
+        membranes_data : ndarray
+            One-dimensional Numpy array indexing each cell membrane, such that
+            each element is arbitrary data spatially situated at the midpoint
+            of that cell membrane.
+
+        Returns
+        -----------
+        ndarray
+            One-dimensional Numpy array of length the number of cells, indexing
+            the average of the passed data over the membranes of each cell.
+        '''
+
+        # Sum all membrane data into the parent cells of these membranes and
+        # normalize these sums by the number of membranes in each cell.
+        return np.bincount(
+            self.mem_to_cells,
+            weights=membranes_data,
+            minlength=len(self.num_mems),
+        ) / self.num_mems
+
     # ..........{ MAPPERS ~ cells centre                  }.....................
     def map_cells_centre_to_grids_centre(
         self, *args, **kwargs) -> ndarray:
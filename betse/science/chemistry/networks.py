@@ -17,6 +17,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 from betse.exceptions import BetseSimConfException, BetseSimUnstableException
 from betse.lib import libs
+from betse.lib.numpy import nparray
 from betse.science import sim_toolbox as stb
 from betse.science.channels import cation as vgcat
 from betse.science.channels import vg_ca as vgca
@@ -6336,8 +6337,11 @@ class Molecule(object):
                 color_min=self.plot_min,
                 color_max=self.plot_max)
 
-            env_time_series = [
-                env.reshape(phase.cells.X.shape) for env in self.c_env_time]
+            # Three-dimensional array of all environmental concentrations,
+            # stacked once and reshaped onto the environmental grid as a view
+            # rather than reshaping each time step separately.
+            env_time_series = nparray.from_iterable(self.c_env_time).reshape(
+                (-1,) + phase.cells.X.shape)
             AnimEnvTimeSeries(
                 phase=phase,
                 conf=conf,
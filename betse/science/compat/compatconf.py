@@ -64,6 +64,7 @@ def upgrade_sim_conf(p: Parameters) -> None:
     _upgrade_sim_conf_to_0_6_0(p)
     _upgrade_sim_conf_to_0_7_1(p)
     _upgrade_sim_conf_to_1_0_0(p)
+    _upgrade_sim_conf_to_1_4_2(p)
 
 # ....................{ UPGRADERS ~ 0.5.x                 }....................
 @type_check
@@ -534,3 +535,33 @@ def _upgrade_sim_conf_to_1_0_0_exports_name(p: Parameters) -> None:
                     # exceptions on unnamed exports in this pipeline.
                     is_defaultable=True,
                 )
+
+# ....................{ UPGRADERS ~ 1.4.x                 }....................
+@type_check
+def _upgrade_sim_conf_to_1_4_2(p: Parameters) -> None:
+    '''
+    Upgrade the in-memory contents of the passed simulation configuration to
+    reflect the newest structure of these contents expected by version 1.4.2
+    of this application.
+    '''
+
+    # Log this upgrade attempt.
+    logs.log_debug('Upgrading simulation configuration to 1.4.2 format...')
+
+    # Localize configuration subdictionaries for convenience.
+    results_dict = p._conf['results options']
+    anim_after_dict = results_dict['after solving']['animations']
+    anim_while_dict = results_dict['while solving']['animations']
+    anim_save_dict = results_dict['save']['animations']
+
+    # If the number of animation frames retained in memory is undefined,
+    # default to writing each frame to disk immediately.
+    anim_save_dict['images'].setdefault('frames in memory', 0)
+
+    # If the number of processes saving post-simulation animations is
+    # undefined, default to saving these animations serially.
+    anim_after_dict.setdefault('processes', 1)
+
+    # If the stride between in-simulation animation frames is undefined,
+    # default to plotting a frame for each sampled time step.
+    anim_while_dict.setdefault('frame stride', 1)
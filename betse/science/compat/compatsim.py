@@ -12,9 +12,11 @@ simulation files).
 # ....................{ IMPORTS                           }....................
 import sys
 from betse.util.io.log import logs
+from betse.util.type.decorator.decmemo import func_cached
 # from betse.util.type.types import type_check
 
 # ....................{ UPGRADERS                         }....................
+@func_cached
 def upgrade_sim_imports() -> None:
     '''
     Upgrade the in-memory module and class structure of the active Python
@@ -45,6 +47,15 @@ def upgrade_sim_imports() -> None:
     ----------
     :func:`betse.science.config.confcompat.upgrade_sim_conf`
         Further details on which prior formats exactly are supported.
+
+    Caveats
+    ----------
+    **This function is memoized** and hence performs these upgrades at most
+    once for the active Python process. Since these upgrades only inject
+    in-memory aliases into already imported modules, these upgrades are
+    idempotent; repeating these upgrades on each subsequent unpickling (e.g.,
+    by scripts repeatedly loading the same simulation) would needlessly
+    reimport and realias these modules.
     '''
 
     # Upgrade package imports to each successive format. For safety, each
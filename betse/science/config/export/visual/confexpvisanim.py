@@ -8,7 +8,8 @@ YAML-backed simulation subconfigurations for exporting animations.
 '''
 
 # ....................{ IMPORTS                           }....................
-from betse.lib.yaml.yamlalias import yaml_alias, yaml_alias_int_positive
+from betse.lib.yaml.yamlalias import (
+    yaml_alias, yaml_alias_int_nonnegative, yaml_alias_int_positive)
 from betse.lib.yaml.abc.yamlabc import YamlABC
 from betse.lib.yaml.abc.yamllistabc import YamlList, YamlListItemABC
 from betse.science.config.export.confexpabc import SimConfExportABC
@@ -38,6 +39,12 @@ class SimConfExportAnims(YamlABC):
         ``True`` only if this configuration saves in-simulation animations.
     is_while_sim_show : bool
         ``True`` only if this configuration displays in-simulation animations.
+    while_sim_frame_stride : int
+        Number of sampled time steps between two consecutive frames displayed
+        and/or saved by in-simulation animations. If ``1``, a frame is plotted
+        for each sampled time step; else, only one frame is plotted for each
+        this many sampled time steps (e.g., every tenth sampled time step if
+        ``10``). The first frame is always plotted.
     anim_while_sim : SimConfExportAnimCellsEmbedded
         Generic configuration applicable to all in-simulation animations.
         Ignored if :attr:``is_while_sim`` is ``False``.
@@ -52,6 +59,10 @@ class SimConfExportAnims(YamlABC):
     is_after_sim_show : bool
         ``True`` only if this configuration displays post-simulation
         animations.
+    after_sim_processes : int
+        Maximum number of post-simulation animations to be saved in parallel,
+        each by a separate forked process. If ``1``, these animations are saved
+        serially. Ignored if :attr:`is_after_sim_show` is ``True``.
     anims_after_sim : YamlList
         YAML-backed list of all post-simulation animations to be animated.
         Ignored if :attr:`is_after_sim` is ``False``.
@@ -66,6 +77,11 @@ class SimConfExportAnims(YamlABC):
     image_dpi : int
         Dots per inch (DPI) of all image files saved by this configuration.
         Ignored if :attr:`is_images_save` is ``False``.
+    image_frames_in_memory : int
+        Maximum number of rendered animation frames retained in memory before
+        being written to disk as images in a single batch. If ``0``, each
+        frame is written to disk immediately. Ignored if
+        :attr:`is_images_save` is ``False``.
 
     Attributes (Video)
     ----------
@@ -140,12 +156,16 @@ class SimConfExportAnims(YamlABC):
         "['results options']['while solving']['animations']['save']", bool)
     is_while_sim_show = yaml_alias(
         "['results options']['while solving']['animations']['show']", bool)
+    while_sim_frame_stride = yaml_alias_int_positive(
+        "['results options']['while solving']['animations']['frame stride']")
 
     # ..................{ ALIASES ~ after                   }..................
     is_after_sim_save = yaml_alias(
         "['results options']['after solving']['animations']['save']", bool)
     is_after_sim_show = yaml_alias(
         "['results options']['after solving']['animations']['show']", bool)
+    after_sim_processes = yaml_alias_int_positive(
+        "['results options']['after solving']['animations']['processes']")
 
     # ..................{ ALIASES ~ save : images           }..................
     is_images_save = yaml_alias(
@@ -154,6 +174,9 @@ class SimConfExportAnims(YamlABC):
         "['results options']['save']['animations']['images']['filetype']", str)
     image_dpi = yaml_alias_int_positive(
         "['results options']['save']['animations']['images']['dpi']")
+    image_frames_in_memory = yaml_alias_int_nonnegative(
+        "['results options']['save']['animations']['images']"
+        "['frames in memory']")
 
     # ..................{ ALIASES ~ save : video            }..................
     is_video_save = yaml_alias(
@@ -29,6 +29,9 @@ class SimPhaseCaches(object):
         Subcache of all vectors constructed for this phase.
     vector_field : SimPhaseCacheVectorFieldCells
         Subcache of all vector fields constructed for this phase.
+    _phase : SimPhase
+        Parent simulation phase, classified as a weak rather than strong
+        reference to circumvent circular references.
     '''
 
     # ..................{ INITIALIZORS                       }..................
@@ -43,6 +46,27 @@ class SimPhaseCaches(object):
             Parent simulation phase.
         '''
 
+        # Classify all passed parameters as weak rather than strong reference,
+        # circumventing circular references and complications thereof.
+        self._phase = pyref.proxy_weak(phase)
+
+        # Create all subcaches.
+        self.clear()
+
+    # ..................{ CLEARERS                           }..................
+    @type_check
+    def clear(self) -> None:
+        '''
+        Release all objects previously cached by all subcaches of this cache.
+
+        Since these objects are typically large-scale arrays upscaled from
+        simulation data still referenced by the parent phase (e.g., Vmem time
+        series upscaled from volts to millivolts), callers should clear this
+        cache after exporting this phase, reducing peak memory consumption of
+        all subsequent work. Objects subsequently accessed from this cache are
+        lazily recreated as needed.
+        '''
+
         # Avoid circular import dependencies.
         from betse.science.math.cache.cacheupscaled import (
             SimPhaseCacheUpscaled)
@@ -50,10 +74,11 @@ class SimPhaseCaches(object):
         from betse.science.math.cache.cachevecfld import (
             SimPhaseCacheVectorFieldCells)
 
-        # Classify all subcaches imported above.
-        self.upscaled = SimPhaseCacheUpscaled(phase)
-        self.vector = SimPhaseCacheVectorCells(phase)
-        self.vector_field = SimPhaseCacheVectorFieldCells(phase)
+        # Replace all existing subcaches by empty subcaches, implicitly
+        # releasing all objects cached by the former.
+        self.upscaled = SimPhaseCacheUpscaled(self._phase)
+        self.vector = SimPhaseCacheVectorCells(self._phase)
+        self.vector_field = SimPhaseCacheVectorFieldCells(self._phase)
 
 # ....................{ SUPERCLASSES                       }....................
 class SimPhaseCacheABC(object, metaclass=ABCMeta):
@@ -91,3 +116,12 @@ class SimPhaseCacheABC(object, metaclass=ABCMeta):
         # Classify all passed parameters as weak rather than strong reference,
         # circumventing circular references and complications thereof.
         self._phase = pyref.proxy_weak(phase)
+
+    # ..................{ PROPERTIES                         }..................
+    @property
+    def phase(self) -> SimPhase:
+        '''
+        Parent simulation phase, as a weak reference proxy.
+        '''
+
+        return self._phase
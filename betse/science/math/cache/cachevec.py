@@ -10,10 +10,25 @@ High-level vector subcache functionality.
 # ....................{ IMPORTS                            }....................
 import numpy as np
 from betse.exceptions import BetseSimVectorException
+from betse.lib.numpy import nparray
 from betse.science.math import mathunit
 from betse.science.math.cache.cacheabc import SimPhaseCacheABC
 from betse.science.math.vector.veccls import VectorCellsCache
 from betse.util.type.decorator.decmemo import property_cached
+from numpy import ndarray
+
+# ....................{ CONSTANTS                          }....................
+_PH_TILE_SIZE = 1 << 15
+'''
+Approximate number of elements of each tile of cellular hydrogen ion
+concentrations converted into pH by the
+:meth:`SimPhaseCacheVectorCells.ion_hydrogen_intra` property (i.e., 32 Ki
+elements and hence 256 KiB of 64-bit floats).
+
+Converting concentrations into pH requires two passes over the same array (a
+logarithm followed by a negated offset). Tiling ensures the second pass reads
+each tile from the CPU cache rather than main memory.
+'''
 
 # ....................{ SUBCLASSES                         }....................
 class SimPhaseCacheVectorCells(SimPhaseCacheABC):
@@ -65,14 +80,59 @@ class SimPhaseCacheVectorCells(SimPhaseCacheABC):
         correspond exactly to cellular pH.
         '''
 
-        # Create and return this cache, which logarithmically rather than
-        # multiplicatively scales and hence *CANNOT* defer to the standardized
-        # _make_ion_cache() method.
+        # Two-dimensional Numpy array of the concentrations of hydrogen ions
+        # in all cells for all time steps.
+        times_hydrogen = self._ions_times_intra[self._phase.sim.iH]
+
+        # Two-dimensional Numpy array of the pH of all cells for all time
+        # steps, which logarithmically rather than multiplicatively scales and
+        # hence *CANNOT* defer to the standardized _make_ion_cache() method.
+        times_ph = np.empty_like(times_hydrogen)
+
+        # Number of time steps comprising each tile of this array, such that
+        # each tile is converted by both passes below while still cached.
+        tile_len = max(1, _PH_TILE_SIZE // max(1, times_hydrogen.shape[-1]))
+
+        # For each tile of time steps, compute the pH of that tile. Since
+        # -log10(1e-3 * x) == 3 - log10(x), this pH is computed *WITHOUT*
+        # first downscaling these concentrations. To avoid allocating
+        # temporary arrays, the logarithm is negated and offset in-place.
+        for tile_start in range(0, len(times_hydrogen), tile_len):
+            tile_slice = slice(tile_start, tile_start + tile_len)
+            tile_ph = times_ph[tile_slice]
+            np.log10(times_hydrogen[tile_slice], out=tile_ph)
+            np.subtract(3.0, tile_ph, out=tile_ph)
+
+        # Create and return this cache.
+        return VectorCellsCache(phase=self._phase, times_cells_centre=times_ph)
+
+    # ..................{ PROPERTIES ~ pressure              }..................
+    @property_cached
+    def pressure_osmotic(self) -> VectorCellsCache:
+        '''
+        Vector cache of all cellular osmotic pressures (i.e., differences
+        between intra- and extracellular osmotic pressures) over all sampled
+        time steps of the current simulation phase, originally spatially
+        situated at cell centres.
+        '''
+
         return VectorCellsCache(
             phase=self._phase,
-            times_cells_centre=[
-                -np.log10(1.0e-3 * ions_concentration[self._phase.sim.iH])
-                for ions_concentration in self._phase.sim.cc_time])
+            times_cells_centre=self._phase.sim.osmo_P_delta_time)
+
+
+    @property_cached
+    def pressure_total(self) -> VectorCellsCache:
+        '''
+        Vector cache of all **cellular pressure totals** (i.e., summations of
+        all cellular mechanical and osmotic pressures) over all sampled time
+        steps of the current simulation phase, originally spatially situated at
+        cell centres.
+        '''
+
+        return VectorCellsCache(
+            phase=self._phase,
+            times_cells_centre=self._phase.sim.P_cells_time)
 
     # ..................{ PROPERTIES ~ voltage               }..................
     @property_cached
@@ -122,6 +182,33 @@ class SimPhaseCacheVectorCells(SimPhaseCacheABC):
                 self._phase.sim.vm_time))
 
     # ..................{ PRIVATE ~ ions                     }..................
+    @property_cached
+    def _ions_times_intra(self) -> ndarray:
+        '''
+        Three-dimensional Numpy array of all cellular ion concentrations over
+        all sampled time steps of the current simulation phase, whose:
+
+        #. First dimension indexes each ion.
+        #. Second dimension indexes each sampled time step.
+        #. Third dimension indexes each cell, such that each element is the
+           concentration of this ion spatially situated at the centre of this
+           cell for this time step.
+
+        This array is created only on the first access of this property by
+        stacking the :attr:`Simulator.cc_time` list of two-dimensional arrays
+        exactly once (or, if the simulator has already stacked that list,
+        reusing that array as is) and then transposing the first two
+        dimensions of the result into a C-contiguous array. Whereas the former
+        interleaves the concentrations of all ions for each time step, the
+        latter stores the concentrations of each ion for all time steps
+        contiguously. Each ion-specific cache then reduces to a contiguous view
+        of this array rather than a strided slice skipping over all other ions.
+        '''
+
+        return np.ascontiguousarray(
+            nparray.from_iterable(self._phase.sim.cc_time).swapaxes(0, 1))
+
+
     def _make_ion_intra_cache(self, ion_index: int) -> VectorCellsCache:
         '''
         Create and return a vector cache of all upscaled concentrations of the
@@ -145,16 +232,21 @@ class SimPhaseCacheVectorCells(SimPhaseCacheABC):
             the range ``[0, len(self._phase.sim.cc_time[0]))``).
         '''
 
+        # Array of all cellular ion concentrations over all time steps.
+        ions_times_intra = self._ions_times_intra
+
+        # Number of ions.
+        ions_count = ions_times_intra.shape[0]
+
         # If no ion with this index exists, raise an exception.
-        if not (0 <= ion_index < len(self._phase.sim.cc_time[0])):
+        if not (0 <= ion_index < ions_count):
             raise BetseSimVectorException(
                 'Ion with index {} not found '
-                '(i.e., not in range [0, {})).'.format(
-                    ion_index, len(self._phase.sim.cc_time[0])))
+                '(i.e., not in range [0, {})).'.format(ion_index, ions_count))
 
-        # Create and return this cache.
+        # Create and return this cache, upscaling the concentrations of this
+        # ion for all time steps in a single vectorized operation.
         return VectorCellsCache(
             phase=self._phase,
             times_cells_centre=mathunit.upscale_units_micro(
-                ions_concentration[ion_index]
-                for ions_concentration in self._phase.sim.cc_time))
+                ions_times_intra[ion_index]))
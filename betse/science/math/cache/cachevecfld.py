@@ -8,7 +8,6 @@ High-level vector field subcache functionality.
 '''
 
 # ....................{ IMPORTS                            }....................
-from betse.lib.numpy import nparray
 from betse.science.math import mathunit
 from betse.science.math.cache.cacheabc import SimPhaseCacheABC
 from betse.science.math.vector.veccls import VectorCellsCache
@@ -169,12 +168,20 @@ class SimPhaseCacheVectorFieldCells(SimPhaseCacheABC):
         Vector field cache of all cellular voltage polarities over all time
         steps of the current simulation phase, originally spatially situated at
         cell membrane midpoints.
+
+        For readability of units in exported visuals (e.g., plots) *and*
+        consistency with the :meth:`SimPhaseCacheVectorCells.voltage_membrane`
+        cache reused below, these polarities are upscaled from volts (V) to
+        millivolts (mV).
         '''
 
-        # Two-dimensional Numpy arrays of all transmembrane voltages (Vmem) and
-        # Vmem averages across all cell membranes over all time steps.
-        vm_time     = nparray.from_iterable(self._phase.sim.vm_time)
-        vm_ave_time = nparray.from_iterable(self._phase.sim.vm_ave_time)
+        # Two-dimensional Numpy arrays of all upscaled transmembrane voltages
+        # (Vmem) and Vmem averages across all cell membranes over all time
+        # steps. To avoid restacking and rescaling the former, the array
+        # previously cached for the transmembrane voltage cache is reused.
+        vm_time = (
+            self._phase.cache.vector.voltage_membrane.times_membranes_midpoint)
+        vm_ave_time = mathunit.upscale_units_milli(self._phase.sim.vm_ave_time)
 
         # Two-dimensional Numpy array of all transmembrane voltage polarity
         # vector magnitudes whose:
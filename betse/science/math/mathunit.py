@@ -201,7 +201,20 @@ def _upscale_data_in_units(
     # If the passed object is numeric, return this number upscaled.
     if types.is_numeric(data):
         return factor * data
-    # Else, this object is a sequence. Return this sequence converted into a
-    # Numpy array and then upscaled.
+
+    # Else, this object is an iterable. Convert this iterable into a Numpy
+    # array (e.g., by stacking a list of per-time step arrays).
+    data_array = nparray.from_iterable(data)
+
+    # If this conversion created a new floating-point array, upscale this
+    # array in-place rather than allocating a second array of the same size.
+    # Since the caller has no reference to this array, doing so is safe.
+    if data_array is not data and data_array.dtype.kind == 'f':
+        data_array *= factor
+        return data_array
+    # Else, this object was either already a Numpy array (which this function
+    # is prohibited from modifying) *OR* a non-floating-point array (which
+    # cannot be upscaled in-place by a floating-point factor). In either case,
+    # return a new upscaled array.
     else:
-        return factor * nparray.from_iterable(data)
+        return factor * data_array
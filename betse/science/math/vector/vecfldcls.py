@@ -14,6 +14,16 @@ from betse.util.type.decorator.decmemo import property_cached
 from betse.util.type.types import type_check, SequenceTypes
 from numpy import ndarray
 
+# ....................{ CONSTANTS                          }....................
+FIELD_DTYPE = np.float32
+'''
+Numpy data type of all derived arrays (e.g., magnitudes, unit components)
+provided by :class:`VectorField` instances.
+
+Single precision is more than adequate for visual output, which is quantized
+into at most a few thousand pixels or colormap entries along each dimension.
+'''
+
 # ....................{ CLASSES                            }....................
 class VectorField(object):
     '''
@@ -26,6 +36,14 @@ class VectorField(object):
     components in both normalized and nonnormalized forms as well as the
     magnitudes of these components.
 
+    Since these normalized components and magnitudes are only ever consumed by
+    visuals (e.g., streamplots, colormapped surfaces), these arrays are
+    single- rather than double-precision (i.e., of dtype :attr:`FIELD_DTYPE`),
+    halving both the memory consumed by these arrays and the memory traffic
+    required to render each frame of these visuals. The nonnormalized X and Y
+    components preserve the precision of the data originally passed by the
+    caller.
+
     Attributes
     ----------
     x : ndarray
@@ -66,9 +84,11 @@ class VectorField(object):
               vector field for this time step.
         '''
 
-        # Classify the passed sequences as Numpy arrays for efficiency.
-        self._x = nparray.from_iterable(x)
-        self._y = nparray.from_iterable(y)
+        # Classify the passed sequences as C-contiguous Numpy arrays for
+        # efficiency, guaranteeing the components for each time step to be one
+        # contiguous block of memory. See the "VectorCellsCache" docstring.
+        self._x = np.ascontiguousarray(nparray.from_iterable(x))
+        self._y = np.ascontiguousarray(nparray.from_iterable(y))
 
     # ..................{ PROPERTIES ~ abstract              }..................
     @property
@@ -106,7 +126,8 @@ class VectorField(object):
         * Second dimension indexes each (possibly zero) magnitude of each vector
           in this vector field for this time step.
 
-        This array is created only on the first access of this property.
+        This array is created only on the first access of this property and is
+        of dtype :attr:`FIELD_DTYPE`.
 
         Caveats
         ----------
@@ -116,12 +137,14 @@ class VectorField(object):
         comparable array guaranteed *not* to contain zero values,
         '''
 
-        #FIXME: For efficiency, refactor this to simply call a builtin numpy
-        #norm function or method. (Who knew?)
-
         # Array of all vector magnitudes computed from the arrays of all
-        # vector X and Y components.
-        return np.sqrt(self._x**2 + self._y**2)
+        # vector X and Y components. Unlike the naive approach of summing the
+        # squares of these components and then taking the square root of that
+        # sum, this builtin ufunc computes these magnitudes in a single pass
+        # *WITHOUT* allocating temporary arrays or overflowing on large
+        # components. Downcasting within this ufunc avoids allocating an
+        # intermediate double-precision array.
+        return np.hypot(self._x, self._y, dtype=FIELD_DTYPE)
 
 
     @property_cached
@@ -141,17 +164,16 @@ class VectorField(object):
           safely usable *only* in contexts where vectors with zero magnitudes
           are ignorable (e.g., as the divisior of division).
 
-        This array is created only on the first access of this property.
+        This array is created only on the first access of this property and is
+        of dtype :attr:`FIELD_DTYPE`.
         '''
 
-        # Array of all vector magnitudes copied from the original.
-        magnitudes_nonzero = self.magnitudes.copy()
-
-        # Substitute all zero magnitudes by 1.0.
-        magnitudes_nonzero[magnitudes_nonzero == 0.0] = 1.0
+        # Array of all vector magnitudes.
+        magnitudes = self.magnitudes
 
-        # Return the resulting array.
-        return magnitudes_nonzero
+        # Return a new array of these magnitudes substituting all zero
+        # magnitudes by 1.0, created in a single pass.
+        return np.where(magnitudes == 0.0, 1.0, magnitudes)
 
     # ..................{ PROPERTIES ~ unit                  }..................
     @property_cached
@@ -164,10 +186,11 @@ class VectorField(object):
           in this vector field for this time step, produced by dividing that
           vector's original X component by that vector's original magnitude.
 
-        This array is created only on the first access of this property.
+        This array is created only on the first access of this property and is
+        of dtype :attr:`FIELD_DTYPE`.
         '''
 
-        return self._x / self.magnitudes_nonzero
+        return np.divide(self._x, self.magnitudes_nonzero, dtype=FIELD_DTYPE)
 
 
     @property_cached
@@ -180,10 +203,11 @@ class VectorField(object):
           in this vector field for this time step, produced by dividing that
           vector's original Y component by that vector's original magnitude.
 
-        This array is created only on the first access of this property.
+        This array is created only on the first access of this property and is
+        of dtype :attr:`FIELD_DTYPE`.
         '''
 
-        return self._y / self.magnitudes_nonzero
+        return np.divide(self._y, self.magnitudes_nonzero, dtype=FIELD_DTYPE)
 
 # ....................{ CLASSES ~ cache                    }....................
 class VectorFieldCellsCache(object):
@@ -255,7 +279,50 @@ class VectorFieldCellsCache(object):
         self._field_args = args
         self._field_kwargs = kwargs
 
-    # ..................{ PROPERTIES                         }..................
+    # ..................{ PROPERTIES ~ magnitudes            }..................
+    @property_cached
+    def magnitudes_cells_centre(self) -> VectorCellsCache:
+        '''
+        Vector cache of the magnitudes of all vectors in this field spatially
+        situated at cell centres for one or more time steps.
+
+        This cache is created only on the first access of this property. Since
+        this field is itself cached by its parent simulation phase, all
+        animations of these magnitudes then share the same cache and hence the
+        same interpolations of these magnitudes into other coordinate systems
+        (e.g., cell regions). Plots of these magnitudes currently bypass this
+        cache and hence share *no* such interpolations.
+
+        See Also
+        ----------
+        :meth:`VectorField.magnitudes`
+            Details on the structure of these magnitudes.
+        '''
+
+        return VectorCellsCache(
+            phase=self._field_x.phase,
+            times_cells_centre=self.times_cells_centre.magnitudes)
+
+
+    @property_cached
+    def magnitudes_grids_centre(self) -> VectorCellsCache:
+        '''
+        Vector cache of the magnitudes of all vectors in this field spatially
+        situated at grid space centres for one or more time steps.
+
+        This cache is created only on the first access of this property.
+
+        See Also
+        ----------
+        :meth:`magnitudes_cells_centre`
+            Further details.
+        '''
+
+        return VectorCellsCache(
+            phase=self._field_x.phase,
+            times_grids_centre=self.times_grids_centre.magnitudes)
+
+    # ..................{ PROPERTIES ~ times                 }..................
     # Read-only properties, preventing callers from setting these attributes.
 
     @property_cached
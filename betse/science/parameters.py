@@ -788,10 +788,12 @@ class Parameters(YamlFileDefaultABC):
                     self.conf_dirname, self.expression_data_path_rel)
 
                 # Load this file under the assumption this file complies with a
-                # sane version of the YAML specification.
+                # sane version of the YAML specification. Since this file is
+                # only ever read, prefer the faster non-roundtripping parser.
                 self.expression_data = yamls.load(
                     filename=self.expression_data_path,
-                    yaml_version=YAML_VERSION)
+                    yaml_version=YAML_VERSION,
+                    is_roundtrip=False)
         else:
             self.mol_mit_enabled = False
 
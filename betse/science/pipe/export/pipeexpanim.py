@@ -15,33 +15,13 @@ exporting) post-simulation animations.
 # ....................{ IMPORTS                           }....................
 from betse.science.config.export.visual.confexpvisanim import (
     SimConfExportAnimCells)
-from betse.science.math.vector.veccls import VectorCellsCache
+from betse.science.math.vector.vecfldcls import VectorFieldCellsCache
 from betse.science.phase.phasecls import SimPhase
 from betse.science.phase.require import phasereqs
 from betse.science.pipe.export.pipeexpabc import SimPipeExportABC
 from betse.science.pipe.piperun import piperunner
-from betse.science.visual.anim.anim import (
-    AnimGapJuncTimeSeries,
-    # AnimMembraneTimeSeries,
-    AnimVelocityIntracellular,
-    AnimVelocityExtracellular,
-    AnimFlatCellsTimeSeries,
-)
-from betse.science.visual.anim.animafter import AnimCellsAfterSolvingLayered
-from betse.science.visual.layer.vector import lyrvecabc
-from betse.science.visual.layer.vector.lyrvecdiscrete import (
-    LayerCellsVectorDiscreteMembranesDeformed)
-from betse.science.visual.layer.vector.lyrvecsmooth import (
-    LayerCellsVectorSmoothGrids, LayerCellsVectorSmoothRegions)
-from betse.science.visual.layer.vectorfield.lyrvecfldquiver import (
-    LayerCellsFieldQuiverCells,
-    LayerCellsFieldQuiverGrids,
-    LayerCellsFieldQuiverMembranes,
-)
-from betse.science.visual.layer.vectorfield.lyrvecfldstream import (
-    LayerCellsFieldStream)
 from betse.util.type.descriptor.descs import classproperty_readonly
-from betse.util.type.types import type_check, SequenceTypes
+from betse.util.type.types import type_check, ClassType, SequenceTypes
 
 # ....................{ SUBCLASSES                        }....................
 class SimPipeExportAnimCells(SimPipeExportABC):
@@ -77,34 +57,19 @@ class SimPipeExportAnimCells(SimPipeExportABC):
         all time steps.
         '''
 
-        # Intracellular current density field.
-        field = phase.cache.vector_field.currents_intra
+        # Defer heavyweight imports.
+        from betse.science.visual.layer.vectorfield.lyrvecfldstream import (
+            LayerCellsFieldStream)
 
-        # Vector cache of all intracellular current density field magnitudes
-        # over all time steps, spatially situated at cell centres.
-        field_magnitudes = VectorCellsCache(
-            phase=phase,
-            times_cells_centre=field.times_cells_centre.magnitudes)
-
-        # Layer sequence containing...
-        layers = (
-            # A lower layer animating these magnitudes.
-            LayerCellsVectorSmoothRegions(vector=field_magnitudes),
-
-            # A higher layer animating this field.
-            LayerCellsFieldStream(field=field),
-        )
-
-        # Animate these layers.
-        AnimCellsAfterSolvingLayered(
+        # Animate these current densities over their magnitudes.
+        self._export_field_over_magnitudes(
             phase=phase,
             conf=conf,
-            layers=layers,
+            field=phase.cache.vector_field.currents_intra,
+            field_layer_type=LayerCellsFieldStream,
+            is_extra=False,
             figure_title='Intracellular Current',
             colorbar_title='Current Density [uA/cm2]',
-
-            # Prefer an alternative colormap.
-            colormap=phase.p.background_cm,
         )
 
 
@@ -119,34 +84,19 @@ class SimPipeExportAnimCells(SimPipeExportABC):
         environment over all sampled time steps.
         '''
 
-        # Extracellular current density field over all sampled time steps.
-        field = phase.cache.vector_field.currents_extra
-
-        # Vector of all extracellular current density magnitudes over all time
-        # steps, spatially situated at environmental grid space centres.
-        field_magnitudes = VectorCellsCache(
-            phase=phase,
-            times_grids_centre=field.times_grids_centre.magnitudes)
-
-        # Layer sequence containing...
-        layers = (
-            # A lower layer animating these magnitudes.
-            LayerCellsVectorSmoothGrids(vector=field_magnitudes),
-
-            # A higher layer animating this field.
-            LayerCellsFieldStream(field=field),
-        )
+        # Defer heavyweight imports.
+        from betse.science.visual.layer.vectorfield.lyrvecfldstream import (
+            LayerCellsFieldStream)
 
-        # Animate these layers.
-        AnimCellsAfterSolvingLayered(
+        # Animate these current densities over their magnitudes.
+        self._export_field_over_magnitudes(
             phase=phase,
             conf=conf,
-            layers=layers,
+            field=phase.cache.vector_field.currents_extra,
+            field_layer_type=LayerCellsFieldStream,
+            is_extra=True,
             figure_title='Extracellular Current',
             colorbar_title='Current Density [uA/cm2]',
-
-            # Prefer an alternative colormap.
-            colormap=phase.p.background_cm,
         )
 
     # ..................{ EXPORTERS ~ deform                }..................
@@ -162,15 +112,20 @@ class SimPipeExportAnimCells(SimPipeExportABC):
         forces) for the cell cluster over all sampled time steps.
         '''
 
+        # Defer heavyweight imports.
+        from betse.science.visual.anim.animafter import (
+            AnimCellsAfterSolvingLayered)
+        from betse.science.visual.layer.vector.lyrvecdiscrete import (
+            LayerCellsVectorDiscreteMembranesDeformed)
+        from betse.science.visual.layer.vectorfield.lyrvecfldquiver import (
+            LayerCellsFieldQuiverCells)
+
         # Total cellular displacements.
         field = phase.cache.vector_field.deform_total
 
         # Vector cache of all total cellular displacement magnitudes over all
         # time steps, spatially situated at cell centres.
-        field_magnitudes = VectorCellsCache(
-            phase=phase,
-            times_cells_centre=field.times_cells_centre.magnitudes,
-        )
+        field_magnitudes = field.magnitudes_cells_centre
 
         # Layer sequence containing...
         layers = (
@@ -202,34 +157,19 @@ class SimPipeExportAnimCells(SimPipeExportABC):
         over all sampled time steps.
         '''
 
-        # Intracellular electric field.
-        field = phase.cache.vector_field.electric_intra
-
-        # Vector cache of all intracellular electric field magnitudes over all
-        # time steps, spatially situated at cell centres.
-        field_magnitudes = VectorCellsCache(
-            phase=phase,
-            times_cells_centre=field.times_cells_centre.magnitudes)
-
-        # Layer sequence containing...
-        layers = (
-            # A lower layer animating these magnitudes.
-            LayerCellsVectorSmoothRegions(vector=field_magnitudes),
-
-            # A higher layer animating this field.
-            LayerCellsFieldQuiverCells(field=field),
-        )
+        # Defer heavyweight imports.
+        from betse.science.visual.layer.vectorfield.lyrvecfldquiver import (
+            LayerCellsFieldQuiverCells)
 
-        # Animate these layers.
-        AnimCellsAfterSolvingLayered(
+        # Animate these electric field lines over their magnitudes.
+        self._export_field_over_magnitudes(
             phase=phase,
             conf=conf,
-            layers=layers,
+            field=phase.cache.vector_field.electric_intra,
+            field_layer_type=LayerCellsFieldQuiverCells,
+            is_extra=False,
             figure_title='Intracellular E Field',
             colorbar_title='Electric Field [V/m]',
-
-            # Prefer an alternative colormap.
-            colormap=phase.p.background_cm,
         )
 
 
@@ -244,34 +184,19 @@ class SimPipeExportAnimCells(SimPipeExportABC):
         environment over all sampled time steps.
         '''
 
-        # Extracellular electric field over all sampled time steps.
-        field = phase.cache.vector_field.electric_extra
-
-        # Vector of all extracellular electric field magnitudes over all time
-        # steps, spatially situated at environmental grid space centres.
-        field_magnitudes = VectorCellsCache(
-            phase=phase,
-            times_grids_centre=field.times_grids_centre.magnitudes)
-
-        # Layer sequence containing...
-        layers = (
-            # A lower layer animating these magnitudes.
-            LayerCellsVectorSmoothGrids(vector=field_magnitudes),
-
-            # A higher layer animating this field.
-            LayerCellsFieldQuiverGrids(field=field),
-        )
+        # Defer heavyweight imports.
+        from betse.science.visual.layer.vectorfield.lyrvecfldquiver import (
+            LayerCellsFieldQuiverGrids)
 
-        # Animate these layers.
-        AnimCellsAfterSolvingLayered(
+        # Animate these electric field lines over their magnitudes.
+        self._export_field_over_magnitudes(
             phase=phase,
             conf=conf,
-            layers=layers,
+            field=phase.cache.vector_field.electric_extra,
+            field_layer_type=LayerCellsFieldQuiverGrids,
+            is_extra=True,
             figure_title='Extracellular E Field',
             colorbar_title='Electric Field [V/m]',
-
-            # Prefer an alternative colormap.
-            colormap=phase.p.background_cm,
         )
 
     # ..................{ EXPORTERS ~ fluid                 }..................
@@ -286,6 +211,9 @@ class SimPipeExportAnimCells(SimPipeExportABC):
         over all sampled time steps.
         '''
 
+        # Defer heavyweight imports.
+        from betse.science.visual.anim.anim import AnimVelocityIntracellular
+
         # Animate this animation.
         AnimVelocityIntracellular(
             phase=phase,
@@ -307,6 +235,9 @@ class SimPipeExportAnimCells(SimPipeExportABC):
         environment over all sampled time steps.
         '''
 
+        # Defer heavyweight imports.
+        from betse.science.visual.anim.anim import AnimVelocityExtracellular
+
         # Animate this animation.
         AnimVelocityExtracellular(
             phase=phase,
@@ -328,6 +259,11 @@ class SimPipeExportAnimCells(SimPipeExportABC):
         sampled time steps.
         '''
 
+        # Defer heavyweight imports.
+        from betse.science.visual.anim.animafter import (
+            AnimCellsAfterSolvingLayered)
+        from betse.science.visual.layer.vector import lyrvecabc
+
         # Layer sequence containing only a single layer animating these ion
         # concentrations.
         layers = (lyrvecabc.make_layer(
@@ -354,6 +290,9 @@ class SimPipeExportAnimCells(SimPipeExportABC):
         the cell cluster over all sampled time steps.
         '''
 
+        # Defer heavyweight imports.
+        from betse.science.visual.anim.anim import AnimGapJuncTimeSeries
+
         # Animate this animation.
         AnimGapJuncTimeSeries(
             phase=phase,
@@ -403,11 +342,14 @@ class SimPipeExportAnimCells(SimPipeExportABC):
         all time steps.
         '''
 
+        # Defer heavyweight imports.
+        from betse.science.visual.anim.anim import AnimFlatCellsTimeSeries
+
         # Animate this animation.
         AnimFlatCellsTimeSeries(
             phase=phase,
             conf=conf,
-            time_series=phase.sim.P_cells_time,
+            time_series=phase.cache.vector.pressure_total.times_cells_centre,
             kind='Pcell',
             figure_title='Pressure in Cells',
             colorbar_title='Pressure [Pa]',
@@ -424,11 +366,14 @@ class SimPipeExportAnimCells(SimPipeExportABC):
         Animate the cellular osmotic pressure over all sampled time steps.
         '''
 
+        # Defer heavyweight imports.
+        from betse.science.visual.anim.anim import AnimFlatCellsTimeSeries
+
         # Animate this animation.
         AnimFlatCellsTimeSeries(
             phase=phase,
             conf=conf,
-            time_series=phase.sim.osmo_P_delta_time,
+            time_series=phase.cache.vector.pressure_osmotic.times_cells_centre,
             kind='Osmotic Pcell',
             figure_title='Osmotic Pressure in Cells',
             colorbar_title='Pressure [Pa]',
@@ -467,6 +412,12 @@ class SimPipeExportAnimCells(SimPipeExportABC):
         over all sampled time steps.
         '''
 
+        # Defer heavyweight imports.
+        from betse.science.visual.anim.animafter import (
+            AnimCellsAfterSolvingLayered)
+        from betse.science.visual.layer.vector.lyrvecsmooth import (
+            LayerCellsVectorSmoothGrids)
+
         # Layer sequence containing only a single layer animating these
         # voltages.
         layers = (LayerCellsVectorSmoothGrids(
@@ -490,6 +441,10 @@ class SimPipeExportAnimCells(SimPipeExportABC):
         time steps.
         '''
 
+        # Defer heavyweight imports.
+        from betse.science.visual.anim.animafter import (
+            AnimCellsAfterSolvingLayered)
+
         AnimCellsAfterSolvingLayered(
             phase=phase,
             conf=conf,
@@ -510,6 +465,12 @@ class SimPipeExportAnimCells(SimPipeExportABC):
         time steps.
         '''
 
+        # Defer heavyweight imports.
+        from betse.science.visual.anim.animafter import (
+            AnimCellsAfterSolvingLayered)
+        from betse.science.visual.layer.vectorfield.lyrvecfldquiver import (
+            LayerCellsFieldQuiverCells)
+
         # Layer sequence containing...
         layers = (
             # A lower layer animating all transmembrane voltages.
@@ -528,3 +489,82 @@ class SimPipeExportAnimCells(SimPipeExportABC):
             figure_title='Cell Vmem polarity',
             colorbar_title='Voltage [mV]',
         )
+
+    # ..................{ PRIVATE ~ exporters               }..................
+    @type_check
+    def _export_field_over_magnitudes(
+        self,
+        phase: SimPhase,
+        conf: SimConfExportAnimCells,
+        field: VectorFieldCellsCache,
+        field_layer_type: ClassType,
+        is_extra: bool,
+        figure_title: str,
+        colorbar_title: str,
+    ) -> None:
+        '''
+        Animate the passed vector field (e.g., current density, electric field)
+        over the magnitudes of that field for all sampled time steps.
+
+        Parameters
+        ----------
+        phase : SimPhase
+            Current simulation phase.
+        conf : SimConfExportAnimCells
+            Configuration for this animation.
+        field : VectorFieldCellsCache
+            Vector field cache to be animated.
+        field_layer_type : ClassType
+            Subclass of the :class:`LayerCellsFieldColorlessABC` superclass
+            (e.g., :class:`LayerCellsFieldStream`) animating this field as the
+            higher layer of this animation.
+        is_extra : bool
+            ``True`` only if this field is extracellular and hence spatially
+            situated at environmental grid space centres *or* ``False`` if
+            this field is intracellular and hence spatially situated at cell
+            centres.
+        figure_title : str
+            Text displayed above this animation's figure.
+        colorbar_title : str
+            Text displayed above this animation's colorbar.
+        '''
+
+        # Defer heavyweight imports.
+        from betse.science.visual.anim.animafter import (
+            AnimCellsAfterSolvingLayered)
+        from betse.science.visual.layer.vector.lyrvecsmooth import (
+            LayerCellsVectorSmoothGrids, LayerCellsVectorSmoothRegions)
+
+        # If this field is extracellular, create a lower layer animating the
+        # cached magnitudes of this field over all time steps spatially
+        # situated at environmental grid space centres. Since these magnitudes
+        # are cached by this field, all animations of this field share them.
+        if is_extra:
+            field_magnitudes_layer = LayerCellsVectorSmoothGrids(
+                vector=field.magnitudes_grids_centre)
+        # Else, this field is intracellular. In this case, do the same for the
+        # magnitudes of this field spatially situated at cell centres.
+        else:
+            field_magnitudes_layer = LayerCellsVectorSmoothRegions(
+                vector=field.magnitudes_cells_centre)
+
+        # Layer sequence containing...
+        layers = (
+            # A lower layer animating these magnitudes.
+            field_magnitudes_layer,
+
+            # A higher layer animating this field.
+            field_layer_type(field=field),
+        )
+
+        # Animate these layers.
+        AnimCellsAfterSolvingLayered(
+            phase=phase,
+            conf=conf,
+            layers=layers,
+            figure_title=figure_title,
+            colorbar_title=colorbar_title,
+
+            # Prefer an alternative colormap.
+            colormap=phase.p.background_cm,
+        )
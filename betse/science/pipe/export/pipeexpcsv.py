@@ -19,7 +19,6 @@ from betse.science.enum.enumphase import SimPhaseKind
 from betse.science.phase.require import phasereqs
 from betse.science.pipe.export.pipeexpabc import SimPipeExportABC
 from betse.science.pipe.piperun import piperunner
-from betse.science.visual.plot.plotutil import cell_ave
 # from betse.util.io.log import logs
 from betse.util.path import dirs, pathnames
 from betse.util.type.descriptor.descs import classproperty_readonly
@@ -88,23 +87,25 @@ class SimPipeExportCSVs(SimPipeExportABC):
 
         # ................{ VMEM ~ goldman                  }..................
         if phase.p.GHK_calc:
-            vm_goldman = mathunit.upscale_units_milli([
-                vm_GHK_time_cells[cell_index]
-                for vm_GHK_time_cells in phase.sim.vm_GHK_time])
+            vm_goldman = mathunit.upscale_units_milli(self._get_times_item(
+                phase.sim.vm_GHK_time, cell_index))
         else:
             vm_goldman = column_data_empty
 
         csv_column_name_values.extend(('Goldman_Vmem_mV', vm_goldman))
 
         # ................{ Na K PUMP RATE                  }..................
+        # 0-based index of the item of each membrane-situated time series
+        # (e.g., pump rates, permeabilities, currents) to export for this cell,
+        # either the first membrane of this cell if extracellular spaces are
+        # enabled *OR* this cell itself otherwise.
         if phase.p.is_ecm:
-            pump_rate = [
-                pump_array[phase.cells.cell_to_mems[cell_index][0]]
-                for pump_array in phase.sim.rate_NaKATP_time]
+            cell_mem_index = phase.cells.cell_to_mems[cell_index][0]
         else:
-            pump_rate = [
-                pump_array[cell_index]
-                for pump_array in phase.sim.rate_NaKATP_time]
+            cell_mem_index = cell_index
+
+        pump_rate = self._get_times_item(
+            phase.sim.rate_NaKATP_time, cell_mem_index)
 
         csv_column_name_values.extend((
             'NaK-ATPase_Rate_mol/m2s', pump_rate))
@@ -114,44 +115,33 @@ class SimPipeExportCSVs(SimPipeExportABC):
         for i in range(len(phase.sim.ionlabel)):
             csv_column_name = 'cell_{}_mmol/L'.format(
                 phase.sim.ionlabel[i])
-            cc_m = [arr[i][cell_index] for arr in phase.sim.cc_time]
+            cc_m = self._get_times_item(phase.sim.cc_time, i, cell_index)
             csv_column_name_values.extend((csv_column_name, cc_m))
 
         # ................{ MEMBRANE PERMEABILITIES         }..................
-        # Create the header starting with membrane permeabilities.
+        # Three-dimensional Numpy array of all membrane permeabilities, stacked
+        # once rather than once for each ion.
+        times_dd = nparray.from_iterable(phase.sim.dd_time)
+
         for i in range(len(phase.sim.ionlabel)):
-            if phase.p.is_ecm:
-                dd_m = [
-                    arr[i][phase.cells.cell_to_mems[cell_index][0]]
-                    for arr in phase.sim.dd_time
-                ]
-            else:
-                dd_m = [arr[i][cell_index] for arr in phase.sim.dd_time]
+            dd_m = self._get_times_item(times_dd, i, cell_mem_index)
 
             csv_column_name = 'Dm_{}_m2/s'.format(phase.sim.ionlabel[i])
             csv_column_name_values.extend((csv_column_name, dd_m))
 
         # ................{ TRANSMEMBRANE CURRENTS          }..................
-        if phase.p.is_ecm:
-            Imem = [
-                memArray[phase.cells.cell_to_mems[cell_index][0]]
-                for memArray in phase.sim.I_mem_time]
-        else:
-            Imem = [
-                memArray[cell_index]
-                for memArray in phase.sim.I_mem_time
-            ]
+        Imem = self._get_times_item(phase.sim.I_mem_time, cell_mem_index)
 
         csv_column_name_values.extend(('I_A/m2', Imem))
 
         # ................{ HYDROSTATIC PRESSURE            }..................
-        p_hydro = [arr[cell_index] for arr in phase.sim.P_cells_time]
+        p_hydro = self._get_times_item(phase.sim.P_cells_time, cell_index)
         csv_column_name_values.extend(('HydroP_Pa', p_hydro))
 
         # ................{ OSMOTIC PRESSURE                }..................
         if phase.p.deform_osmo:
-            p_osmo = [
-                arr[cell_index] for arr in phase.sim.osmo_P_delta_time]
+            p_osmo = self._get_times_item(
+                phase.sim.osmo_P_delta_time, cell_index)
         else:
             p_osmo = column_data_empty
 
@@ -163,10 +153,8 @@ class SimPipeExportCSVs(SimPipeExportABC):
             phase.kind is SimPhaseKind.SIM
         ):
             # Extract time-series deformation data for the plot cell:
-            dx = nparray.from_iterable([
-                arr[cell_index] for arr in phase.sim.dx_cell_time])
-            dy = nparray.from_iterable([
-                arr[cell_index] for arr in phase.sim.dy_cell_time])
+            dx = self._get_times_item(phase.sim.dx_cell_time, cell_index)
+            dy = self._get_times_item(phase.sim.dy_cell_time, cell_index)
 
             # Get the total magnitude.
             disp = mathunit.upscale_coordinates(np.sqrt(dx ** 2 + dy ** 2))
@@ -271,6 +259,31 @@ class SimPipeExportCSVs(SimPipeExportABC):
         )
 
     # ..................{ PRIVATE ~ getters                 }..................
+    @type_check
+    def _get_times_item(
+        self, times_data: SequenceTypes, *item_index) -> NumpyArrayType:
+        '''
+        One-dimensional Numpy array of the item with the passed index of each
+        sampled time step of the passed time series (e.g., the concentration of
+        a single ion in a single cell over all time steps).
+
+        This time series is stacked into a Numpy array at most once (and not at
+        all if already a Numpy array), from which this item is then sliced for
+        all time steps at once rather than indexed from each time step.
+
+        Parameters
+        ----------
+        times_data : SequenceTypes
+            Sequence of arrays of arbitrary data for each sampled time step,
+            typically a list or array of the same shape for each time step.
+        item_index : tuple
+            0-based indices of this item in the array for each time step
+            (e.g., ``(i, cell_index)`` for the concentration of the ``i``-th
+            ion in the cell with index ``cell_index``).
+        '''
+
+        return nparray.from_iterable(times_data)[(slice(None),) + item_index]
+
     @type_check
     def _get_csv_filename(
         self,
@@ -412,14 +425,23 @@ class SimPipeExportCSVs(SimPipeExportABC):
         # 0-based index of the cell to serialize time data for.
         cell_index = phase.p.visual.single_cell_index
 
+        # Two-dimensional Numpy array of all transmembrane voltages over all
+        # sampled time steps, already upscaled to millivolts (mV) in-place by
+        # this phase's vector cache. Reusing this cached array avoids
+        # allocating yet another upscaled copy of all Vmem time series.
+        times_membranes_vmems = (
+            phase.cache.vector.voltage_membrane.times_membranes_midpoint)
+
         if phase.p.is_ecm:
-            cell_times_vmems = []
-            for vm_at_mem in phase.sim.vm_time:
-                vm_t = mathunit.upscale_units_milli(
-                    cell_ave(phase.cells,vm_at_mem)[cell_index])
-                cell_times_vmems.append(vm_t)
+            # Average the transmembrane voltages of only the membranes of this
+            # cell across all time steps at once rather than averaging the
+            # membranes of all cells for each time step *BEFORE* discarding
+            # all but this cell, as the cell_ave() function does.
+            cell_mems_index = (
+                phase.cells.mem_to_cells == cell_index).nonzero()[0]
+            cell_times_vmems = np.mean(
+                times_membranes_vmems[:, cell_mems_index], axis=1)
         else:
-            cell_times_vmems = mathunit.upscale_units_milli(
-                phase.sim.vm_time)
+            cell_times_vmems = times_membranes_vmems
 
-        return nparray.from_iterable(cell_times_vmems)
+        return cell_times_vmems
@@ -9,8 +9,10 @@ aggregating runners defined by all available export pipelines) facilities.
 '''
 
 # ....................{ IMPORTS                           }....................
+import multiprocessing
 from betse.exceptions import BetseSimPipeRunnerUnsatisfiedException
 from betse.lib.matplotlib import mplfigure
+from betse.lib.matplotlib.matplotlibs import mpl_config
 from betse.science.phase.phasecls import SimPhase
 from betse.science.pipe.export.pipeexpcsv import SimPipeExportCSVs
 from betse.science.pipe.export.pipeexpanim import SimPipeExportAnimCells
@@ -19,7 +21,9 @@ from betse.science.pipe.export.plot.pipeexpplotcell import (
 from betse.science.pipe.export.plot.pipeexpplotcells import (
     SimPipeExportPlotCells)
 from betse.util.io.log import logs
-from betse.util.type.types import type_check, IterableTypes
+from betse.util.io.log.conf import logconf
+from betse.util.type.types import type_check, IterableTypes, SequenceTypes
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # ....................{ CONSTANTS                         }....................
 _PIPES_EXPORT_TYPE = (
@@ -39,6 +43,25 @@ responsiveness for end users:
 * Animations.
 '''
 
+# ....................{ GLOBALS                           }....................
+_phase_forked = None
+'''
+Simulation phase whose pipeline runners are currently being run in parallel
+by forked worker processes if any *or* ``None`` otherwise.
+
+Since worker processes are forked rather than spawned, these processes inherit
+this phase from the parent process *without* pickling this phase, which is
+typically both large and unpicklable.
+'''
+
+
+_runners_forked = None
+'''
+Sequence of 2-tuples ``(runner_method, runner_conf)`` of all pipeline runners
+currently being run in parallel by forked worker processes if any *or* ``None``
+otherwise, inherited by these processes for the same reason.
+'''
+
 # ....................{ CLASSES                           }....................
 class SimPipesExport(object):
     '''
@@ -121,11 +144,20 @@ class SimPipesExport(object):
 
         # For each available export pipeline...
         for pipe_export in self._PIPES_EXPORT:
+            # List of all pipeline runners enabled for this pipeline and phase.
+            runners_pipe = list(pipe_export.iter_runners_enabled(phase))
+
+            # If this pipeline is either disabled or enables no runners, avoid
+            # initializing this pipeline (e.g., creating directories to which
+            # no exports will be saved) and continue to the next pipeline.
+            if not runners_pipe:
+                continue
+
             # Initialize this pipeline for this phase.
             pipe_export.init(phase)
 
             # Append all pipeline runners enabled for this pipeline and phase.
-            runners_enabled.extend(pipe_export.iter_runners_enabled(phase))
+            runners_enabled.extend(runners_pipe)
 
         # Notify the caller of the range of work performed by this subcommand.
         # namely, notify the caller of the total number of times that this
@@ -133,40 +165,31 @@ class SimPipesExport(object):
         # calling that callback (e.g., SimCallbacksBC.progressed_next()).
         phase.callbacks.progress_ranged(progress_max=len(runners_enabled))
 
-        # For the method and configuration of each enabled pipeline runner...
-        for runner_method, runner_conf in runners_enabled:
-            # Metadata associated with this runner.
-            runner_metadata = runner_method.metadata
-
-            # Attempt to...
-            try:
-                # Run this runner with this phase and configuration.
-                runner_method(phase, runner_conf)
-
-                #FIXME: Refactor this low-level kludge from the BETSE codebase
-                #into a high-level implementation in the BETSEE codebase. See
-                #the prominent "FIXME" comment in the "pipeabc" submodule for
-                #preliminary work required to begin doing so. For now, this
-                #tragically suffices.
-
-                # Notify the caller of the successful completion of this
-                # runner. Since the prior call failed to raise an exception,
-                # this runner necessarily succeeded.
-                phase.callbacks.progressed_next(
-                    status='Exported {} "{}".'.format(
-                        runner_metadata.noun_singular_lowercase,
-                        runner_metadata.kind))
-            # If this runner's requirements are unsatisfied (e.g., due to the
-            # current simulation configuration disabling fluid flow), notify
-            # the caller of this non-fatal condition and continue.
-            except BetseSimPipeRunnerUnsatisfiedException as exception:
-                phase.callbacks.progressed_next(
-                    status='Excluding {} "{}", as {}.'.format(
-                        runner_metadata.noun_singular_lowercase,
-                        runner_metadata.kind,
-                        exception.reason))
-            # Else if this runner raises any other exception, permit this
-            # exception to propagate up the callstack without intervention.
+        # If no runners are enabled (e.g., due to this configuration disabling
+        # all plots and animations), log this fact and return immediately.
+        # Doing so avoids needlessly importing and closing matplotlib figures
+        # below for headless runs exporting nothing.
+        if not runners_enabled:
+            logs.log_info('Simulation exports disabled.')
+            return
+
+        # Partition these runners into runners to be run serially by this
+        # process and runners to be run in parallel by forked processes.
+        runners_serial, runners_forked = _partition_runners(
+            phase=phase, runners=runners_enabled)
+
+        # For the method and configuration of each serial pipeline runner, run
+        # this runner and notify the caller of the result of doing so.
+        for runner_method, runner_conf in runners_serial:
+            phase.callbacks.progressed_next(status=_run_runner(
+                phase=phase,
+                runner_method=runner_method,
+                runner_conf=runner_conf,
+            ))
+
+        # If any runners are to be run in parallel, do so.
+        if runners_forked:
+            _run_runners_forked(phase=phase, runners=runners_forked)
 
         # Unconditionally close all currently open matplotlib figures
         # regardless of whether any of the above runners invoked matplotlib.
@@ -177,6 +200,265 @@ class SimPipesExport(object):
         # such precautions.
         mplfigure.close_figures_all()
 
+        # Release all arrays cached by the above runners (e.g., Vmem time
+        # series upscaled to millivolts). Since the raw simulation data these
+        # arrays were derived from remains referenced by this phase, retaining
+        # both would needlessly double peak memory consumption for all
+        # subsequent work on this phase (e.g., exporting gene networks).
+        phase.cache.clear()
+
         # Log the directory to which all results were exported.
         logs.log_info('Simulation results exported to:')
         logs.log_info('\t%s', phase.export_dirname)
+
+# ....................{ PRIVATE ~ runners                 }....................
+@type_check
+def _partition_runners(phase: SimPhase, runners: SequenceTypes) -> tuple:
+    '''
+    Partition the passed pipeline runners into runners to be run serially by
+    the current process and runners to be run in parallel by forked worker
+    processes.
+
+    Only post-simulation animations are run in parallel, as each such animation
+    is independent of all other exports *and* typically dominated by rendering
+    and saving frames. These animations are run in parallel only if:
+
+    * The passed phase configures more than one process to save these
+      animations.
+    * These animations are saved but *not* displayed, as interactively
+      displaying animations from worker processes is infeasible.
+    * The current platform supports forking processes (e.g., *not* Windows).
+    * At least two such animations are enabled.
+
+    Parameters
+    ----------
+    phase: SimPhase
+        Current simulation phase.
+    runners : SequenceTypes
+        Sequence of 2-tuples ``(runner_method, runner_conf)`` of all enabled
+        pipeline runners for this phase.
+
+    Returns
+    ----------
+    (list, list)
+        2-tuple ``(runners_serial, runners_forked)`` of the lists of all
+        runners to be run serially and in parallel, respectively, each
+        preserving the order of the passed runners.
+    '''
+
+    # If post-simulation animations are *NOT* to be run in parallel, run all
+    # passed runners serially.
+    if (
+        phase.p.anim.after_sim_processes == 1 or
+        phase.p.anim.is_after_sim_show or
+        'fork' not in multiprocessing.get_all_start_methods()
+    ):
+        return list(runners), []
+
+    # Lists of all runners to be run serially and in parallel.
+    runners_serial = []
+    runners_forked = []
+
+    # Partition these runners by the export pipelines defining these runners.
+    for runner in runners:
+        if isinstance(runner[0].__self__, SimPipeExportAnimCells):
+            runners_forked.append(runner)
+        else:
+            runners_serial.append(runner)
+
+    # If fewer than two runners are to be run in parallel, run these runners
+    # serially instead, avoiding the cost of forking for no benefit.
+    if len(runners_forked) < 2:
+        return list(runners), []
+
+    # Return these lists.
+    return runners_serial, runners_forked
+
+
+@type_check
+def _run_runners_forked(phase: SimPhase, runners: SequenceTypes) -> None:
+    '''
+    Run the passed pipeline runners in parallel, each by one of a pool of
+    forked worker processes, notifying the caller of the result of each such
+    runner as that runner completes.
+
+    Parameters
+    ----------
+    phase: SimPhase
+        Current simulation phase.
+    runners : SequenceTypes
+        Sequence of 2-tuples ``(runner_method, runner_conf)`` of all pipeline
+        runners to be run in parallel.
+
+    Raises
+    ----------
+    Exception
+        If any such runner raises an exception *other* than
+        :class:`BetseSimPipeRunnerUnsatisfiedException`, in which case this
+        exception is reraised in the current process.
+    '''
+
+    # Globals inherited by all worker processes forked below.
+    global _phase_forked, _runners_forked
+
+    # Number of worker processes to be forked.
+    processes = min(len(runners), phase.p.anim.after_sim_processes)
+
+    # Log this parallelization.
+    logs.log_info(
+        'Exporting %d animations in parallel with %d processes...',
+        len(runners), processes)
+
+    # Expose this phase and these runners to these processes *BEFORE* forking
+    # these processes.
+    _phase_forked = phase
+    _runners_forked = runners
+
+    # Attempt to...
+    try:
+        # Pool of worker processes, forked rather than spawned to inherit the
+        # above globals.
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=_init_runner_forked,
+        ) as executor:
+            # Futures of all runners, each identified by 0-based index.
+            #
+            # Pools of forked worker processes fork all of these processes on
+            # the first submission. Since forking while the logging listener
+            # thread is writing a log record could deadlock these processes,
+            # that thread is halted until these submissions have been made.
+            with logconf.get_log_conf().halting_listener():
+                futures = [
+                    executor.submit(_run_runner_forked, runner_index)
+                    for runner_index in range(len(runners))
+                ]
+
+            # For each runner as that runner completes, notify the caller of
+            # the result of that runner, reraising any exception raised by
+            # that runner in that process.
+            for future in as_completed(futures):
+                phase.callbacks.progressed_next(status=future.result())
+    # Release this phase and these runners regardless of whether the above
+    # logic raised an exception.
+    finally:
+        _phase_forked = None
+        _runners_forked = None
+
+
+def _init_runner_forked() -> None:
+    '''
+    Initialize the current forked worker process *before* running any pipeline
+    runners in this process.
+
+    Specifically, this function:
+
+    * Reinitializes logging in this process. Since the listener thread
+      outputting log records in the parent process is *not* inherited by this
+      process, log records would otherwise be silently discarded. See the
+      :meth:`betse.util.io.log.conf.logconfcls.LogConf.reinit_forked` method.
+    * Enables the non-interactive ``Agg`` backend unless already enabled.
+      Since animations run in parallel are only saved rather than displayed,
+      no worker requires an interactive backend; since interactive backends
+      inherited from the parent process share that process' connection to the
+      windowing system (e.g., X11), rendering with these backends from
+      multiple forked processes is unsafe.
+    '''
+
+    # Output log records synchronously in this process.
+    logconf.get_log_conf().reinit_forked()
+
+    # If the current backend is interactive, enable the "Agg" backend instead.
+    if mpl_config.backend_name.lower() != 'agg':
+        mpl_config.backend_name = 'Agg'
+
+
+def _run_runner_forked(runner_index: int) -> str:
+    '''
+    Run the pipeline runner with the passed index in the sequence of all
+    runners inherited from the parent process by the current forked worker
+    process and return a human-readable status describing the result.
+
+    Parameters
+    ----------
+    runner_index : int
+        0-based index of this runner in the :data:`_runners_forked` sequence.
+
+    Returns
+    ----------
+    str
+        Human-readable status describing the result of this runner. See the
+        :func:`_run_runner` function for further details.
+    '''
+
+    # Method and configuration of this runner.
+    runner_method, runner_conf = _runners_forked[runner_index]
+
+    # Attempt to run this runner.
+    try:
+        return _run_runner(
+            phase=_phase_forked,
+            runner_method=runner_method,
+            runner_conf=runner_conf,
+        )
+    # Close all matplotlib figures opened by this runner regardless of whether
+    # this runner raised an exception, as this process is reused to run other
+    # runners.
+    finally:
+        mplfigure.close_figures_all()
+
+
+def _run_runner(
+    phase: SimPhase, runner_method: object, runner_conf: object) -> str:
+    '''
+    Run the passed pipeline runner with the passed phase and configuration and
+    return a human-readable status describing the result.
+
+    If this runner reports its requirements to be unsatisfied (e.g., due to the
+    current simulation configuration disabling extracellular spaces), this
+    runner is ignored with a status describing this non-fatal condition; else
+    if this runner raises any other exception, this exception is permitted to
+    propagate up the callstack without intervention.
+
+    Parameters
+    ----------
+    phase: SimPhase
+        Current simulation phase.
+    runner_method : MethodType
+        Method implementing this runner.
+    runner_conf : SimConfExportABC
+        Configuration of this runner.
+
+    Returns
+    ----------
+    str
+        Human-readable status describing the result of this runner, suitable
+        for passing to the :meth:`SimCallbacksBC.progressed_next` method.
+    '''
+
+    # Metadata associated with this runner.
+    runner_metadata = runner_method.metadata
+
+    # Attempt to...
+    try:
+        # Run this runner with this phase and configuration.
+        runner_method(phase, runner_conf)
+
+        #FIXME: Refactor this low-level kludge from the BETSE codebase into a
+        #high-level implementation in the BETSEE codebase. See the prominent
+        #"FIXME" comment in the "pipeabc" submodule for preliminary work
+        #required to begin doing so. For now, this tragically suffices.
+
+        # Describe the successful completion of this runner. Since the prior
+        # call failed to raise an exception, this runner necessarily succeeded.
+        return 'Exported {} "{}".'.format(
+            runner_metadata.noun_singular_lowercase, runner_metadata.kind)
+    # If this runner's requirements are unsatisfied (e.g., due to the current
+    # simulation configuration disabling fluid flow), describe this non-fatal
+    # condition.
+    except BetseSimPipeRunnerUnsatisfiedException as exception:
+        return 'Excluding {} "{}", as {}.'.format(
+            runner_metadata.noun_singular_lowercase,
+            runner_metadata.kind,
+            exception.reason)
@@ -11,6 +11,7 @@ simulated data of a single cell of the cell cluster).
 # ....................{ IMPORTS                           }....................
 import numpy as np
 from betse.exceptions import BetseSimConfException
+from betse.lib.numpy import nparray
 from betse.science.config.export.visual.confexpvisplot import (
     SimConfExportPlotCell)
 from betse.science.phase.phasecls import SimPhase
@@ -141,13 +142,13 @@ class SimPipeExportPlotCell(SimPipeExportPlotABC):
         # Prepare to export the current plot.
         self._export_prep(phase)
 
-        # Extract time-series deformation data for the plot cell.
-        dx = np.asarray([
-            arr[phase.p.visual.single_cell_index]
-            for arr in phase.sim.dx_cell_time])
-        dy = np.asarray([
-            arr[phase.p.visual.single_cell_index]
-            for arr in phase.sim.dy_cell_time])
+        # Extract time-series deformation data for the plot cell, stacking
+        # each time series into a single array and slicing this cell for all
+        # time steps at once rather than indexing each time step separately.
+        dx = nparray.from_iterable(phase.sim.dx_cell_time)[
+            :, phase.p.visual.single_cell_index]
+        dy = nparray.from_iterable(phase.sim.dy_cell_time)[
+            :, phase.p.visual.single_cell_index]
 
         # Get the total magnitude.
         disp = np.sqrt(dx**2 + dy**2)
@@ -366,9 +367,8 @@ class SimPipeExportPlotCell(SimPipeExportPlotABC):
         # Prepare to export the current plot.
         self._export_prep(phase)
 
-        p_osmo = tuple(
-            arr[phase.p.visual.single_cell_index]
-            for arr in phase.sim.osmo_P_delta_time)
+        p_osmo = phase.cache.vector.pressure_osmotic.times_cells_centre[
+            :, phase.p.visual.single_cell_index]
 
         pyplot.figure()
         axOP = pyplot.subplot(111)
@@ -397,9 +397,8 @@ class SimPipeExportPlotCell(SimPipeExportPlotABC):
         # Prepare to export the current plot.
         self._export_prep(phase)
 
-        p_hydro = tuple(
-            arr[phase.p.visual.single_cell_index]
-            for arr in phase.sim.P_cells_time)
+        p_hydro = phase.cache.vector.pressure_total.times_cells_centre[
+            :, phase.p.visual.single_cell_index]
 
         pyplot.figure()
         axOP = pyplot.subplot(111)
@@ -100,6 +100,13 @@ class SimPipeABCMeta(ABCMeta):
         subcls = super().__new__(
             metacls, class_name, class_base_classes, class_attrs)
 
+        # Dictionary mapping from the type of each runner in this pipeline to
+        # the name of the method implementing that runner. Resolving runners
+        # against this dictionary precomputed once at class definition time
+        # avoids repeatedly reconstructing and reflecting on method names each
+        # time this pipeline is run.
+        subcls._RUNNER_KIND_TO_METHOD_NAME = {}
+
         # For the method name and method of each runner in this pipeline...
         for runner_method_name, runner_method in subcls.iter_runners_method():
             # Metadata associated with this runner.
@@ -118,6 +125,10 @@ class SimPipeABCMeta(ABCMeta):
                 subcls._NOUN_SINGULAR.upper())
             runner_metadata.verb_continuous = subcls._VERB_CONTINUOUS
 
+            # Map this runner's type to the name of this method.
+            subcls._RUNNER_KIND_TO_METHOD_NAME[runner_metadata.kind] = (
+                runner_method_name)
+
         # Return this sanitized "SimPipeABC" subclass.
         return subcls
 
@@ -162,6 +173,15 @@ class SimPipeABC(object, metaclass=SimPipeABCMeta):
     implements this pipeline by iterating over the :meth:`iter_runners_conf`
     property and, for each enabled runner, calling that runner's method.
 
+    Attributes (Private: Class)
+    ----------
+    _RUNNER_KIND_TO_METHOD_NAME : dict
+        Dictionary mapping from the machine-readable type of each runner
+        defined by this subclass (e.g., ``voltage_intra``) to the name of the
+        method implementing that runner (e.g., ``run_voltage_intra``),
+        precomputed by the :class:`SimPipeABCMeta` metaclass on the definition
+        of this subclass.
+
     Attributes (Private: Labels)
     ----------
     _noun_singular_lowercase : str
@@ -469,24 +489,21 @@ class SimPipeABC(object, metaclass=SimPipeABCMeta):
                 continue
             # Else, this runner is enabled.
 
-            # Name of the pipeline method implementing this runner.
-            runner_method_name = (
-                self._RUNNER_METHOD_NAME_PREFIX + runner_conf.kind)
-
-            # Method running this runner if recognized *OR* "None" otherwise.
-            runner_method = objects.get_callable_or_none(
-                obj=self, callable_name=runner_method_name)
+            # Name of the pipeline method implementing this runner if
+            # recognized *OR* "None" otherwise.
+            runner_method_name = self._RUNNER_KIND_TO_METHOD_NAME.get(
+                runner_conf.kind)
 
             # If this runner is unrecognized, raise an exception.
-            if runner_method is None:
+            if runner_method_name is None:
                 raise BetseSimPipeException(
                     '{} "{}" unrecognized '
                     '(i.e., method {}.{}() not found).'.format(
                         self._noun_singular_uppercase,
                         runner_conf.kind,
                         objects.get_class_name_unqualified(self),
-                        runner_method_name))
+                        self._RUNNER_METHOD_NAME_PREFIX + runner_conf.kind))
             # Else, this runner is recognized.
 
-            # Yield a 2-tuple of this runner's method and configuration.
-            yield runner_method, runner_conf
+            # Yield a 2-tuple of this runner's bound method and configuration.
+            yield getattr(self, runner_method_name), runner_conf
@@ -300,9 +300,9 @@ class Simulator(object):
         #. First dimension indexes each ion enabled by the current ion profile.
         #. Second dimension indexes each cell such that each item is the
            concentration of that ion in that cell's endoplasmic reticulum.
-    cc_time : list
-        Three-dimensional list of all cellular ion concentrations for all time
-        steps, whose:
+    cc_time : SequenceTypes
+        Three-dimensional sequence of all cellular ion concentrations for all
+        time steps, whose:
 
         #. First dimension indexes each sampled time step.
         #. Second dimension indexes each ion such that each item is the array
@@ -312,6 +312,10 @@ class Simulator(object):
         Equivalently, this list is the concatenation of all :attr:`cc_cells`
         arrays for all sampled time steps.
 
+        While solving, this is a list appended to at each sampled time step.
+        After solving, this list is stacked into a contiguous three-dimensional
+        Numpy array of the same shape.
+
     Attributes (Ion: Index)
     ----------
     The following ion indices are dynamically defined by the
@@ -1116,6 +1120,14 @@ class Simulator(object):
         # has occurred. In this case, these results are likely to be in an
         # inconsistent, nonsensical state and hence safely discarded.
 
+        # Stack all cellular ion concentrations sampled above into a single
+        # contiguous array exactly once *BEFORE* saving this phase. Since these
+        # concentrations no longer change, all subsequent consumers (e.g.,
+        # post-simulation exports) then index or slice this array in-place
+        # rather than restacking this list on each access.
+        if self.cc_time:
+            self.cc_time = np.stack(self.cc_time)
+
         # Save this initialization or simulation and report results of
         # potential interest to the user.
         self._pickle_phase(phase)
@@ -1163,6 +1175,13 @@ class Simulator(object):
         p = phase.p
         cells = phase.cells
 
+        # True only if this configuration enables calcium and protein ions
+        # respectively. Since enabled ions are constant across this phase,
+        # these booleans are precomputed once rather than looked up from the
+        # ions dictionary on each time step.
+        is_ion_ca = p.ions_dict['Ca'] == 1
+        is_ion_p = p.ions_dict['P'] == 1
+
         # True only on the first time step of this phase.
         is_time_step_first = True
 
@@ -1279,7 +1298,7 @@ class Simulator(object):
                 self.update_intra(cells, p, i)
 
             # ----transport and handling of special ions-----------------------
-            if p.ions_dict['Ca'] == 1:
+            if is_ion_ca:
                 self.ca_handler(cells, p)
 
             # update the microtubules:-----------------------------------------
@@ -1319,7 +1338,7 @@ class Simulator(object):
                 self.grn.core.run_loop(phase=phase, t=t)
 
             # dynamic noise handling-------------------------------------------
-            if p.dynamic_noise == 1 and p.ions_dict['P'] == 1 and phase.kind is SimPhaseKind.SIM:
+            if p.dynamic_noise == 1 and is_ion_p and phase.kind is SimPhaseKind.SIM:
 
                 # Add a random walk on protein concentration to generate
                 # dynamic noise.
@@ -2035,7 +2054,7 @@ class Simulator(object):
 
             # average vm:
             # self.vm_ave = np.dot(cells.M_sum_mems, self.vm*cells.mem_sa)/cells.cell_sa
-            self.vm_ave = np.dot(cells.M_sum_mems, self.vm) / cells.num_mems
+            self.vm_ave = cells.average_membranes_to_cells(self.vm)
 
             self.E_cell_x = self.J_cell_x/(self.sigma_cell)
             self.E_cell_y = self.J_cell_y/(self.sigma_cell)
@@ -2061,7 +2080,7 @@ class Simulator(object):
                        ((p.dt*self.sigma_cell[cells.mem_to_cells])/(p.cm*cells.R_rads)))
 
             # average vm:
-            self.vm_ave = np.dot(cells.M_sum_mems, self.vm) / cells.num_mems
+            self.vm_ave = cells.average_membranes_to_cells(self.vm)
 
             # True cell radii:
             Rcells = cells.R_rads*(p.true_cell_size/p.cell_radius)
@@ -35,10 +35,35 @@ from betse.science.math import mathunit
 from betse.science.visual.anim.animafter import (
     AnimCellsAfterSolving, AnimVelocity)
 from betse.science.visual.plot.plotutil import cell_mosaic, cell_mesh
+from betse.science.visual.visabc import VISUAL_DTYPE
 from betse.util.type.types import type_check, SequenceTypes
 from matplotlib.collections import LineCollection, PolyCollection
 from scipy import interpolate
 
+# ....................{ PRIVATE ~ getters                  }....................
+def _stack_time_series(time_series: SequenceTypes) -> np.ndarray:
+    '''
+    Contiguous Numpy array stacking the passed time series, indexed first by
+    sampled time step and typed as :data:`VISUAL_DTYPE`.
+
+    Stacking a time series up front permits each frame to be efficiently sliced
+    from the resulting array *and* the superclass to autoscale colors without
+    restacking that series.
+
+    Parameters
+    ----------
+    time_series : SequenceTypes
+        Sequence of arbitrary data as a function of time to be stacked.
+
+    Returns
+    ----------
+    np.ndarray
+        Contiguous Numpy array stacking this time series.
+    '''
+
+    return np.ascontiguousarray(
+        nparray.from_iterable(time_series), dtype=VISUAL_DTYPE)
+
 # ....................{ CLASSES ~ after                    }....................
 #FIXME: This class should probably no longer be used, now that the Gouraud
 #shading performed by the "AnimCellsMembranesData" class has been optimized.
@@ -51,7 +76,7 @@ class AnimFlatCellsTimeSeries(AnimCellsAfterSolving):
     ----------
     _cell_plot : ???
         Artists signifying cell data for the prior or current frame.
-    _cell_time_series : list
+    _cell_time_series : ndarray
         Arbitrary cell data as a function of time to be underlayed.
     _gapjunc_plot : LineCollection
         Lines signifying gap junction state for the prior or current frame.
@@ -79,8 +104,9 @@ class AnimFlatCellsTimeSeries(AnimCellsAfterSolving):
         # Initialize the superclass.
         super().__init__(*args, time_step_count=len(time_series), **kwargs)
 
-        # Classify all remaining parameters.
-        self._cell_time_series = time_series
+        # Classify all remaining parameters, stacked into a contiguous array
+        # indexed first by sampled time step.
+        self._cell_time_series = _stack_time_series(time_series)
 
         # Cell data series for the first frame.
         data_set = self._cell_time_series[0]
@@ -123,7 +149,7 @@ class AnimEnvTimeSeries(AnimCellsAfterSolving):
 
     Attributes
     ----------
-    _time_series : list
+    _time_series : ndarray
         Arbitrary environmental data as a function of time to be plotted.
     _mesh_plot : matplotlib.image.AxesImage
         Meshplot of the current or prior frame's environmental data.
@@ -149,8 +175,9 @@ class AnimEnvTimeSeries(AnimCellsAfterSolving):
         # Initialize the superclass.
         super().__init__(*args, **kwargs)
 
-        # Classify parameters required by the _plot_frame_figure() method.
-        self._time_series = time_series
+        # Classify parameters required by the _plot_frame_figure() method,
+        # stacked into a contiguous array indexed first by time step.
+        self._time_series = _stack_time_series(time_series)
 
         # Environmental data meshplot for the first frame.
         self._mesh_plot = self._plot_image(pixel_data=self._time_series[0])
@@ -215,9 +242,10 @@ class AnimGapJuncTimeSeries(AnimCellsAfterSolving):
         # Initialize the superclass.
         super().__init__(*args, time_step_count=len(time_series), **kwargs)
 
-        # Classify all remaining parameters.
+        # Classify all remaining parameters, stacked into a contiguous array
+        # indexed first by sampled time step.
         # self._cell_time_series = cell_time_series
-        self._time_series = time_series
+        self._time_series = _stack_time_series(time_series)
 
         # Gap junction data series for the first frame plotted as lines.
         self._gapjunc_plot = LineCollection(
@@ -281,7 +309,7 @@ class AnimMembraneTimeSeries(AnimCellsAfterSolving):
     ----------
     _mem_edges : LineCollection
         Membrane edges coloured for the current or prior frame.
-    _time_series : SequenceTypes
+    _time_series : ndarray
         Arbitrary cell membrane data as a function of time to be plotted.
     '''
 
@@ -306,8 +334,9 @@ class AnimMembraneTimeSeries(AnimCellsAfterSolving):
         # Initialize the superclass.
         super().__init__(*args, time_step_count=len(time_series), **kwargs)
 
-        # Classify parameters required by the _plot_frame_figure() method.
-        self._time_series = time_series
+        # Classify parameters required by the _plot_frame_figure() method,
+        # stacked into a contiguous array indexed first by time step.
+        self._time_series = _stack_time_series(time_series)
 
         # Membrane edges coloured for the first frame.
         self._mem_edges = LineCollection(
@@ -501,14 +530,14 @@ class AnimVelocityIntracellular(AnimVelocity):
         #FIXME: Ugh. Duplicate code already performed by the superclass
         #AnimCellsABC._init_current_density() method. We clearly need a
         #general-purpose interpolation utility method. Hawkish doves in a cove!
-        u_gj_x = self._phase.cells.maskECM * interpolate.griddata(
+        u_gj_x = interpolate.griddata(
             cell_centres,
             self._phase.sim.u_cells_x_time[time_step],
             cell_grid,
             fill_value=0,
             method=self._phase.p.interp_type,
         )
-        u_gj_y = self._phase.cells.maskECM * interpolate.griddata(
+        u_gj_y = interpolate.griddata(
             cell_centres,
             self._phase.sim.u_cells_y_time[time_step],
             cell_grid,
@@ -516,8 +545,16 @@ class AnimVelocityIntracellular(AnimVelocity):
             method=self._phase.p.interp_type,
         )
 
-        # Current velocity field magnitudes and the maximum such magnitude.
-        vfield = np.sqrt(u_gj_x**2 + u_gj_y**2) * 1e9
+        # Zero all velocities outside the cell cluster. Since the above arrays
+        # are newly allocated, mask these arrays in-place rather than
+        # allocating new masked arrays.
+        u_gj_x *= self._phase.cells.maskECM
+        u_gj_y *= self._phase.cells.maskECM
+
+        # Current velocity field magnitudes and the maximum such magnitude,
+        # computed in-place to avoid allocating temporary arrays.
+        vfield = np.hypot(u_gj_x, u_gj_y)
+        vfield *= 1e9
         vnorm = np.max(vfield)
 
         # Streamplot the current velocity field for this frame.
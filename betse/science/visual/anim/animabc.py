@@ -7,36 +7,6 @@
 Abstract base classes of all Matplotlib-based animation subclasses.
 '''
 
-#FIXME: A potential substantial speedup (albeit possibly non-portable to all
-#possible Matplotlib backends) is as follows:
-#
-#    "One limitation of the methods presented above is that all figure elements
-#     are redrawn with every call to draw, but we are only updating a single
-#     element. Often what we want to do is draw a background, and animate just
-#     one or two elements on top of it. As of matplotlib-0.87, GTKAgg, TkAgg,
-#     WXAgg, and FLTKAgg support the methods discussed here.
-#     The basic idea is to set the 'animated' property of the Artist you want
-#     to animate (all figure elements from Figure to Axes to Line2D to Text
-#     derive from the base class Artist). Then, when the standard canvas draw
-#     operation is called, all the artists except the animated one will be
-#     drawn. You can then use the method background =
-#     canvas.copy_from_bbox(bbox) to copy a rectangular region (eg the axes
-#     bounding box) into a a pixel buffer. In animation, you restore the
-#     background with canvas.restore_region(background), and then call
-#     ax.draw_artist(something) to draw your animated artist onto the clean
-#     background, and canvas.blit(bbox) to blit the updated axes rectangle to
-#     the figure. When I run the example below in the same environment that
-#     produced 36 FPS for GTKAgg above, I measure 327 FPS with the techniques
-#     below. See the caveats on performance numbers mentioned above. Suffice it
-#     to say, quantitatively and qualitiatively it is much faster."
-#
-#For further details, see:
-#
-#    https://scipy.github.io/old-wiki/pages/Cookbook/Matplotlib/Animations.html#Animating_selected_plot_elements
-#
-#As the URL fragment "old-wiki" suggests, there probably exists a newer version
-#of this technique ideally generalizable to all possible Matplotlib backends.
-
 #FIXME: All animations should be displayed in a non-blocking rather than
 #blocking manner, as required for parallelizing the animation pipeline. To
 #minimize memory leaks while doing so, consider responding to animation window
@@ -95,8 +65,11 @@ Abstract base classes of all Matplotlib-based animation subclasses.
 #    https://stackoverflow.com/questions/21099121/python-matplotlib-unable-to-call-funcanimation-from-inside-a-function
 
 # ....................{ IMPORTS                           }....................
+from beartype.typing import Generator
 from betse.exceptions import BetseSimConfException
 from betse.lib.matplotlib.matplotlibs import mpl_config
+from betse.lib.matplotlib.mplanim import (
+    FuncAnimationBlitFigure, is_blit_figure_supported)
 from betse.lib.matplotlib.writer import mplvideo
 from betse.lib.matplotlib.writer.mplcls import (
     ImageMovieWriter, NoopMovieWriter)
@@ -110,8 +83,20 @@ from betse.util.io.log import logs
 from betse.util.path import dirs, pathnames
 from betse.util.type.iterable import itertest
 from betse.util.type.types import type_check, BoolOrNoneTypes, IntOrNoneTypes
+from contextlib import contextmanager
+from functools import partial
 from matplotlib import pyplot
-from matplotlib.animation import FuncAnimation
+
+# ....................{ CONSTANTS                         }....................
+_NOOP_WRITER = NoopMovieWriter()
+'''
+Singleton writer reducing to a noop, shared amongst all animations passing
+this writer to the :meth:`Animation.save` method.
+
+Since :class:`NoopMovieWriter` writes nothing and releases the figure
+previously passed to its :meth:`NoopMovieWriter.setup` method on finishing,
+this writer retains no state between animations and is thus safely reusable.
+'''
 
 # ....................{ BASE                              }....................
 class AnimCellsABC(VisualCellsABC):
@@ -124,9 +109,14 @@ class AnimCellsABC(VisualCellsABC):
 
     Attributes (Private)
     ----------
-    _anim : FuncAnimation
+    _anim : FuncAnimationBlitFigure
         Low-level Matplotlib animation object instantiated by this high-level
         BETSE wrapper object.
+    _is_blit : bool
+        ``True`` only if this animation is displayed, blittable, *and* the
+        installed version of matplotlib supports blitting the entire figure
+        (i.e., if each frame only redraws the artists animated by that frame
+        over a cached background of all static artists).
 
     Attributes (Private: Time)
     ----------
@@ -195,6 +185,7 @@ class AnimCellsABC(VisualCellsABC):
         # Optional parameters.
         is_current_overlayable: BoolOrNoneTypes = None,
         is_current_overlay_only_gj: BoolOrNoneTypes = None,
+        is_blittable: bool = False,
         is_ecm_required: bool = False,
         time_step_count: IntOrNoneTypes = None,
         *args, **kwargs
@@ -237,6 +228,11 @@ class AnimCellsABC(VisualCellsABC):
                intracellular and extracellular current is being animated.
             * ``True`` if either extracellular spaces are disabled _or_ are
                enabled but only intracellular current is being animated.
+        is_blittable : optional[bool]
+            ``True`` only if this animation is safely blittable when displayed
+            (i.e., if no frame of this animation modifies any artist other than
+            those of its axes, such as a colorbar whose range is rescaled per
+            frame). Defaults to ``False``.
         is_ecm_required : optional[bool]
             ``True`` only if this animation is specific to extracellular spaces.
             If ``True`` and extracellular spaces are currently disabled, an
@@ -282,6 +278,14 @@ class AnimCellsABC(VisualCellsABC):
         self._is_current_overlay_only_gj = is_current_overlay_only_gj
         self._time_step_count = time_step_count
 
+        # Only blit this animation when displaying this animation. Saving
+        # frames redraws the entire figure regardless, in which case blitting
+        # reduces to a useless overhead. Since blitting overrides private
+        # matplotlib hooks, fall back to fully redrawing each frame under
+        # matplotlib versions not known to support doing so.
+        self._is_blit = (
+            is_blittable and self._is_show and is_blit_figure_supported())
+
         # 0-based index of the last frame to be plotted.
         self._time_step_last = self._time_step_count - 1
 
@@ -323,6 +327,17 @@ class AnimCellsABC(VisualCellsABC):
         ):
             return
 
+        # If a subclass requested that each frame be saved with a "tight"
+        # bounding box, ignore this request with a non-fatal warning. Doing so
+        # would both render each frame twice (once to measure this box and
+        # again to save this frame) *AND* produce frames of varying dimensions,
+        # which video encoders reject and which jitter when viewed in series.
+        if self._writer_savefig_kwargs.pop('bbox_inches', None) is not None:
+            logs.log_warning(
+                'Animation "%s" frames unsavable with tight bounding boxes; '
+                'saving frames with fixed bounding boxes instead.',
+                self._kind)
+
         #FIXME: This is silly. Rather than prohibiting animation names
         #containing directory separators, simply sanitize this animation's name
         #by globally replacing all such separators with non-separator characters
@@ -359,8 +374,11 @@ class AnimCellsABC(VisualCellsABC):
             writer_images_template = pathnames.join(
                 save_dirname, save_frame_template_basename)
 
-            # Object writing animation frames as images.
-            self._writer_images = ImageMovieWriter()
+            # Object writing animation frames as images, retaining at most the
+            # configured number of rendered frames in memory before writing
+            # these frames to disk.
+            self._writer_images = ImageMovieWriter(
+                frames_in_memory=anim_config.image_frames_in_memory)
 
             # Log this preparation.
             logs.log_debug(
@@ -374,6 +392,12 @@ class AnimCellsABC(VisualCellsABC):
                 dpi=anim_config.image_dpi,
             )
 
+            # Pre-bind the method saving each such frame to all keyword
+            # arguments to be passed to that method, avoiding repacking these
+            # arguments for each frame.
+            self._grab_frame_images = partial(
+                self._writer_images.grab_frame, **self._writer_savefig_kwargs)
+
         # If saving animation frames as video, prepare to do so.
         if anim_config.is_video_save:
             # Name of the first video encoder installed on the current system.
@@ -430,6 +454,10 @@ class AnimCellsABC(VisualCellsABC):
                     dpi=anim_config.video_dpi,
                 )
 
+            # Pre-bind the method saving each video frame as above.
+            self._grab_frame_video = partial(
+                self._writer_video.grab_frame, **self._writer_savefig_kwargs)
+
     # ..................{ PROPERTIES                        }..................
     # Read-only properties, preventing callers from resetting these attributes.
 
@@ -508,6 +536,95 @@ class AnimCellsABC(VisualCellsABC):
         # Append a layer overlaying this field.
         self._append_layer(LayerCellsFieldStream(field=field))
 
+    # ..................{ PLOTTERS                          }..................
+    def _plot_frame_init(self) -> tuple:
+        '''
+        Initialize the figure of this animation *without* plotting any frame,
+        returning the tuple of all artists animated by this animation.
+
+        This method is passed as the ``init_func`` callable of the
+        :class:`FuncAnimationBlitFigure` instance created by the
+        :meth:`_animate` method. By default, that instance instead
+        initializes this figure by plotting the first frame, which that
+        instance then subsequently plots (and, when saving, saves) again as
+        the first frame of this animation.
+
+        If this animation is blitted, that instance marks the returned artists
+        as animated and hence excludes these artists from the cached
+        background of all static artists. Returning the empty tuple instead
+        would bake the artists of the initial figure (e.g., the initial title
+        and streamplot) into that background, ghosting these artists beneath
+        all subsequent frames.
+        '''
+
+        return self._get_artists_animated()
+
+
+    @type_check
+    def plot_frame(self, time_step: int) -> tuple:
+        '''
+        Display and/or save the frame corresponding to the passed sampled
+        simulation time step for this animation, returning the tuple of all
+        artists animated by this frame.
+
+        If this animation is blitted, the :class:`FuncAnimationBlitFigure`
+        instance calling this method redraws *only* these artists over a cached
+        background of all remaining static artists; else, the return value of
+        this method is silently ignored.
+
+        See Also
+        ----------
+        :meth:`VisualCellsABC.plot_frame`
+            Superclass method plotting this frame.
+        '''
+
+        # Plot this frame.
+        super().plot_frame(time_step)
+
+        # Return the tuple of all artists animated by this frame.
+        return self._get_artists_animated()
+
+
+    def _get_artists_animated(self) -> tuple:
+        '''
+        Tuple of all artists animated by this animation if this animation is
+        blitted *or* the empty tuple otherwise.
+        '''
+
+        # If this animation is *NOT* blitted, return the empty tuple.
+        if not self._is_blit:
+            return ()
+
+        # Set of all static artists of these axes (i.e., artists *NOT*
+        # modified between frames), localized for efficiency.
+        artists_static = {
+            self._axes.patch, self._axes.xaxis, self._axes.yaxis}
+        artists_static.update(self._axes.spines.values())
+
+        # Return the tuple of all remaining artists of these axes, including
+        # this frame's title and all artists plotted by layers (e.g., the
+        # streamplot recreated each frame by the "LayerCellsFieldStream"
+        # layer overlaying current density).
+        return tuple(
+            artist
+            for artist in self._axes.get_children()
+            if artist not in artists_static
+        )
+
+
+    def _show_frame(self, time_step_absolute: int) -> None:
+
+        # If blitting this animation, the "FuncAnimationBlitFigure" instance
+        # calling the plot_frame() method already blits this frame to the
+        # screen. Yielding the time slice via the superclass implementation
+        # would instead force a full redraw of this figure omitting all
+        # animated artists, visibly flickering this animation.
+        if self._is_blit:
+            return
+
+        # Else, defer to the superclass implementation.
+        super()._show_frame(time_step_absolute)
+
     # ..................{ ANIMATORS                         }..................
     @type_check
     def _animate(self, *args, **kwargs) -> None:
@@ -526,40 +643,21 @@ class AnimCellsABC(VisualCellsABC):
         # Prepare for plotting immediately *BEFORE* plotting the first frame.
         self._prep_figure(*args, **kwargs)
 
-        #FIXME: For efficiency, we should probably be passing "blit=True," to
-        #FuncAnimation(). Unfortunately, doing so will necessitate
-        #restructuring animations to conform to blitting-specific requirements,
-        #including:
-        #
-        #* The definition of a new init_frame() method of this class, which
-        #  plots all portions of this animation *NOT* changing between frames.
-        #  Are there any? We have no idea. Axes ticks presumably never change
-        #  between frames for any animation, so there should be *SOMETHING* to
-        #  plot here.
-        #* The passing of this method to the "FuncAnimation" instance defined
-        #  below via the "init_func" parameter: e.g.,
-        #      init_func=self.init_frame,
-        #* Refactoring the plot_frame() method to return the tuple of all
-        #  matplotlib artist objects modified for the current frame. This is
-        #  probably infeasible in a generic manner given the current crusty
-        #  design of this class, but should be trivial (...in theory) after
-        #  redesigning this class to support composoble
-        #
-        #    http://devosoft.org/making-efficient-animations-in-matplotlib-with-blitting
-        #
-        #Lemon grass and dill!
-
         # Create and assign an animation function to a local variable. If the
         # latter is *NOT* done, this function will be garbage collected prior
         # to subsequent plot handling -- in which case only the first plot will
         # be plotted without explicit warning or error. Die, matplotlib! Die!!!
-        self._anim = FuncAnimation(
+        self._anim = FuncAnimationBlitFigure(
             # Figure to which the "func" callable plots each frame.
             fig=self._figure,
 
             # Callable plotting each frame.
             func=self.plot_frame,
 
+            # Callable initializing this figure *WITHOUT* plotting the first
+            # frame, which would otherwise be plotted twice.
+            init_func=self._plot_frame_init,
+
             # Number of frames to be animated.
             frames=self._time_step_count,
 
@@ -597,109 +695,178 @@ class AnimCellsABC(VisualCellsABC):
             # doing so under the current implementation would repeatedly (and
             # hence unnecessarily) overwrite previously written files.
             repeat=not self._is_save,
+
+            # Redraw only the artists animated by each frame over a cached
+            # background of all static artists if blitting this animation.
+            blit=self._is_blit,
         )
 
-        try:
-            # If displaying and optionally saving this animations, do so.
-            if self._is_show:
-                #FIXME: If the current backend is non-interactive (e.g.,
-                #"Agg"), the following function call reduces to a noop. This is
-                #insane, frankly. In this case, this animation's plot_frame()
-                #is never called! No errors or warnings are logged, so it's
-                #unclear who or what is the culprit here. If the pyplot.show()
-                #function is indeed only supported by interactive backends, we
-                #should do the following here:
-                #
-                #* Detect whether or not the current backend is
-                #  non-interactive.
-                #* If so, either:
-                #  * Emit an explicit warning advising the user that this
-                #    animation will almost certainly be silently ignored. This
-                #    isn't terribly ideal, but it's better than zilch.
-                #  * If this animation is currently being saved, simply perform
-                #    the non-display save logic performed below -- which *DOES*
-                #    behave as expected for non-interactive backends. Clearly,
-                #    the culprit is the pyplot.show() function. Mournful sigh.
-
-                # Display and optionally save this animations. Note that,
-                # although this function is called in a blocking manner, the
-                # GUI-driven event loops of some interactive backends appear to
-                # ignore the request for blocking behavior and perform
-                # non-blocking behaviour instead. This, in turn, prevents this
-                # branch from reliably finalizing this animation by calling the
-                # close() method. This differs from the non-interactive
-                # saving-specific branch that follows, which is guaranteed to
-                # behave in a blocking manner and hence *CAN* reliably call the
-                # close() method. tl;dr: GUIs, so random.
-                pyplot.show()
-            # Else if only saving but not displaying this animation *AND* at
-            # least one animation writer doing so is enabled, do so.
-            elif self._is_save and (
-                self._writer_images is not None or
-                self._writer_video is not None
-            ):
-                # Save this animation by iteratively calling our plot_frame()
-                # method to save each animation frame. Since this method
-                # already manually saves each such frame for the case of both
-                # displaying *AND* saving this animation via the above call to
-                # the pyplot.show() function, that logic is reused here by
-                # preventing this call to the Animation.save() method from
-                # attempting to automatically save each such frame.
-                #
-                # By default, the Animation.save() method iteratively calls the
-                # MovieWriter.grab_frame() method of the passed "writer" object
-                # to save each such frame. If no such object is passed, this
-                # object defaults to a new writer whose name is the current
-                # value of the "animation.writer" rcparam. Hence, there exists
-                # no means of preventing the Animation.save() method from
-                # writing. However, there also exists no good alternative to
-                # this method that iteratively calls our plot_frame() method
-                # without also writing. For example:
-                #
-                # * The pyplot.show() function iterating frames silently
-                #   reduces to a noop for non-interactive backends and is thus
-                #   inapplicable as a general-purpose solution.
-                # * The frame iteration automatically performed by the
-                #   Animation.save() method is both non-trivial and requires
-                #   calls to private methods of the matplotlib animation API.
-                #   While this iteration could (and actually was, in the first
-                #   implementation of this approach) be reduplicated here,
-                #   doing so would be overly fragile and hence break under
-                #   upstream changes to this private API.
-                #
-                # The robust solution is to instead pass the Animation.save()
-                # method a writer reducing to a noop, circumventing conflicts
-                # with the manual saving performed by our plot_frame() method.
-                self._anim.save(
-                    # Note that, since "NoopMovieWriter" maintains no state, a
-                    # singleton "NoopMovieWriter" instance could technically be
-                    # shared amongst all animation classes. However, since
-                    # "NoopMovieWriter" construction is trivially fast, there
-                    # are no demonstrable advantages and arguable disadvantages
-                    # to doing so (e.g., code complexity, space consumption).
-                    writer=NoopMovieWriter(),
-
-                    # Pass an ignorable filename. To guarantee that an
-                    # exception is raised on this method attempting to read or
-                    # write this file, pass a filename guaranteed to be invalid
-                    # on all supported platforms (e.g., containing null bytes).
-                    # For understandable reasons, this parameter is mandatory.
-                    filename=pathnames.INVALID_PATHNAME,
-                )
+        # Escalate the matplotlib-specific verbosity level if saving video once
+        # for the duration of all frames rather than once for each frame.
+        with self._writing_video_verbosely():
+            self._animate_frames()
+
+    # ..................{ ANIMATORS ~ private               }..................
+    @contextmanager
+    def _writing_video_verbosely(self) -> Generator:
+        '''
+        Context manager setting the matplotlib-specific verbosity level to
+        :attr:`LogLevel.DEBUG` if currently :attr:`LogLevel.INFO` *and* this
+        animation is being saved as video for the duration of this context.
+
+        Matplotlib squelches critical (technically non-fatal but effectively
+        fatal) warnings and errors emitted by external commands encoding video
+        *unless* this level is :attr:`LogLevel.DEBUG`. While this level is
+        escalated by this context, the :meth:`_save_frame` method avoids
+        redundantly escalating this level for each frame.
+
+        See Also
+        ----------
+        :meth:`betse.lib.matplotlib.matplotlibs.MplConfig.reducing_log_level_to_debug_if_info`
+            Further details.
+        '''
+
+        # If *NOT* saving this animation as video, reduce to a noop.
+        if self._writer_video is None:
+            yield
+            return
+
+        # Else, escalate this level for the duration of this context.
+        with mpl_config.reducing_log_level_to_debug_if_info():
+            self._is_writer_video_verbose = True
+
+            # Yield control to the body of the caller's "with" block.
+            try:
+                yield
+            # Record this level to have been reverted even if that block raised
+            # an exception.
+            finally:
+                self._is_writer_video_verbose = False
 
-                # Finalize saving this animation.
-                self.close()
 
-        # plt.show() unreliably raises exceptions on window close resembling:
-        #     AttributeError: 'NoneType' object has no attribute 'tk'
-        # This error appears to ignorable and hence is caught and squelched.
-        except AttributeError as exc:
-            # If this is that exception, mercilessly squelch it.
-            if str(exc) == "'NoneType' object has no attribute 'tk'":
-                pass
-            # Else, reraise this exception.
-            else:
-                raise
+    def _animate_frames(self) -> None:
+        '''
+        Display and/or save all frames of this animation as requested by the
+        current simulation configuration.
+
+        This method is intended to be called only by the :meth:`_animate`
+        method *after* creating the :class:`FuncAnimation` instance iteratively
+        calling the :meth:`plot_frame` method for each frame.
+        '''
+
+        # If displaying this animation with a Tk-based backend, register a
+        # handler notified on closing this animation's window. Tk destroys the
+        # underlying widget of this window on closure, after which frames still
+        # being plotted must avoid yielding the time slice to Tk's event loop.
+        if self._is_show and mpl_config.backend_name.lower().startswith('tk'):
+            self._figure.canvas.mpl_connect('close_event', self._on_close_tk)
+
+        # If displaying and optionally saving this animations, do so.
+        if self._is_show:
+            #FIXME: If the current backend is non-interactive (e.g.,
+            #"Agg"), the following function call reduces to a noop. This is
+            #insane, frankly. In this case, this animation's plot_frame()
+            #is never called! No errors or warnings are logged, so it's
+            #unclear who or what is the culprit here. If the pyplot.show()
+            #function is indeed only supported by interactive backends, we
+            #should do the following here:
+            #
+            #* Detect whether or not the current backend is
+            #  non-interactive.
+            #* If so, either:
+            #  * Emit an explicit warning advising the user that this
+            #    animation will almost certainly be silently ignored. This
+            #    isn't terribly ideal, but it's better than zilch.
+            #  * If this animation is currently being saved, simply perform
+            #    the non-display save logic performed below -- which *DOES*
+            #    behave as expected for non-interactive backends. Clearly,
+            #    the culprit is the pyplot.show() function. Mournful sigh.
+
+            # Display and optionally save this animations. Note that,
+            # although this function is called in a blocking manner, the
+            # GUI-driven event loops of some interactive backends appear to
+            # ignore the request for blocking behavior and perform
+            # non-blocking behaviour instead. This, in turn, prevents this
+            # branch from reliably finalizing this animation by calling the
+            # close() method. This differs from the non-interactive
+            # saving-specific branch that follows, which is guaranteed to
+            # behave in a blocking manner and hence *CAN* reliably call the
+            # close() method. tl;dr: GUIs, so random.
+            pyplot.show()
+        # Else if only saving but not displaying this animation *AND* at
+        # least one animation writer doing so is enabled, do so.
+        elif self._is_save and (
+            self._writer_images is not None or
+            self._writer_video is not None
+        ):
+            # Save this animation by iteratively calling our plot_frame()
+            # method to save each animation frame. Since this method
+            # already manually saves each such frame for the case of both
+            # displaying *AND* saving this animation via the above call to
+            # the pyplot.show() function, that logic is reused here by
+            # preventing this call to the Animation.save() method from
+            # attempting to automatically save each such frame.
+            #
+            # By default, the Animation.save() method iteratively calls the
+            # MovieWriter.grab_frame() method of the passed "writer" object
+            # to save each such frame. If no such object is passed, this
+            # object defaults to a new writer whose name is the current
+            # value of the "animation.writer" rcparam. Hence, there exists
+            # no means of preventing the Animation.save() method from
+            # writing. However, there also exists no good alternative to
+            # this method that iteratively calls our plot_frame() method
+            # without also writing. For example:
+            #
+            # * The pyplot.show() function iterating frames silently
+            #   reduces to a noop for non-interactive backends and is thus
+            #   inapplicable as a general-purpose solution.
+            # * The frame iteration automatically performed by the
+            #   Animation.save() method is both non-trivial and requires
+            #   calls to private methods of the matplotlib animation API.
+            #   While this iteration could (and actually was, in the first
+            #   implementation of this approach) be reduplicated here,
+            #   doing so would be overly fragile and hence break under
+            #   upstream changes to this private API.
+            #
+            # The robust solution is to instead pass the Animation.save()
+            # method a writer reducing to a noop, circumventing conflicts
+            # with the manual saving performed by our plot_frame() method.
+            self._anim.save(
+                # Since "NoopMovieWriter" retains no state between animations,
+                # a singleton instance is shared amongst all animations.
+                writer=_NOOP_WRITER,
+
+                # Pass an ignorable filename. To guarantee that an
+                # exception is raised on this method attempting to read or
+                # write this file, pass a filename guaranteed to be invalid
+                # on all supported platforms (e.g., containing null bytes).
+                # For understandable reasons, this parameter is mandatory.
+                filename=pathnames.INVALID_PATHNAME,
+            )
+
+            # Finalize saving this animation.
+            self.close()
+
+    # ..................{ HANDLERS                          }..................
+    def _on_close_tk(self, event) -> None:
+        '''
+        Handle the closure of this animation's window under a Tk-based backend.
+
+        Tk destroys the widget underlying this window on closure. Subsequently
+        yielding the time slice to Tk's event loop (e.g., via the
+        :func:`pyplot.pause` function called by the :meth:`_show_frame` method)
+        would then raise the non-human-readable exception
+        ``AttributeError: 'NoneType' object has no attribute 'tk'``. This
+        handler prevents this by ceasing to display all subsequent frames.
+
+        Parameters
+        ----------
+        event : CloseEvent
+            Matplotlib event describing this closure. Ignored.
+        '''
+
+        # Cease displaying frames of this animation.
+        self._is_show = False
 
     # ..................{ CLOSERS                           }..................
     def close(self) -> None:
@@ -739,6 +906,7 @@ class AnimCellsABC(VisualCellsABC):
 
             # Prevent this writer from being reused and break hard cycles.
             self._writer_images = None
+            self._grab_frame_images = None
 
         # If saving animation frames as video...
         if self._writer_video is not None:
@@ -749,3 +917,4 @@ class AnimCellsABC(VisualCellsABC):
 
             # Prevent this writer from being reused and break hard cycles.
             self._writer_video = None
+            self._grab_frame_video = None
@@ -9,6 +9,8 @@
 '''
 
 # ....................{ IMPORTS                           }....................
+import numpy as np
+from betse.lib.numpy import nparray
 from betse.science.config.export.visual.confexpvisabc import SimConfVisualCellsABC
 from betse.science.phase.phasecls import SimPhase
 from betse.science.visual.anim.animabc import AnimCellsABC
@@ -61,6 +63,13 @@ class AnimCellsAfterSolving(AnimCellsABC):
             **kwargs
         )
 
+        # Since the simulation has already been solved, the list of all sampled
+        # simulation times is guaranteed to no longer change. Convert this list
+        # into a contiguous array exactly once here rather than repeatedly
+        # indexing this list for each frame.
+        self._times = np.ascontiguousarray(
+            nparray.from_iterable(self._phase.sim.time))
+
 
 #FIXME: Merge this class into the "AnimCellsAfterSolving" superclass *AFTER*
 #refactoring all subclasses to leverage layers.
@@ -107,6 +116,11 @@ class AnimCellsAfterSolvingLayered(AnimCellsAfterSolving):
             # the same type, this path is guaranteed to be unique in at least
             # the directory containing all visuals of the same type.
             kind=conf.kind,
+
+            # Blit this animation when displayed. Since layers only modify
+            # artists of this animation's axes and this animation's colorbar
+            # range is fixed across all frames, doing so is safe.
+            is_blittable=True,
             **kwargs
         )
 
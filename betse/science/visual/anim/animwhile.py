@@ -11,12 +11,32 @@
 # ....................{ IMPORTS                           }....................
 import matplotlib
 import numpy as np
+import time
 from betse.lib.matplotlib.matplotlibs import mpl_config
 from betse.science.math import mathunit
 from betse.science.phase.phasecls import SimPhase
 from betse.science.visual.anim.animabc import AnimCellsABC
+from betse.science.visual.visabc import VISUAL_DTYPE
 from betse.util.type.types import type_check, SequenceTypes
 from matplotlib import pyplot
+from typing import no_type_check
+
+# ....................{ CONSTANTS                         }....................
+_SHOW_FRAME_INTERVAL_SECONDS = 1.0 / 30
+'''
+Minimum number of fractional seconds between two consecutive frames displayed
+but *not* saved by the :meth:`AnimCellsWhileSolving.plot_frame` method,
+rate-limiting the display of these frames to at most thirty per second.
+
+Since this animation is plotted synchronously from the solver loop, each
+displayed frame blocks that loop on matplotlib. Sampled time steps are
+typically solved far faster than any human can perceive, in which case
+rendering each such frame only throttles the solver to the speed of the
+current matplotlib backend. Frames arriving sooner than this interval after
+the last displayed frame are thus silently skipped, allowing the solver to
+run ahead of the display. Saved frames are never skipped. The final frame is
+displayed on exiting the animation's context even if skipped here.
+'''
 
 # ....................{ SUBCLASSES                        }....................
 #FIXME: Rename "_cell_data_plot" to "_cell_body_plot".
@@ -41,17 +61,44 @@ class AnimCellsWhileSolving(AnimCellsABC):
 
     Attributes
     ----------
+    _blit_background : object
+        Backend-specific pixel buffer of the figure background (i.e., the
+        figure with all animated artists omitted) if this animation is blitted
+        *and* this background has been cached *or* ``None`` otherwise (e.g.,
+        before the first frame is drawn and after each resize or cell cluster
+        revival).
     _cell_edges_plot : LineCollection
         Plot of the current or prior frame's cell edges.
     _cell_data_plot : Collection
         Plot of the current or prior frame's cell contents.
-    _cell_verts_id : int
-        Unique identifier for the array of cell vertices (i.e.,
-        `cells.cell_verts`) when plotting the current or prior frame.
-        Retaining this identifier permits the `_plot_frame_figure()` method to
-        efficiently detect and respond to physical changes (e.g., deformation
-        forces, cutting events) in the fundamental structure of the previously
-        plotted cell cluster.
+    _cell_data_upscaled : ndarray
+        Buffer of the current or prior frame's cell data upscaled from volts
+        to millivolts in single precision, reused across frames of the same
+        shape to avoid reallocating this array on each frame. Since matplotlib
+        copies arrays passed to the :meth:`ScalarMappable.set_array` method,
+        reusing this buffer is safe.
+    _cell_verts : ndarray
+        Array of cell vertices (i.e., `cells.cell_verts`) when plotting the
+        current or prior frame. Retaining this array permits the
+        `_plot_frame_figure()` method to efficiently detect and respond to
+        physical changes (e.g., deformation forces, cutting events) in the
+        fundamental structure of the previously plotted cell cluster, which
+        replace rather than modify this array. Since this animation retains a
+        strong reference to this array, this array's unique identifier is
+        guaranteed to *not* be reused by another array; identity comparison
+        against this array is thus reliable, unlike comparison against a
+        previously stored unique identifier of a possibly garbage-collected
+        array.
+    _frame_count : int
+        Number of calls to the :meth:`plot_frame` method so far, including
+        calls skipped due to :attr:`_frame_stride`.
+    _frame_stride : int
+        Number of sampled time steps between two consecutive frames plotted by
+        the :meth:`plot_frame` method, synchronized with the
+        ``while_sim_frame_stride`` option of the simulation configuration.
+        Since frames skipped by this stride are neither displayed nor saved,
+        the solver loop calling this method avoids all plotting overhead for
+        these frames. The final frame is plotted regardless of this stride.
     _is_colorbar_autoscaling_telescoped : bool
         ``True`` if colorbar autoscaling is permitted to increase but not
         decrease the colorbar range *or* ``False`` otherwise (i.e., if
@@ -60,6 +107,20 @@ class AnimCellsWhileSolving(AnimCellsABC):
         long-term patterns in cell data at a cost of deemphasizing unstable
         short-term patterns. If colorbar autoscaling is disabled (i.e.,
         ``is_color_autoscaled`` is ``False``), this will be ignored.
+    _show_time_last : float
+        Fractional seconds since an arbitrary epoch returned by the
+        :func:`time.perf_counter` function at which the :meth:`plot_frame`
+        method last displayed a frame *or* negative infinity if no frame has
+        been displayed yet, guaranteeing that the first frame is always
+        displayed. Subsequent unsaved frames are displayed only if at least
+        :data:`_SHOW_FRAME_INTERVAL_SECONDS` have elapsed since this time.
+    _time_step_skipped : Optional[int]
+        0-based index (or -1 for the last sampled time step) of the time step
+        passed to the most recent call to the :meth:`plot_frame` method if
+        that call skipped that frame (e.g., due to :attr:`_frame_stride`) *or*
+        ``None`` otherwise. If non-``None`` on exiting this context manager,
+        this frame is plotted then, guaranteeing that this animation always
+        ends on the final sampled time step.
     '''
 
     # ..................{ INITIALIZERS                      }..................
@@ -132,16 +193,28 @@ class AnimCellsWhileSolving(AnimCellsABC):
         self._is_colorbar_autoscaling_telescoped = (
             is_colorbar_autoscaling_telescoped)
 
-        # Unique identifier for the array of cell vertices. (See docstring.)
-        self._cell_verts_id = id(self._phase.cells.cell_verts)
+        # Array of cell vertices. (See docstring.)
+        self._cell_verts = self._phase.cells.cell_verts
+
+        # Number of frames passed to plot_frame() and the stride between
+        # frames actually plotted. (See docstring.)
+        self._frame_count = 0
+        self._frame_stride = self._phase.p.anim.while_sim_frame_stride
+
+        # Time at which the last frame was displayed. (See docstring.)
+        self._show_time_last = float('-inf')
+
+        # Time step of the last frame skipped if any. (See docstring.)
+        self._time_step_skipped = None
+
+        # Buffer of upscaled cell data, allocated on the first frame.
+        self._cell_data_upscaled = np.empty(0)
 
         #FIXME: This is a temp change until we get this right.
-        #FIXME: Refactor to call the new
-        #Cells.map_membranes_midpoint_to_cells_centre() method instead.
 
         # Vmem averaged over cell centres.
-        vm_o = np.dot(self._phase.cells.M_sum_mems, self._phase.sim.vm) / (
-            self._phase.cells.num_mems)
+        vm_o = self._phase.cells.average_membranes_to_cells(
+            self._phase.sim.vm)
 
         # self._cell_time_series = self.sim.vm_time
         self._cell_time_series = self._phase.sim.vm_ave_time
@@ -166,6 +239,27 @@ class AnimCellsWhileSolving(AnimCellsABC):
             color_data=cell_data,
         )
 
+        # Blit this animation when displayed only if the colorbar range is
+        # fixed across all frames (in which case only the cell plot and
+        # axes title change between frames) *AND* the current backend
+        # supports blitting. Since this animation is plotted synchronously
+        # from the solver loop, avoiding a full redraw of this figure for each
+        # frame directly accelerates that loop.
+        self._is_blit = (
+            self._is_show and
+            not self._conf.is_color_autoscaled and
+            self._figure.canvas.supports_blit
+        )
+        self._blit_background = None
+
+        # If blitting, omit all artists modified between frames from full
+        # redraws of this figure and recache the figure background after each
+        # such redraw (e.g., on window resizes).
+        if self._is_blit:
+            self._cell_data_plot.set_animated(True)
+            self._axes.title.set_animated(True)
+            self._figure.canvas.mpl_connect('draw_event', self._cache_blit)
+
     # ..................{ CONTEXTS                          }..................
     def __enter__(self) -> 'AnimCellsWhileSolving':
         '''
@@ -202,11 +296,22 @@ class AnimCellsWhileSolving(AnimCellsABC):
 
         This special method (in order):
 
+        . Plots the final frame if the last call to the :meth:`plot_frame`
+          method skipped that frame and no exception was raised.
         . Disables the non-blocking matplotlib behavior temporarily enabled by
           the prior :meth:`__enter__` call.
         . Safely closes this plot or animation.
         '''
 
+        # If the last frame passed to the plot_frame() method was skipped
+        # (e.g., due to the frame stride or display rate limit) *AND* the
+        # solver completed without raising an exception, plot this frame
+        # unconditionally. Failing to do so would end this animation on a
+        # prior frame rather than the final state of this simulation.
+        if exc_type is None and self._time_step_skipped is not None:
+            super().plot_frame(self._time_step_skipped)
+            self._time_step_skipped = None
+
         # Id displaying this animation *AND* the current matplotlib backend
         # fails to support "true" non-blocking behavior, disable the "fake"
         # non-blocking behavior enabled by the prior __enter__() call.
@@ -220,20 +325,70 @@ class AnimCellsWhileSolving(AnimCellsABC):
         return False
 
     # ..................{ PLOTTERS                          }..................
+    def plot_frame(self, time_step: int) -> tuple:
+
+        # If this frame is *NOT* the first and is *NOT* on the configured
+        # frame stride, skip this frame entirely. Since this test is trivial,
+        # perform this test first. Skipped frames are recorded, permitting the
+        # __exit__() method to plot the final frame if skipped here.
+        frame_count = self._frame_count
+        self._frame_count = frame_count + 1
+        if frame_count % self._frame_stride:
+            self._time_step_skipped = time_step
+            return ()
+        # Else, this frame is on this stride.
+        self._time_step_skipped = None
+
+        # If only displaying (i.e., *NOT* saving) this frame, skip this frame
+        # when the last frame was displayed too recently for this frame to be
+        # perceptible. (See the "_SHOW_FRAME_INTERVAL_SECONDS" docstring.)
+        if self._is_show and not self._is_save:
+            show_time = time.perf_counter()
+            if (show_time - self._show_time_last <
+                _SHOW_FRAME_INTERVAL_SECONDS):
+                self._time_step_skipped = time_step
+                return ()
+            self._show_time_last = show_time
+
+        # Else, plot this frame as usual.
+        return super().plot_frame(time_step)
+
+
     def _plot_frame_figure(self) -> None:
 
-        # Upscaled cell data for the current time step.
-        cell_data = mathunit.upscale_units_milli(
-            self._cell_time_series[self._time_step])
+        # Cell data for the current time step in volts.
+        cell_data_volts = self._cell_time_series[self._time_step]
+
+        # Buffer of upscaled cell data and array of cell vertices for the
+        # current time step, localized to avoid repeatedly resolving these
+        # instance and nested attributes for each frame.
+        cell_data_upscaled = self._cell_data_upscaled
+        cell_verts = self._phase.cells.cell_verts
+
+        # If this data differs in shape from that of the prior frame (e.g.,
+        # due to this being the first frame or a cutting event), reallocate
+        # the buffer of upscaled cell data.
+        if cell_data_upscaled.shape != cell_data_volts.shape:
+            cell_data_upscaled = self._cell_data_upscaled = np.empty(
+                cell_data_volts.shape, dtype=VISUAL_DTYPE)
+
+        # Upscaled cell data for the current time step, multiplied by this
+        # constant factor directly into this single-precision buffer (see the
+        # "VISUAL_DTYPE" docstring). Since this method is called for each
+        # sampled time step, this intentionally avoids the overhead of the
+        # general-purpose mathunit.upscale_units_milli() function (e.g., type
+        # checking, iterable conversion).
+        cell_data = np.multiply(
+            cell_data_volts, mathunit.INVERSE_MILLI, out=cell_data_upscaled)
 
         #FIXME: Duplicated from above. What we probably want to do is define a
         #new _get_cell_data() method returning this array in a centralized
         #manner callable both here and above. Rays of deluded beaming sunspray!
 
-        # If the unique identifier for the array of cell vertices has *NOT*
-        # changed, the cell cluster has *NOT* fundamentally changed and need
-        # only be updated with this time step's cell data.
-        if self._cell_verts_id == id(self._phase.cells.cell_verts):
+        # If the array of cell vertices has *NOT* been replaced, the cell
+        # cluster has *NOT* fundamentally changed and need only be updated with
+        # this time step's cell data.
+        if self._cell_verts is cell_verts:
             # loggers.log_info(
             #     'Updating animation "{}" cell plots...'.format(self._type))
             self._update_cell_plots(cell_data)
@@ -245,7 +400,7 @@ class AnimCellsWhileSolving(AnimCellsABC):
 
             # Prevent subsequent calls to this method from erroneously
             # recreating the cell cluster again.
-            self._cell_verts_id = id(self._phase.cells.cell_verts)
+            self._cell_verts = cell_verts
 
             # Recreate the cell cluster.
             self._revive_cell_plots(cell_data)
@@ -253,7 +408,9 @@ class AnimCellsWhileSolving(AnimCellsABC):
         # Update the color bar with the content of the cell body plot *AFTER*
         # possibly recreating this plot above.
         if self._conf.is_color_autoscaled:
-            cell_data_vm = cell_data
+            # Minimum and maximum upscaled cell data for this time step.
+            color_min = cell_data.min()
+            color_max = cell_data.max()
 
             # If autoscaling this colorbar in a telescoping manner and this is
             # *NOT* the first time step, do so.
@@ -262,26 +419,95 @@ class AnimCellsWhileSolving(AnimCellsABC):
             # and maximum colors are garbage and thus *MUST* be ignored.
             if (self._is_colorbar_autoscaling_telescoped and
                 not self._is_time_step_first):
-                self._color_min = min(self._color_min, np.min(cell_data_vm))
-                self._color_max = max(self._color_max, np.max(cell_data_vm))
-            # Else, autoscale this colorbar in an unrestricted manner.
-            else:
-                self._color_min = np.min(cell_data_vm)
-                self._color_max = np.max(cell_data_vm)
+                color_min = min(self._color_min, color_min)
+                color_max = max(self._color_max, color_max)
 
-            # Autoscale the colorbar to these colors.
+            # Autoscale the colorbar to these colors, writing these colors back
+            # to their instance variables exactly once.
+            self._color_min = color_min
+            self._color_max = color_max
             self._rescale_color_mappables()
 
         # If displaying this frame...
         if self._is_show:
-            # If the current event loop is idle, draw this frame; else, noop.
+            # If blitting this frame, redraw only the artists modified by this
+            # frame over the cached figure background.
+            if self._is_blit:
+                self._blit_frame()
+            # Else, if the current event loop is idle, draw this frame; else,
+            # noop.
             # As detailed by the pyplot.draw() docstring, this is the
             # object-oriented equivalent to calling pyplot.draw().
-            self._figure.canvas.draw_idle()
-            # self._figure.canvas.draw()
+            else:
+                self._figure.canvas.draw_idle()
+                # self._figure.canvas.draw()
 
 
-    @type_check
+    def _show_frame(self, time_step_absolute: int) -> None:
+
+        # If blitting this animation, the _blit_frame() method has already
+        # drawn this frame. Yielding the time slice via the superclass
+        # implementation would instead force a full redraw of this figure
+        # omitting all animated artists, visibly flickering this animation.
+        # Instead, merely process pending GUI events (e.g., window resizes).
+        if self._is_blit:
+            self._figure.canvas.flush_events()
+        # Else, defer to the superclass implementation.
+        else:
+            super()._show_frame(time_step_absolute)
+
+    # ..................{ BLITTERS                          }..................
+    def _cache_blit(self, event) -> None:
+        '''
+        Cache the background of this figure (i.e., this figure with all
+        animated artists omitted) immediately after each full redraw of this
+        figure.
+
+        Parameters
+        -----------
+        event : DrawEvent
+            Matplotlib event signifying this redraw.
+        '''
+
+        self._blit_background = self._figure.canvas.copy_from_bbox(
+            self._figure.bbox)
+
+
+    def _blit_frame(self) -> None:
+        '''
+        Draw only the artists modified by the current frame (i.e., the cell
+        plot and axes title) over the cached background of this figure and
+        blit the entire figure to the screen.
+
+        If this background has yet to be cached (e.g., due to this being the
+        first frame or a cell cluster revival), this method first fully
+        redraws this figure, implicitly caching this background.
+        '''
+
+        # Canvas of this figure, localized for negligible efficiency.
+        canvas = self._figure.canvas
+
+        # If the figure background has yet to be cached, fully redraw this
+        # figure, implicitly caching this background via _cache_blit().
+        if self._blit_background is None:
+            canvas.draw()
+
+        # Restore this background over the entire figure.
+        canvas.restore_region(self._blit_background)
+
+        # Draw each animated artist onto the axes of this animation.
+        self._axes.draw_artist(self._cell_data_plot)
+        self._axes.draw_artist(self._axes.title)
+
+        # Blit the entire figure to the screen.
+        canvas.blit(self._figure.bbox)
+
+
+    # Since this method is called for each sampled time step from the solver
+    # loop *AND* all callers already pass a Numpy array, this method is
+    # intentionally excluded from the package-wide runtime type-checking
+    # applied by the beartype_this_package() import hook in "betse.__init__".
+    @no_type_check
     def _update_cell_plots(self, cell_data: SequenceTypes) -> None:
         '''
         Update *without* recreating all cell plots for this time step with the
@@ -302,7 +528,8 @@ class AnimCellsWhileSolving(AnimCellsABC):
             cell_data=cell_data)
 
 
-    @type_check
+    # See the _update_cell_plots() method for discussion.
+    @no_type_check
     def _revive_cell_plots(self, cell_data: SequenceTypes) -> None:
         '''
         Recreate all cell plots for this time step with the passed array of
@@ -322,3 +549,10 @@ class AnimCellsWhileSolving(AnimCellsABC):
         self._cell_data_plot = self._revive_cell_plots_sans_ecm(
             cell_plot=self._cell_data_plot,
             cell_data=cell_data)
+
+        # If blitting, omit this recreated plot from full redraws of this
+        # figure and invalidate the cached figure background, which may no
+        # longer reflect the structure of this cell cluster.
+        if self._is_blit:
+            self._cell_data_plot.set_animated(True)
+            self._blit_background = None
@@ -44,6 +44,7 @@ plotting onto the cell cluster.
 from abc import ABCMeta, abstractmethod
 from betse.exceptions import BetseSimVisualLayerException
 from betse.util.io.log import logs
+from betse.util.io.log.logenum import LogLevel
 from betse.util.py import pyref
 from betse.util.type import types
 from betse.util.type.iterable import iterget
@@ -76,6 +77,10 @@ class LayerCellsABC(object, metaclass=ABCMeta):
     _is_layered : bool
         ``True`` only if the :meth:`layer` method has been called at least once
         for this layer instance.
+    _is_log_debug : bool
+        ``True`` only if debug messages were logged when the :meth:`prep`
+        method was last called, in which case the :meth:`layer` method logs
+        the rescaling of this layer's colors for each frame.
     _phase : SimPhase
         Current simulation phase *or* ``None`` if the :meth:`prep` method has
         yet to be called. Note that this attribute is also accessible via the
@@ -117,6 +122,7 @@ class LayerCellsABC(object, metaclass=ABCMeta):
 
         # Default instance attributes.
         self._is_layered = False
+        self._is_log_debug = False
         self._phase = None
         self._visual = None
         self._zorder = None
@@ -157,6 +163,10 @@ class LayerCellsABC(object, metaclass=ABCMeta):
         # Alias the current simulation phase to a convenience variable.
         self._phase = self._visual.phase
 
+        # Decide whether debug messages are logged exactly once here rather
+        # than in the layer() method called for each frame.
+        self._is_log_debug = logs.is_level_logged(LogLevel.DEBUG)
+
         # Ensure the next call to the layer() method calls the _layer_first()
         # rather than _layer_next() method, ensuring layers to be safely
         # reusable between multiple parent visuals.
@@ -465,9 +475,12 @@ class LayerCellsColorfulABC(LayerCellsABC):
             color_data_flat = self.color_data.ravel()
 
             # Set the minimum and maximum colors to the minimum and maximum
-            # values in this array.
-            self._color_min = color_data_flat.min()
-            self._color_max = color_data_flat.max()
+            # values in this array, coerced into builtin floats. Since these
+            # values are Numpy scalars of this array's dtype (e.g.,
+            # "np.float32" for single-precision vector field magnitudes) that
+            # are *NOT* necessarily builtin floats, this coercion is required.
+            self._color_min = float(color_data_flat.min())
+            self._color_max = float(color_data_flat.max())
             # self._color_min = np.ma.min(color_data_flat)
             # self._color_max = np.ma.max(color_data_flat)
         # Else, colorbar autoscaling is disabled. In this case, set the minimum
@@ -500,10 +513,12 @@ class LayerCellsColorfulABC(LayerCellsABC):
         this visual's colorbar.
         '''
 
-        # Log this attempt.
-        logs.log_debug(
-            'Rescaling "%s" colors to [%d, %d]...',
-            self._visual.kind, self._color_min, self._color_max)
+        # If logging debug messages, log this attempt. Since this method is
+        # called for each frame, avoid creating a log record otherwise.
+        if self._is_log_debug:
+            logs.log_debug(
+                'Rescaling "%s" colors to [%d, %d]...',
+                self._visual.kind, self._color_min, self._color_max)
 
         # For each previously passed color mappable...
         for color_mappable in self._color_mappables:
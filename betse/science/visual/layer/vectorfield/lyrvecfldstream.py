@@ -29,7 +29,6 @@ from betse.science.math import mathunit
 from betse.science.visual.layer.vectorfield.lyrvecfldabc import (
     LayerCellsFieldColorlessABC)
 # from betse.util.type.types import type_check
-from matplotlib.patches import FancyArrowPatch
 
 # ....................{ SUBCLASSES                        }....................
 class LayerCellsFieldStream(LayerCellsFieldColorlessABC):
@@ -51,6 +50,17 @@ class LayerCellsFieldStream(LayerCellsFieldColorlessABC):
         step if any *or* ``None`` otherwise, temporarily preserved for only one
         time step to permit its removal prior to plotting a new streamplot for
         the current time step.
+    _stream_arrows : list
+        List of all streamline arrowheads (i.e., :class:`FancyArrowPatch`
+        instances) previously plotted for the prior time step if any *or* the
+        empty list otherwise, temporarily preserved for the same reason.
+    _stream_time_step : int
+        0-based time step of the vector field plotted by :attr:`_stream_plot`
+        if any *or* ``None`` otherwise. If the X and Y components of this field
+        for the current time step are identical to those for this time step
+        (e.g., as is common for simulations approaching steady state), the
+        :meth:`_layer_next` method preserves this streamplot as is rather than
+        recomputing an identical streamplot.
     '''
 
     # ..................{ INITIALIZERS                      }..................
@@ -61,6 +71,8 @@ class LayerCellsFieldStream(LayerCellsFieldColorlessABC):
 
         # Default all remaining instance variables.
         self._stream_plot = None
+        self._stream_arrows = []
+        self._stream_time_step = None
 
     # ..................{ SUPERCLASS                        }..................
     def _layer_first(self) -> None:
@@ -91,6 +103,9 @@ class LayerCellsFieldStream(LayerCellsFieldColorlessABC):
         streamlines_width = (
             3.0 * field_magnitudes / field_magnitude_max) + 0.5
 
+        # Number of patches previously added to these axes.
+        patches_count = len(self._visual.axes.patches)
+
         # Streamplot of all streamlines plotted for this time step. See the
         # matplotlib.streamplot.streamplot() docstring for further details.
         self._stream_plot = self._visual.axes.streamplot(
@@ -122,6 +137,15 @@ class LayerCellsFieldStream(LayerCellsFieldColorlessABC):
             zorder=self._zorder,
         )
 
+        # Record the time step of this streamplot.
+        self._stream_time_step = self._visual.time_step
+
+        # List of all streamline arrowheads plotted for this time step. Since
+        # the above call appends these arrowheads as patches to these axes,
+        # these arrowheads are exactly the patches following those previously
+        # added to these axes.
+        self._stream_arrows = self._visual.axes.patches[patches_count:]
+
 
     def _layer_next(self) -> None:
         '''
@@ -129,41 +153,37 @@ class LayerCellsFieldStream(LayerCellsFieldColorlessABC):
         step onto the figure axes of the current plot or animation.
         '''
 
+        # Vector field whose X and Y components are spatially situated at grid
+        # space centres.
+        field = self._field.times_grids_centre
+
+        # If this vector field is unchanged since the prior streamplot, preserve
+        # that streamplot as is. Since comparing these components is linear in
+        # the number of grid spaces, doing so is substantially faster than
+        # integrating a new streamplot from identical components.
+        time_step = self._visual.time_step
+        if (
+            np.array_equal(field.x[time_step], field.x[self._stream_time_step])
+            and
+            np.array_equal(field.y[time_step], field.y[self._stream_time_step])
+        ):
+            return
+
         # Remove all streamlines plotted for the prior time step.
         self._stream_plot.lines.remove()
 
-        # If this matplotlib version supports removing the set of all streamline
-        # arrowheads plotted for the prior time step, do so.
-        try:
-            self._stream_plot.arrows.remove()
-        # Else, these arrowheads *MUST* be manually erased by iterating over all
-        # patch objects and preserving all non-arrowhead patches. Doing so also
-        # removes all arrowhead patches of other visuals already plotted for
-        # this time step and is hence non-ideal. But no alternatives exist.
-        except NotImplementedError:
-            #FIXME: This simplistic approach *USED* to work. For unknown and
-            #presumably indefensible reason, some undisclosed newer version of
-            #matplotlib silently broke backward compatibility by preventing this
-            #from working. This now raises the unreadable exception:
-            #    AttributeError: can't set attribute 'patches'
-            #Sadly, no one else has reported a similar issue on the matplotlib
-            #issue tracker. We thus have no recourse but to attempt a completely
-            #different workaround now. *sigh*
-            # self._visual.axes.patches = [
-            #     patch
-            #     for patch in self._visual.axes.patches
-            #     if not isinstance(patch, FancyArrowPatch)
-            # ]
-
-            # Rather than attempting to replace the entire axes patches, instead
-            # selectively search for and remove *ALL* arrow-specific axes
-            # patches. Again, this is highly non-ideal. It is what it is.
-            #
-            # This workaround is strongly inspired by this StackOverflow answer:
-            #     https://stackoverflow.com/a/61932726/5049231
-            for artist in self._visual.axes.get_children():
-                if isinstance(artist, FancyArrowPatch):
-                    artist.remove()
+        # Remove all streamline arrowheads plotted for the prior time step.
+        #
+        # Note that the "StreamplotSet.arrows" collection returned by the
+        # Axes.streamplot() method is *NOT* actually added to these axes and
+        # thus *CANNOT* be removed (i.e., attempting to do so raises a
+        # "NotImplementedError" exception). Instead, that method adds each
+        # arrowhead to these axes as a discrete patch, which the _layer_first()
+        # method records. Removing only these patches is both more efficient
+        # than searching all artists of these axes for arrowheads *AND* safer,
+        # as doing so preserves the arrowheads of all other visuals.
+        for stream_arrow in self._stream_arrows:
+            stream_arrow.remove()
 
         # Replot this streamplot for this time step.
         self._layer_first()
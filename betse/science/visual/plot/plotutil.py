@@ -12,6 +12,7 @@ import matplotlib.cm as cm
 import matplotlib.pyplot as plt
 import numpy as np
 import numpy.ma as ma
+from betse.lib.numpy import nparray
 # from betse.util.io.log import logs
 from matplotlib.collections import LineCollection, PolyCollection
 from scipy import interpolate
@@ -19,7 +20,9 @@ from scipy import interpolate
 # ....................{ PLOTTERS                           }....................
 def plotSingleCellVData(sim,celli,p,fig=None,ax=None, lncolor='k'):
 
-    tvect_data=[x[celli]*1000 for x in sim.vm_time]
+    # Stack each time series once and slice this cell from all time steps at
+    # once rather than indexing and upscaling each time step separately.
+    tvect_data = 1000*nparray.from_iterable(sim.vm_time)[:, celli]
 
     if fig is None:
         fig = plt.figure()# define the figure and axes instances
@@ -29,7 +32,8 @@ def plotSingleCellVData(sim,celli,p,fig=None,ax=None, lncolor='k'):
     ax.plot(sim.time, tvect_data,lncolor,linewidth=2.0)
 
     if p.GHK_calc is True:
-        tvect_data_ghk = [x[p.visual.single_cell_index]*1000 for x in sim.vm_GHK_time]
+        tvect_data_ghk = 1000*nparray.from_iterable(
+            sim.vm_GHK_time)[:, p.visual.single_cell_index]
         ax.plot(sim.time, tvect_data_ghk,'r',linewidth=2.0)
 
     ax.set_xlabel('Time [s]')
@@ -39,12 +43,10 @@ def plotSingleCellVData(sim,celli,p,fig=None,ax=None, lncolor='k'):
 
 def plotSingleCellCData(simdata_time,simtime,ioni,celli,fig=None,ax=None,lncolor='b',ionname='ion'):
 
-    # ccIon_cell = [arr[ioni][celli] for arr in simdata_time]
-    ccIon_cell = []
-
-    for carray in simdata_time:
-        conc = carray[ioni][celli]
-        ccIon_cell.append(conc)
+    # Slice this ion in this cell from all time steps at once. Since the
+    # simulator stacks ion concentrations after solving, this avoids both
+    # copying and iterating over these concentrations.
+    ccIon_cell = nparray.from_iterable(simdata_time)[:, ioni, celli]
 
     if fig is None:
         fig = plt.figure()# define the figure and axes instances
@@ -62,7 +64,7 @@ def plotSingleCellCData(simdata_time,simtime,ioni,celli,fig=None,ax=None,lncolor
 
 def plotSingleCellData(simtime,simdata_time,celli,fig=None,ax=None,lncolor='b',lab='Data'):
 
-    data_cell = [arr[celli] for arr in simdata_time]
+    data_cell = nparray.from_iterable(simdata_time)[:, celli]
 
     if fig is None:
         fig = plt.figure()# define the figure and axes instances
@@ -108,7 +110,7 @@ def plotFFT(simtime,simdata_time,celli,fig=None,ax=None,lncolor='b',lab='Data'):
     sample_size = len(simtime)
     sample_spacing = simtime[1] - simtime[0]
 
-    cell_data_o = [arr[celli] for arr in simdata_time]
+    cell_data_o = nparray.from_iterable(simdata_time)[:, celli]
     # membranes_midpoint_data = ((1/sample_size)*(cell_data_o/np.mean(cell_data_o)) )   # normalize the signal
     cell_data = (1/sample_size)*(cell_data_o - np.mean(cell_data_o))
 
@@ -32,18 +32,19 @@ Abstract base classes of all Matplotlib-based plot and animation subclasses.
 
 # ....................{ IMPORTS                            }....................
 import numpy as np
+import time
 from abc import ABCMeta
 from betse.exceptions import BetseSimVisualException
 from betse.lib.matplotlib import mplfigure
 from betse.lib.matplotlib.matplotlibs import mpl_config
 from betse.lib.matplotlib.mplzorder import ZORDER_PATCH, ZORDER_STREAM
 from betse.lib.matplotlib.mplutil import ignoring_deprecations_mpl
-from betse.lib.numpy import nparray
 from betse.science.config.export.visual.confexpvisabc import (
     SimConfVisualCellsABC)
 from betse.science.math import mathunit
 from betse.science.phase.phasecls import SimPhase
 from betse.util.io.log import logs
+from betse.util.io.log.logenum import LogLevel
 from betse.util.py import pyref
 from betse.util.type import types
 from betse.util.type.iterable import iterget
@@ -67,6 +68,31 @@ from matplotlib.image import AxesImage
 from matplotlib.patches import FancyArrowPatch
 from matplotlib.streamplot import StreamplotSet
 
+# ....................{ CONSTANTS                          }....................
+VISUAL_DTYPE = np.float32
+'''
+Numpy data type of all time series stacked by animations *after* those series
+have been retrieved from the simulation (e.g., by the
+:class:`betse.science.visual.anim.anim.AnimFlatCellsTimeSeries` class).
+
+These series are only ever mapped onto colormaps of at most a few hundred
+colours, for which double precision is wasted. Halving the size of each frame
+halves the memory traffic of slicing, autoscaling, and handing that frame to
+matplotlib. Simulation data and caches shared with non-visual exports (e.g.,
+CSV files) remain double precision.
+'''
+
+_LOG_FRAME_INTERVAL_SECONDS = 0.1
+'''
+Minimum number of fractional seconds between two consecutive debug messages
+logged by the :meth:`VisualCellsABC.plot_frame` method, rate-limiting these
+messages to at most ten per second.
+
+Since frames are typically exported far faster than this, logging each such
+frame would otherwise flood the log (and synchronize the standard error stream)
+with one message per frame when debugging.
+'''
+
 # ....................{ SUPERCLASSES                       }....................
 class VisualCellsABC(object, metaclass=ABCMeta):
     '''
@@ -94,6 +120,12 @@ class VisualCellsABC(object, metaclass=ABCMeta):
     _layers : list
         List of all :class:`LayerCellsABC` instances collectively composing
         this visual.
+    _layer_calls : tuple
+        Tuple of the bound :meth:`LayerCellsABC.layer` methods of all layers in
+        the :attr:`_layers` list, frozen by the :meth:`_prep_layers` method
+        *after* finalizing that list. Iterating this tuple rather than that
+        list avoids repeatedly resolving the same bound method of each layer
+        for each frame.
     _phase : SimPhase
         Current simulation phase.
 
@@ -147,11 +179,56 @@ class VisualCellsABC(object, metaclass=ABCMeta):
         * Enables the ``transparent`` argument, painting frame backgrounds
           transparently rather than as a solid color (usually, white).
 
+        This dictionary should *not* contain the ``bbox_inches`` argument.
+        Tight bounding boxes both double the cost of saving each frame *and*
+        produce frames of varying dimensions and are thus ignored when saving
+        animation frames.
+    _grab_frame_images : CallableTypes
+        :meth:`MovieWriter.grab_frame` method of the writer saving frames as
+        images, pre-bound to :attr:`_writer_savefig_kwargs` if doing so *or*
+        ``None`` otherwise.
+    _grab_frame_video : CallableTypes
+        :meth:`MovieWriter.grab_frame` method of the writer saving frames as
+        video, pre-bound to :attr:`_writer_savefig_kwargs` if doing so *or*
+        ``None`` otherwise.
+    _is_writer_video_verbose : bool
+        ``True`` only if the matplotlib-specific verbosity level has already
+        been escalated for the duration of all frames saved as video, in which
+        case this level need *not* be escalated again for each such frame.
+
+    Attributes (Private: Logging)
+    ----------
+    _is_log_debug : bool
+        ``True`` only if debug messages were logged when this visual was
+        initialized, in which case the :meth:`plot_frame` method logs frames
+        exported by this visual.
+    _log_time_last : float
+        Fractional seconds as reported by the :func:`time.perf_counter`
+        function at which the :meth:`plot_frame` method last logged a frame
+        *or* negative infinity if no frame has been logged yet, guaranteeing
+        that the first frame is always logged. Subsequent frames are logged
+        only if at least :data:`_LOG_FRAME_INTERVAL_SECONDS` have elapsed
+        since this time.
+
     Attributes (Private: Time)
     ----------
     _is_time_step_first : bool
         ``True`` only if the first frame either has yet to be plotter *or* is
         currently being plotted.
+    _times : SequenceTypes
+        Sequence of all sampled simulation times in seconds for this phase,
+        indexed by the 0-based time step of each frame. Defaults to the
+        :attr:`Simulator.time` list, which mid-simulation visuals require to
+        reflect time steps sampled *after* this visual was initialized.
+        Post-simulation visuals may replace this list with an equivalent
+        contiguous Numpy array.
+    _time_unit_factor : NumericSimpleTypes
+        Factor by which each simulation time in :attr:`_times` is multiplied
+        to yield a human-readable time in the units of
+        :attr:`_time_unit_suffix`.
+    _time_unit_suffix : str
+        Human-readable suffix of the units in which simulation times are
+        reported (e.g., ``ms`` for milliseconds).
     '''
 
     # ..................{ INITIALIZERS                       }..................
@@ -251,6 +328,7 @@ class VisualCellsABC(object, metaclass=ABCMeta):
         # the passed sequence. To validate the type of each such layer, call an
         # existing method rather than manually performing this conversion.
         self._layers = []
+        self._layer_calls = ()
         self._append_layer(*layers)
 
         # If autoscaling colors, ignore the passed minimum and maximum. To
@@ -267,12 +345,25 @@ class VisualCellsABC(object, metaclass=ABCMeta):
 
         # Default all attributes to be subsequently defined.
         self._color_mappables = None
-        self._writer_frames = None
+        self._grab_frame_images = None
+        self._grab_frame_video = None
+        self._is_writer_video_verbose = False
+        self._writer_images = None
         self._writer_video = None
 
         # Default all remaining attributes.
         self._is_time_step_first = True
 
+        # Decide whether debug messages are logged exactly once here rather
+        # than in the plot_frame() method called for each frame.
+        self._is_log_debug = logs.is_level_logged(LogLevel.DEBUG)
+        self._log_time_last = float('-inf')
+        self._times = self._phase.sim.time
+
+        # Units of all simulation times reported by this visual *AFTER*
+        # classifying this phase.
+        self._init_time_units()
+
         # Dictionary of keyword arguments to be passed to Figure.savefig().
         self._writer_savefig_kwargs = {
             # Visualize frame backgrounds transparently rather than solid.
@@ -282,6 +373,48 @@ class VisualCellsABC(object, metaclass=ABCMeta):
         # Initialize this plot's figure *AFTER* defining all attributes.
         self._init_figure()
 
+    def _init_time_units(self) -> None:
+        '''
+        Classify the units in which simulation times are reported by this
+        visual (e.g., in frame titles).
+
+        Since these units depend only on the duration of the current phase,
+        these units are computed exactly once here rather than for each frame.
+        '''
+
+        #FIXME: Shift into a new "betse.util.time.times" submodule.
+
+        # Number of seconds in a minute.
+        SECONDS_PER_MINUTE = 60
+
+        # Number of seconds in an hour.
+        SECONDS_PER_HOUR = SECONDS_PER_MINUTE * 60
+
+        # Duration in seconds of the current simulation phase.
+        time_len = self._phase.p.total_time
+
+        # If this phase runs for less than or equal to 100ms, report
+        # simulation time in milliseconds (i.e., units of 0.001s).
+        if time_len <= 0.1:
+            self._time_unit_suffix = 'ms'
+            self._time_unit_factor = 1e3
+        # Else if this phase runs for less than or equal to one minute, report
+        # simulation time in seconds (i.e., units of 1s).
+        elif time_len <= SECONDS_PER_MINUTE:
+            self._time_unit_suffix = 's'
+            self._time_unit_factor = 1
+        # Else if this phase runs for less than or equal to one hour, report
+        # simulation time in minutes (i.e., units of 60s).
+        elif time_len <= SECONDS_PER_HOUR:
+            self._time_unit_suffix = ' minutes'
+            self._time_unit_factor = 1/SECONDS_PER_MINUTE
+        # Else, this phase is assumed to run for less than or equal to one day.
+        # In this case, simulation time is reported in hours (i.e., units of
+        # 60*60s).
+        else:
+            self._time_unit_suffix = ' hours'
+            self._time_unit_factor = 1/SECONDS_PER_HOUR
+
     # ..................{ INITIALIZERS ~ figure              }..................
     def _init_figure(self) -> None:
         '''
@@ -637,6 +770,10 @@ class VisualCellsABC(object, metaclass=ABCMeta):
             # Prepare this layer.
             layer.prep(visual=self, zorder=layer_zorder)
 
+        # Freeze the bound layering method of each such layer exactly once
+        # here rather than repeatedly resolving these methods for each frame.
+        self._layer_calls = tuple(layer.layer for layer in self._layers)
+
 
     def _plot_layers(self) -> None:
         '''
@@ -657,8 +794,8 @@ class VisualCellsABC(object, metaclass=ABCMeta):
             efficient and hence least ideal approach.
         '''
 
-        for layer in self._layers:
-            layer.layer()
+        for layer_call in self._layer_calls:
+            layer_call()
 
     # ..................{ COLORS                             }..................
     #FIXME: All methods in this subsection including this method are obsolete.
@@ -771,9 +908,13 @@ class VisualCellsABC(object, metaclass=ABCMeta):
         # permitting efficient retrieval of minimum and maximum values.
         time_series_flat = np.ravel(color_data)
 
-        # Set the current minimum and maximum color values.
-        self._color_min = np.ma.min(time_series_flat)
-        self._color_max = np.ma.max(time_series_flat)
+        # Set the current minimum and maximum color values. Since np.ravel()
+        # preserves masked arrays, the min() and max() methods of this array
+        # still ignore masked values when passed masked data *WITHOUT*
+        # coercing unmasked data into a masked array, which the np.ma.min()
+        # and np.ma.max() functions do for each call.
+        self._color_min = time_series_flat.min()
+        self._color_max = time_series_flat.max()
 
         # Log these values.
         logs.log_debug(
@@ -847,10 +988,6 @@ class VisualCellsABC(object, metaclass=ABCMeta):
 
     # ..................{ PLOTTERS                           }..................
     #FIXME: For generality, rename this method to visualize_time_step().
-    #FIXME: For "PlotAfterSolving"-style plots, the first frame is uselessly
-    #plotted twice. Investigate up this insanity, please. We might consider
-    #simply ignoring the first call to this method if we can't get to the
-    #ultimate bottom of this. Clearly, a matplotlib issue is implicated.
 
     @type_check
     def plot_frame(self, time_step: int) -> None:
@@ -886,15 +1023,20 @@ class VisualCellsABC(object, metaclass=ABCMeta):
         # this index is assumed to be the last index of the current
         # simulation's array of time steps.
         if time_step == -1:
-            time_step_absolute = len(self._phase.sim.time) - 1
+            time_step_absolute = len(self._times) - 1
         # Else, the passed index is already absolute and hence used as is.
         else:
             time_step_absolute = time_step
 
-        # Log this animation frame.
-        logs.log_debug(
-            'Exporting "%s" frame %d / %d...',
-            self._kind, time_step_absolute, self._time_step_last)
+        # If logging debug messages, log this animation frame only if no frame
+        # has been logged in the last fraction of a second.
+        if self._is_log_debug:
+            log_time = time.perf_counter()
+            if log_time - self._log_time_last >= _LOG_FRAME_INTERVAL_SECONDS:
+                self._log_time_last = log_time
+                logs.log_debug(
+                    'Exporting "%s" frame %d / %d...',
+                    self._kind, time_step_absolute, self._time_step_last)
 
         # Classify this time step for subsequent access by subclasses.
         self._time_step = time_step
@@ -931,60 +1073,12 @@ class VisualCellsABC(object, metaclass=ABCMeta):
         be replotted for each animation frame.
         '''
 
-        #FIXME: Shift into a new "betse.util.time.times" submodule.
-
-        # Number of seconds in a minute.
-        SECONDS_PER_MINUTE = 60
-
-        # Number of seconds in an hour.
-        SECONDS_PER_HOUR = SECONDS_PER_MINUTE * 60
-
-        #FIXME: For efficiency, classify the following local variables as
-        #object attributes in the __init__() method rather than recompute these
-        #variables each animation frame here.
-
-        # Human-readable suffix of the units that simulation times are reported
-        # in (e.g., "ms" for milliseconds).
-        time_unit_suffix = None
-
-        # Factor by which low-level simulation times are multiplied to yield
-        # human-readable simulation times in the same units of
-        # "time_unit_suffix".
-        time_unit_factor = None
-
-        # Duration in seconds of the current simulation phase.
-        time_len = self._phase.p.total_time
-
-        # If this phase runs for less than or equal to 100ms, report
-        # simulation time in milliseconds (i.e., units of 0.001s).
-        if time_len <= 0.1:
-            time_unit_suffix = 'ms'
-            time_unit_factor = 1e3
-        # Else if this phase runs for less than or equal to one minute, report
-        # simulation time in seconds (i.e., units of 1s).
-        elif time_len <= SECONDS_PER_MINUTE:
-            time_unit_suffix = 's'
-            time_unit_factor = 1
-        # Else if this phase runs for less than or equal to one hour, report
-        # simulation time in minutes (i.e., units of 60s).
-        elif time_len <= SECONDS_PER_HOUR:
-            time_unit_suffix = ' minutes'
-            time_unit_factor = 1/SECONDS_PER_MINUTE
-        # Else, this phase is assumed to run for less than or equal to one day.
-        # In this case, simulation time is reported in hours (i.e., units of
-        # 60*60s).
-        else:
-            time_unit_suffix = ' hours'
-            time_unit_factor = 1/SECONDS_PER_HOUR
-
         # Current time adjusted for long/short simulation.
-        time_accelerated = (
-            time_unit_factor *
-            self._phase.sim.time[self._time_step])
+        time_accelerated = self._time_unit_factor * self._times[self._time_step]
 
         # Update this figure with this time, rounded to one decimal place.
         self._axes.set_title('{} (time: {:.1f}{})'.format(
-            self._axes_title, time_accelerated, time_unit_suffix,))
+            self._axes_title, time_accelerated, self._time_unit_suffix,))
 
 
     def _show_frame(self, time_step_absolute: int) -> None:
@@ -1078,16 +1172,19 @@ class VisualCellsABC(object, metaclass=ABCMeta):
             return
 
         # If saving animation frames as images, save this frame as such.
-        if self._writer_images is not None:
-            self._writer_images.grab_frame(**self._writer_savefig_kwargs)
+        if self._grab_frame_images is not None:
+            self._grab_frame_images()
 
         # If saving animation frames as video, save this frame as such.
-        if self._writer_video is not None:
-            # For debuggability, temporarily escalate the
-            # matplotlib-specific verbosity level.
-            with mpl_config.reducing_log_level_to_debug_if_info():
-                self._writer_video.grab_frame(
-                    **self._writer_savefig_kwargs)
+        if self._grab_frame_video is not None:
+            # If the matplotlib-specific verbosity level has already been
+            # escalated for the duration of all frames, save this frame as is.
+            if self._is_writer_video_verbose:
+                self._grab_frame_video()
+            # Else, temporarily escalate this level for debuggability.
+            else:
+                with mpl_config.reducing_log_level_to_debug_if_info():
+                    self._grab_frame_video()
 
         # If this is the last frame to be plotted, finalize all writers
         # *AFTER* instructing these writers to write this frame.
@@ -1413,11 +1510,14 @@ class VisualCellsABC(object, metaclass=ABCMeta):
             assert types.is_matplotlib_polycollection(cell_plot), (
                 types.assert_not_matplotlib_polycollection(cell_plot))
 
-            # Update this plot in-place.
-            cell_plot.set_array(cell_data)
+            # Update this plot in-place rather than recreating this plot,
+            # reusing this polygon collection regardless of whether the number
+            # of cells has changed. Cell vertices are upscaled exactly as the
+            # _plot_cell_mosaic() method does when originally creating this
+            # plot, avoiding an intermediate array of these vertices.
             cell_plot.set_verts(
-                nparray.from_iterable(self._phase.cells.cell_verts) *
-                self._phase.p.um)
+                mathunit.upscale_coordinates(self._phase.cells.cell_verts))
+            cell_plot.set_array(cell_data)
 
             # Return the same plot.
             return cell_plot
@@ -1427,6 +1527,11 @@ class VisualCellsABC(object, metaclass=ABCMeta):
             assert types.is_matplotlib_trimesh(cell_plot), (
                 types.assert_not_matplotlib_trimesh(cell_plot))
 
+            #FIXME: Since the "TriMesh" API provides no public means of
+            #replacing the triangulation of an existing mesh, this mesh is
+            #recreated (and the cell cluster retriangulated) on each revival.
+            #If matplotlib ever exposes such a setter, update this mesh in-place
+            #as above instead.
             cell_plot.remove()
             return self._plot_cell_mesh(cell_data=cell_data, *args, **kwargs)
 
@@ -660,12 +660,12 @@ class BetseWrapper(object):
         # corresponding to the passed verbosity.
         if self._log_level is None:
             if verbose:
-                log_config.handler_stdout.setLevel(LogLevel.INFO)
+                log_config.stdout_level = LogLevel.INFO
             else:
-                log_config.handler_stdout.setLevel(LogLevel.WARNING)
+                log_config.stdout_level = LogLevel.WARNING
         # Else, the user has set a log level. In this case, apply it.
         else:
-            log_config.handler_stdout.setLevel(self._log_level)
+            log_config.stdout_level = self._log_level
 
 
     @beartype
@@ -16,15 +16,29 @@ High-level logging configuration classes.
 # scoping level, circularities are best avoided here rather than elsewhere.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
-import logging, os, sys
+import atexit, logging, os, sys
 from beartype import beartype
+from beartype.typing import Generator
 from betse.util.io.log.logenum import LogLevel
 from betse.util.type.types import type_check
+from contextlib import contextmanager
 from logging import (
     Handler,
     RootLogger,
     StreamHandler,
 )
+from queue import SimpleQueue
+
+# ....................{ GLOBALS                            }....................
+_LOG_DIRNAMES_MADE = set()
+'''
+Set of the dirnames of all directories containing logfiles previously created
+if needed by the :meth:`LogConf._init_logger_root_handler_file` method.
+
+This set avoids redundantly querying the filesystem for these directories each
+time the logfile handler is recreated (e.g., on each change to the logfile
+filename and each reinitialization of logging by functional tests).
+'''
 
 # ....................{ CONFIG                             }....................
 #FIXME: Update docstring to reflect the new default configuration.
@@ -91,6 +105,16 @@ class LogConf(object):
         defaulting to :meth:`app_meta.log_default_filename`.
     _logger_root : Logger
         Root logger.
+    _logger_root_handler_queue : LogHandlerQueue
+        Root logger handler enqueueing log records for the
+        :attr:`_logger_root_listener` thread. This is the only handler directly
+        added to the root logger; the stdout, stderr, and file handlers below
+        are instead called by that thread, offloading all stream and file I/O
+        from the calling thread.
+    _logger_root_listener : LogListenerQueue
+        Background thread dispatching log records enqueued by the
+        :attr:`_logger_root_handler_queue` handler to the stdout, stderr, and
+        file handlers below.
     _logger_root_handler_file : Handler
         Root logger handler appending to the current logfile.
     _logger_root_handler_stderr : Handler
@@ -123,9 +147,10 @@ class LogConf(object):
         self._init_logger_root()
 
         # Initialize root logger handlers *AFTER* the root logger, as the
-        # former explicitly add themselves to the latter.
+        # last of these handlers explicitly adds itself to the latter.
         self._init_logger_root_handler_std()
         self._init_logger_root_handler_file()
+        self._init_logger_root_handler_queue()
 
         # Redirect all warnings through the logging framewark *AFTER*
         # successfully performing the above initialization.
@@ -161,7 +186,12 @@ class LogConf(object):
         # Instruct this logger to entertain all log requests, ensuring these
         # requests will be delegated to the handlers defined below. By default,
         # this logger ignores all log requests with level less than "WARNING",
-        # preventing handlers from receiving these requests.
+        # preventing handlers from receiving these requests. Since external
+        # handlers (e.g., pytest's "caplog" fixture) may also be added to this
+        # logger, this level is intentionally *NOT* restricted to the levels
+        # of the handlers defined below. Instead, the root queue handler
+        # defined below rejects all log records accepted by none of these
+        # handlers *BEFORE* enqueueing these records.
         self._logger_root.setLevel(LogLevel.ALL)
 
         # Safely remove all existing handlers from the root logger *BEFORE*
@@ -180,22 +210,25 @@ class LogConf(object):
         '''
 
         # Avoid circular import dependencies.
-        from betse.util.io.log.logfilter import (
-            LogFilterThirdPartyDebug, LogFilterMoreThanInfo)
-        from betse.util.io.log.conf.logconfformat import LogFormatterWrap
+        from betse.util.io.log.conf.logconfhandle import (
+            LogHandlerStreamSansWarnings)
+        from betse.util.io.log.conf.logconfformat import LogFormatterPrefix
         from betse.util.os.command import cmds
 
         # Initialize the stdout handler to:
         #
         # * Log only informational messages by default.
         # * Unconditionally ignore all warning and error messages, which the
-        #   stderr handler already logs.
+        #   stderr handler already logs. Since this handler ignores these
+        #   messages regardless of level, this remains the case even when the
+        #   level of this handler is lowered (e.g., by the "is_verbose"
+        #   property setter).
         #
         # Sadly, the "StreamHandler" constructor does *NOT* accept the
         # customary "level" attribute accepted by its superclass constructor.
-        self._logger_root_handler_stdout = StreamHandler(sys.stdout)
+        self._logger_root_handler_stdout = LogHandlerStreamSansWarnings(
+            sys.stdout)
         self._logger_root_handler_stdout.setLevel(LogLevel.INFO)
-        self._logger_root_handler_stdout.addFilter(LogFilterMoreThanInfo())
 
         # Initialize the stderr handler to:
         #
@@ -205,32 +238,22 @@ class LogConf(object):
         self._logger_root_handler_stderr = StreamHandler(sys.stderr)
         self._logger_root_handler_stderr.setLevel(LogLevel.WARNING)
 
-        # Avoid printing third-party debug messages to the terminal.
-        self._logger_root_handler_stdout.addFilter(LogFilterThirdPartyDebug())
-        self._logger_root_handler_stderr.addFilter(LogFilterThirdPartyDebug())
-
         #FIXME: Consider colourizing this format string.
 
-        # Format standard output and error in the conventional way. For a list
-        # of all available log record attributes, see:
-        #
-        #     https://docs.python.org/3/library/logging.html#logrecord-attributes
-        #
-        # Note that "{{" and "}}" substrings in format() strings escape literal
-        # "{" and "}" characters, respectively.
-        stream_format = '[{}] {{message}}'.format(cmds.get_current_basename())
-
-        # Formatter for this format.
-        stream_formatter = LogFormatterWrap(fmt=stream_format, style='{')
-
-        # Assign these formatters to these handlers.
+        # Format standard output and error in the conventional way: as each
+        # message prefixed by the basename of the current process. Since this
+        # prefix is constant, this formatter merely concatenates this prefix
+        # with each message rather than interpolating an equivalent format
+        # string (e.g., "[betse] {message}") for each log record.
+        stream_formatter = LogFormatterPrefix(
+            prefix='[{}] '.format(cmds.get_current_basename()))
+
+        # Assign these formatters to these handlers. Note that these handlers
+        # are registered with the queue handler rather than the root logger by
+        # the _init_logger_root_handler_queue() method.
         self._logger_root_handler_stdout.setFormatter(stream_formatter)
         self._logger_root_handler_stderr.setFormatter(stream_formatter)
 
-        # Register these handlers with the root logger.
-        self._logger_root.addHandler(self._logger_root_handler_stdout)
-        self._logger_root.addHandler(self._logger_root_handler_stderr)
-
 
     def _init_logger_root_handler_file(self) -> None:
         '''
@@ -242,7 +265,6 @@ class LogConf(object):
         '''
 
         # Avoid circular import dependencies.
-        from betse.util.io.log.logfilter import LogFilterThirdPartyDebug
         from betse.util.io.log.conf.logconfformat import LogFormatterWrap
         from betse.util.io.log.conf.logconfhandle import (
             LogHandlerFileRotateSafe)
@@ -261,11 +283,15 @@ class LogConf(object):
             # Preserve the previously set minimum level of messages to log.
             file_level = self._logger_root_handler_file.level
 
-            # If the root logger has also already been created, deinitialize
-            # this handler from this root logger.
-            if self._logger_root is not None:
-                self._deinit_logger_root_handler(
-                    self._logger_root_handler_file)
+            # If the listener thread has also already been started, halt this
+            # thread *BEFORE* closing this handler. Doing so outputs all log
+            # records already enqueued for this handler, which would otherwise
+            # silently reopen this handler's logfile after closing it below.
+            if self._logger_root_listener is not None:
+                self._logger_root_listener.stop()
+
+            # Close this handler's logfile handle.
+            self._logger_root_handler_file.close()
 
         # If the dirname of the directory containing this file is non-empty,
         # create this directory if needed. Note this dirname is empty when this
@@ -277,8 +303,12 @@ class LogConf(object):
         # dirs.make_parent_unless_dir() function. The latter logs this
         # creation. Since the root logger is *NOT* fully configured yet,
         # calling that function here would induce subtle errors or exceptions.
-        if file_dirname:
+        #
+        # For efficiency, this directory is only created if this directory has
+        # *NOT* already been created by a prior call to this method.
+        if file_dirname and file_dirname not in _LOG_DIRNAMES_MADE:
             os.makedirs(file_dirname, exist_ok=True)
+            _LOG_DIRNAMES_MADE.add(file_dirname)
 
         # Root logger file handler, preconfigured as documented above.
         self._logger_root_handler_file = LogHandlerFileRotateSafe(
@@ -315,27 +345,185 @@ class LogConf(object):
         # Initialize this handler's level to the previously established level.
         self._logger_root_handler_file.setLevel(file_level)
 
-        # Prevent third-party debug messages from being logged to disk.
-        self._logger_root_handler_file.addFilter(LogFilterThirdPartyDebug())
-
         # Linux-style logfile format.
         #
         # Note that the "processName" attribute appears to *ALWAYS* expand to
         # "MainProcess", which is not terribly descriptive. Hence, the name of
-        # the current process is manually embedded in this format.
+        # the current process is manually embedded in this format, escaping
+        # all "%" characters in this name.
+        #
+        # Note that this format is "%"-style rather than "{"-style, as the
+        # former is interpolated by the C-implemented "%" operator and is thus
+        # faster to format for each log record than the latter.
         file_format = (
-            '[{{asctime}}] '
-            '{} {{levelname}} '
-            '({{module}}.py:{{funcName}}():{{lineno}}) '
-            '<PID {{process}}>:\n'
-            '    {{message}}'.format(cmds.get_current_basename()))
+            '[%(asctime)s] '
+            '{} %(levelname)s '
+            '(%(module)s.py:%(funcName)s():%(lineno)d) '
+            '<PID %(process)d>:\n'
+            '    %(message)s'.format(
+                cmds.get_current_basename().replace('%', '%%')))
 
         # Format this file according to this format.
-        file_formatter = LogFormatterWrap(fmt=file_format, style='{')
+        file_formatter = LogFormatterWrap(fmt=file_format)
         self._logger_root_handler_file.setFormatter(file_formatter)
 
+        # If the queue handler has already been created, this method is being
+        # called to modify the filename of this handler at runtime. In this
+        # case, replace the prior handler with this handler in the queue
+        # handler and restart the listener thread halted above.
+        if self._logger_root_handler_queue is not None:
+            self._logger_root_handler_queue.handlers = (
+                self._get_logger_root_handlers())
+            self._logger_root_listener.start()
+
+
+    def _init_logger_root_handler_queue(self) -> None:
+        '''
+        Initialize the root logger handler enqueueing log messages for the
+        listener thread dispatching these messages to the stdout, stderr, and
+        file handlers in the background.
+
+        This method must be called *after* the methods initializing those
+        handlers.
+        '''
+
+        # Avoid circular import dependencies.
+        from betse.util.io.log.conf.logconfhandle import (
+            LogHandlerQueue, LogListenerQueue)
+        from betse.util.io.log.logfilter import LogFilterThirdPartyDebug
+
+        # Unbounded queue shared between the queue handler and listener thread.
+        # Unlike the "queue.Queue" class, this class avoids the overhead of
+        # tracking unfinished tasks.
+        log_queue = SimpleQueue()
+
+        # Queue handler dispatching to all terminal handlers initialized above.
+        self._logger_root_handler_queue = LogHandlerQueue(
+            queue=log_queue, handlers=self._get_logger_root_handlers())
+
+        # Prevent third-party debug messages from being logged to either the
+        # terminal or disk. Since this filter applies equally to all terminal
+        # handlers, this filter is added once to this handler rather than to
+        # each terminal handler -- avoiding both redundantly filtering each
+        # log record for each terminal handler *AND* enqueueing filtered log
+        # records. Note that this filter *CANNOT* be added to the root logger
+        # instead, as loggers only filter records logged directly to those
+        # loggers rather than records propagated from child loggers (e.g.,
+        # "PIL.PngImagePlugin") -- which is the entire point of this filter.
+        self._logger_root_handler_queue.addFilter(LogFilterThirdPartyDebug())
+
+        # Start the listener thread consuming this queue.
+        self._logger_root_listener = LogListenerQueue(log_queue)
+        self._logger_root_listener.start()
+
+        # Guarantee that all enqueued log records are output at application
+        # shutdown, even if the deinit() method is never called. Since the
+        # "logging" module registers its own shutdown handler *BEFORE* this
+        # handler is registered, this handler is guaranteed to be called first.
+        atexit.register(self._deinit_logger_root_listener)
+
         # Register this handler with the root logger.
-        self._logger_root.addHandler(self._logger_root_handler_file)
+        self._logger_root.addHandler(self._logger_root_handler_queue)
+
+    # ..................{ REINITIALIZERS                     }..................
+    def reinit_forked(self) -> None:
+        '''
+        Reinitialize this logging configuration in a process forked from the
+        process initializing this configuration (e.g., a worker process of a
+        :class:`concurrent.futures.ProcessPoolExecutor` pool).
+
+        Forked processes inherit the root logger handler enqueueing log
+        records but *not* the listener thread consuming these records, which
+        would otherwise silently discard all log records in these processes.
+        This method instead registers the stdout, stderr, and file handlers
+        directly with the root logger, outputting log records synchronously in
+        the calling thread. Since forked processes typically exit without
+        closing these handlers (e.g., via the :func:`os._exit` function), this
+        method also flushes the logfile after writing each log record.
+
+        If this configuration has already been reinitialized, this method
+        silently reduces to a noop.
+        '''
+
+        # Avoid circular import dependencies.
+        from betse.util.io.log.logfilter import LogFilterThirdPartyDebug
+
+        # If the queue handler has already been removed, reduce to a noop.
+        if self._logger_root_handler_queue is None:
+            return
+
+        # Remove the queue handler from the root logger. Since the listener
+        # thread consuming this handler's queue was never forked, this thread
+        # is merely forgotten rather than halted.
+        self._logger_root.removeHandler(self._logger_root_handler_queue)
+        self._logger_root_handler_queue = None
+        self._logger_root_listener = None
+        atexit.unregister(self._deinit_logger_root_listener)
+
+        # Prevent third-party debug messages from being logged. See the
+        # _init_logger_root_handler_queue() method for further details.
+        log_filter = LogFilterThirdPartyDebug()
+
+        # Register each terminal handler directly with the root logger.
+        for root_handler in self._get_logger_root_handlers():
+            root_handler.addFilter(log_filter)
+            self._logger_root.addHandler(root_handler)
+
+        # Flush the logfile after writing each log record.
+        self._logger_root_handler_file.flush_interval = 0
+
+    # ..................{ CONTEXTS                           }..................
+    @contextmanager
+    def halting_listener(self) -> Generator:
+        '''
+        Context manager halting the listener thread for the duration of this
+        context *and* restarting this thread on exiting this context.
+
+        Halting this thread blocks until all log records previously enqueued
+        for this thread have been output. Log records logged within this
+        context are enqueued as usual and output on exiting this context.
+
+        Callers should enter this context before forking the current process
+        (e.g., before submitting the first task to a
+        :class:`concurrent.futures.ProcessPoolExecutor` pool of forked worker
+        processes). Forking while this thread is writing a log record would
+        otherwise leave the locks held by this thread (e.g., the internal lock
+        of the :data:`sys.stdout` buffer) permanently acquired in the forked
+        process, deadlocking that process on its first write to that stream.
+        Forking a multithreaded process is also deprecated under Python 3.12.
+
+        If this thread is *not* running, this context manager is a noop.
+
+        Returns
+        -----------
+        contextlib._GeneratorContextManager
+            Context manager halting this thread as described above.
+
+        Yields
+        -----------
+        None
+            Since this context manager yields no value, the caller's ``with``
+            statement must be suffixed by *no* ``as`` clause.
+        '''
+
+        # Listener thread if running *OR* "None" otherwise, localized to
+        # restart the same thread on exiting this context.
+        listener = self._logger_root_listener
+
+        # If this thread is running...
+        if listener is not None:
+            # Halt this thread.
+            listener.stop()
+
+            # Yield control to the body of the caller's "with" block.
+            try:
+                yield
+            # Restart this thread even if that block raised an exception.
+            finally:
+                listener.start()
+        # Else, this thread is *NOT* running. Reduce to a noop.
+        else:
+            yield
 
     # ..................{ DEINITIALIZERS                     }..................
     def deinit(self) -> None:
@@ -349,9 +537,18 @@ class LogConf(object):
             Further details.
         '''
 
+        # Halt the listener thread *BEFORE* closing the handlers called by
+        # this thread, outputting all log records enqueued for these handlers.
+        self._deinit_logger_root_listener()
+
         # Deinitialize all root logger handlers.
         self._deinit_logger_root_handlers()
 
+        # Close all open file handles associated with all terminal handlers,
+        # including the logfile handle opened by the __init__() method.
+        for root_handler in self._get_logger_root_handlers():
+            root_handler.close()
+
         # Deinitialize all instance variables.
         self._deinit_vars()
 
@@ -396,6 +593,26 @@ class LogConf(object):
         self._logger_root.removeHandler(root_handler)
 
 
+    def _deinit_logger_root_listener(self) -> None:
+        '''
+        Halt the listener thread if this thread is running *or* silently
+        reduce to a noop otherwise.
+
+        Halting this thread blocks until all log records previously enqueued
+        for this thread have been output.
+        '''
+
+        # If this thread is running...
+        if self._logger_root_listener is not None:
+            # Halt this thread.
+            self._logger_root_listener.stop()
+            self._logger_root_listener = None
+
+            # Unregister this method as a shutdown handler, preventing this
+            # configuration from being kept alive until application shutdown.
+            atexit.unregister(self._deinit_logger_root_listener)
+
+
     def _deinit_vars(self) -> None:
         '''
         Deinitialize all instance variables underlying this logging
@@ -412,9 +629,29 @@ class LogConf(object):
         self._filename = appmetaone.get_app_meta().log_default_filename
         self._logger_root = None
         self._logger_root_handler_file = None
+        self._logger_root_handler_queue = None
+        self._logger_root_listener = None
         self._logger_root_handler_stderr = None
         self._logger_root_handler_stdout = None
 
+    # ..................{ GETTERS                            }..................
+    def _get_logger_root_handlers(self) -> tuple:
+        '''
+        Tuple of all **terminal root logger handlers** (i.e., handlers
+        physically writing log records to standard output, standard error, or
+        disk rather than enqueueing these records) that have been initialized.
+        '''
+
+        return tuple(
+            root_handler
+            for root_handler in (
+                self._logger_root_handler_stdout,
+                self._logger_root_handler_stderr,
+                self._logger_root_handler_file,
+            )
+            if root_handler is not None
+        )
+
     # ..................{ PROPERTIES ~ logger                }..................
     # Read-only properties prohibiting write access to external callers.
 
@@ -473,6 +710,25 @@ class LogConf(object):
 
         self._logger_root_handler_file.setLevel(file_level)
 
+
+    @property
+    def stdout_level(self) -> LogLevel:
+        '''
+        Minimum level of messages to log to the stdout handler.
+        '''
+
+        return self._logger_root_handler_stdout.level
+
+
+    @stdout_level.setter
+    @type_check
+    def stdout_level(self, stdout_level: LogLevel) -> None:
+        '''
+        Set the minimum level of messages to log to the stdout handler.
+        '''
+
+        self._logger_root_handler_stdout.setLevel(stdout_level)
+
     # ..................{ PROPERTIES ~ level : verbose       }..................
     @property
     def is_verbose(self) -> bool:
@@ -506,8 +762,7 @@ class LogConf(object):
         from betse.util.io.log import logs
 
         # Convert the passed boolean to a logging level for the stdout handler.
-        self._logger_root_handler_stdout.setLevel(
-            LogLevel.ALL if is_verbose else LogLevel.INFO)
+        self.stdout_level = LogLevel.ALL if is_verbose else LogLevel.INFO
 
         # If increasing stdout verbosity, log this fact *AFTER* doing so.
         #
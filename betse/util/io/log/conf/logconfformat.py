@@ -16,8 +16,10 @@ Low-level logging formatter subclasses.
 # these circularities are best avoided here rather than elsewhere.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
-# from betse.util.type.types import type_check
-from logging import Formatter
+import time
+from betse.util.type.types import StrOrNoneTypes
+from logging import Formatter, LogRecord, PercentStyle, StrFormatStyle
+from typing import no_type_check
 
 # ....................{ CLASSES                           }....................
 #FIXME: Unfortunately, this fundamentally fails to work. The reason why? The
@@ -42,11 +44,104 @@ class LogFormatterWrap(Formatter):
 
     Attributes
     ----------
+    _fmt_interpolator : CallableTypes
+        Bound method of the format string passed at initialization time
+        interpolating that string with a passed dictionary if that string is
+        either ``%``- or ``{``-style *or* ``None`` otherwise.
+    _time_cache : tuple
+        2-tuple ``(time_sec, time_str)`` caching the timestamp formatted by
+        the most recent call to the :meth:`formatTime` method, where:
+
+        * ``time_sec`` is that timestamp truncated to the nearest second.
+        * ``time_str`` is that timestamp formatted to second precision.
     _text_wrapper : TextWrapper
         Object with which to wrap log messages, cached for efficiency.
     '''
 
-    pass
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self, *args, **kwargs) -> None:
+
+        # Initialize our superclass with all passed parameters.
+        super().__init__(*args, **kwargs)
+
+        # Nullify all instance variables for safety.
+        self._time_cache = (None, None)
+
+        # Bound method interpolating this format string, defaulting to "None".
+        self._fmt_interpolator = None
+
+        # If no default field values were passed, bind the method of this
+        # format string interpolating this string with a passed dictionary.
+        # The superclass instead interpolates this string through several
+        # layers of indirection on each call. Worse, for "{"-style format
+        # strings, the superclass calls the str.format() method passed a
+        # keyword argument for each attribute of each log record, which
+        # needlessly copies the dictionary of these attributes on each call.
+        if not getattr(self._style, '_defaults', None):
+            # If this format string is "%"-style, bind the "%" operator.
+            if type(self._style) is PercentStyle:
+                self._fmt_interpolator = self._fmt.__mod__
+            # If this format string is "{"-style, bind str.format_map().
+            elif type(self._style) is StrFormatStyle:
+                self._fmt_interpolator = self._fmt.format_map
+
+    # ..................{ FORMATTERS                        }..................
+    @no_type_check
+    def formatMessage(self, record: LogRecord) -> str:
+        '''
+        Interpolate the format string passed at initialization time with the
+        attributes of the passed log record.
+
+        The superclass :meth:`Formatter.format` method calls this method
+        *after* setting the ``message`` and (if needed) ``asctime`` attributes
+        of this record.
+        '''
+
+        # If this format string is interpolatable, interpolate this string
+        # directly with the dictionary of all attributes of this record.
+        if self._fmt_interpolator is not None:
+            return self._fmt_interpolator(record.__dict__)
+
+        # Else, defer to our superclass.
+        return super().formatMessage(record)
+
+
+    @no_type_check
+    def formatTime(
+        self, record: LogRecord, datefmt: StrOrNoneTypes = None) -> str:
+        '''
+        Timestamp of the passed log record formatted in the default manner.
+
+        Since formatting timestamps with the :func:`time.strftime` function is
+        non-trivial *and* since successive log records are typically created
+        in the same second, this method caches the timestamp formatted to
+        second precision for the most recent second and appends only the
+        milliseconds of this record to this cached timestamp. For simplicity,
+        timestamps formatted with a non-default format are *not* cached.
+        '''
+
+        # If passed a non-default format, defer to our superclass.
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+
+        # Timestamp of this record truncated to the nearest second.
+        time_sec = int(record.created)
+
+        # Cached timestamp localized for both efficiency and thread-safety.
+        time_cache = self._time_cache
+
+        # If this timestamp is cached, reuse this cache.
+        if time_cache[0] == time_sec:
+            time_str = time_cache[1]
+        # Else, format and cache this timestamp.
+        else:
+            time_str = time.strftime(
+                self.default_time_format, self.converter(record.created))
+            self._time_cache = (time_sec, time_str)
+
+        # Return this timestamp suffixed by the milliseconds of this record.
+        return self.default_msec_format % (time_str, record.msecs)
+
     # def __init__(self, *args, **kwargs):
     #     super().__init__(*args, **kwargs)
     #     self._text_wrapper = TextWrapper(
@@ -66,3 +161,47 @@ class LogFormatterWrap(Formatter):
     #         text = super().format(log_record),
     #         text_wrapper = self._text_wrapper,
     #     )
+
+
+class LogFormatterPrefix(LogFormatterWrap):
+    '''
+    Log formatter prefixing each log message by a constant string.
+
+    This formatter is functionally equivalent to but more efficient than the
+    :class:`LogFormatterWrap` formatter passed a format string embedding this
+    string as a literal followed by only the ``%(message)s`` field, as this
+    formatter avoids interpolating that format string for each log record.
+
+    Attributes
+    ----------
+    _prefix : str
+        String prefixing each log message.
+    '''
+
+    def __init__(self, prefix: str) -> None:
+        '''
+        Initialize this log formatter.
+
+        Parameters
+        ----------
+        prefix : str
+            String prefixing each log message.
+        '''
+
+        # Initialize our superclass with the equivalent format string.
+        super().__init__(fmt='%(message)s')
+
+        # Classify all passed parameters.
+        self._prefix = prefix
+
+
+    @no_type_check
+    def formatMessage(self, record: LogRecord) -> str:
+        '''
+        Prefix the message of the passed log record by this string.
+
+        The superclass :meth:`Formatter.format` method calls this method
+        *after* setting the ``message`` attribute of this record.
+        '''
+
+        return self._prefix + record.message
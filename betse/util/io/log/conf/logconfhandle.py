@@ -19,11 +19,46 @@ Low-level logging handler subclasses.
 # these circularities are best avoided here rather than elsewhere.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
-import errno, time
+import errno, os, time
 from betse.exceptions import BetseLogRaceException
 from betse.util.io import stderrs
-from logging import LogRecord
-from logging.handlers import RotatingFileHandler
+from betse.util.io.log.logenum import LEVEL_ERROR, LEVEL_INFO, LEVEL_NONE
+from logging import LogRecord, StreamHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import no_type_check
+from weakref import WeakSet
+
+# ....................{ CONSTANTS                         }....................
+_FILE_BUFFER_SIZE = 64 * 1024
+'''
+Size in bytes of the write buffer of each logfile opened by the
+:class:`LogHandlerFileRotateSafe` handler.
+'''
+
+
+_FILE_FLUSH_INTERVAL = 30.0
+'''
+Maximum number of seconds between successive flushes of the write buffer of
+each logfile opened by the :class:`LogHandlerFileRotateSafe` handler, excluding
+flushes unconditionally performed on emitting error records.
+'''
+
+# ....................{ GLOBALS                           }....................
+_FILE_HANDLERS = WeakSet()
+'''
+Set of weak references to all :class:`LogHandlerFileRotateSafe` handlers,
+flushed by the :func:`_lock_file_handlers_before_fork` function *before*
+forking the current process.
+'''
+
+
+_FILE_HANDLERS_LOCKED = []
+'''
+List of all :class:`LogHandlerFileRotateSafe` handlers locked by the
+:func:`_lock_file_handlers_before_fork` function *before* forking the current
+process and unlocked by the :func:`_unlock_file_handlers_after_fork` function
+*after* doing so.
+'''
 
 # ....................{ SUBCLASSES                        }....................
 class LogHandlerFileRotateSafe(RotatingFileHandler):
@@ -118,6 +153,15 @@ class LogHandlerFileRotateSafe(RotatingFileHandler):
 
     While non-ideal, no sane solutions exist. File locking is insane.
 
+    This handler also buffers writes to this logfile rather than flushing
+    this logfile on each log record. Specifically, this logfile is flushed
+    only on emitting a log record of level :attr:`LogLevel.ERROR` or greater,
+    on emitting the first log record at least :attr:`flush_interval` seconds
+    after the prior flush, on closing this handler (e.g., at application
+    shutdown), and on forking the current process. The last ensures that
+    forked processes neither inherit nor hence duplicate buffered log records
+    written by the parent process.
+
     .. _ConcurrentLogHandler:
        https://pypi.python.org/pypi/ConcurrentLogHandler
 
@@ -131,7 +175,138 @@ class LogHandlerFileRotateSafe(RotatingFileHandler):
         analysis concluding with similar deficiencies and lack of solutions.
     '''
 
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self, *args, **kwargs) -> None:
+        '''
+        Initialize this rotating file handler.
+
+        All passed parameters are passed as is to the superclass
+        :meth:`RotatingFileHandler.__init__` method.
+        '''
+
+        # Initialize our superclass with all passed parameters.
+        super().__init__(*args, **kwargs)
+
+        # Approximate size in bytes of this logfile if this size has been
+        # synchronized with the physical size of this logfile *OR* "None".
+        self._filesize_approx = None
+
+        # True only if the next call to the flush() method is to be ignored.
+        self._is_flush_deferred = False
+
+        # Monotonic time in fractional seconds of the last flush.
+        self._flush_time = time.monotonic()
+
+        # Maximum number of seconds between successive flushes. Setting this
+        # to 0 flushes this logfile after writing each log record.
+        self.flush_interval = _FILE_FLUSH_INTERVAL
+
+        # Flush this logfile before forking the current process.
+        _FILE_HANDLERS.add(self)
+
+    # ..................{ SUPERCLASS                        }..................
+    def _open(self) -> object:
+        '''
+        Open this logfile with a write buffer of :data:`_FILE_BUFFER_SIZE`
+        bytes and return the resulting text stream.
+        '''
+
+        return open(
+            self.baseFilename,
+            mode=self.mode,
+            buffering=_FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+
+    @no_type_check
+    def flush(self) -> None:
+        '''
+        Flush the write buffer of this logfile unless the currently emitted
+        log record defers doing so.
+
+        The superclass :meth:`StreamHandler.emit` method calls this method
+        after writing each log record. See the :meth:`emit` method.
+        '''
+
+        # If this flush is deferred, silently reduce to a noop.
+        if self._is_flush_deferred:
+            return
+
+        # Else, flush this logfile and record the time of this flush.
+        super().flush()
+        self._flush_time = time.monotonic()
+
+    # ..................{ ROTATORS                          }..................
+    @no_type_check
+    def shouldRollover(self, record: LogRecord) -> bool:
+        '''
+        ``True`` only if emitting the passed logging record would cause this
+        logfile to exceed the maximum filesize passed at initialization time.
+
+        The superclass implementation of this method stats this logfile, seeks
+        to the end of this logfile, and queries the current file position on
+        each call and hence each log record. To avoid these system calls, this
+        method instead maintains a running approximation of the size of this
+        logfile incremented by the length of each emitted log record and only
+        defers to the superclass implementation when this approximation
+        suggests this logfile to be close to that maximum filesize, at which
+        point this approximation is resynchronized with the physical size of
+        this logfile.
+
+        Caveats
+        ----------
+        **This approximation ignores log records appended to this logfile by
+        other processes.** Rotation is merely delayed rather than prevented by
+        such records, as the first call to the superclass implementation
+        accounts for the physical size of this logfile.
+
+        Parameters
+        ----------
+        record : LogRecord
+            Logging record to be emitted.
+
+        Returns
+        ----------
+        bool
+            ``True`` only if this logfile is to be rotated.
+        '''
+
+        # Length of this record as written to this logfile.
+        record_len = len(self.format(record)) + len(self.terminator)
+
+        # If this approximation is known *AND* emitting this record would not
+        # cause this logfile to exceed this maximum filesize, increment this
+        # approximation by this length and report this logfile to *NOT* be
+        # rotated without querying the filesystem.
+        if (
+            self._filesize_approx is not None and
+            self._filesize_approx + record_len < self.maxBytes
+        ):
+            self._filesize_approx += record_len
+            return False
+        # Else, defer to the superclass implementation.
+
+        # True only if this logfile is to be rotated.
+        is_rollover = super().shouldRollover(record)
+
+        # If this logfile is to be rotated, this record is the first record to
+        # be written to the new logfile.
+        if is_rollover:
+            self._filesize_approx = record_len
+        # Else if this logfile is both open *AND* rotatable, the superclass
+        # implementation sought to the end of this logfile. In this case,
+        # resynchronize this approximation with the size of this logfile.
+        elif self.stream is not None and self.maxBytes > 0:
+            self._filesize_approx = self.stream.tell() + record_len
+        # Else, this logfile is unrotatable. Preserve this approximation.
+
+        # Return this boolean.
+        return is_rollover
+
     # ..................{ EMITTERS                          }..................
+    @no_type_check
     def emit(self, record: LogRecord) -> None:
         '''
         Log the passed logging record in a thread- *and* process-safe manner.
@@ -149,6 +324,14 @@ class LogHandlerFileRotateSafe(RotatingFileHandler):
             for write access to the same logfile.
         '''
 
+        # Defer flushing this logfile after writing this record unless this
+        # record is an error *OR* the prior flush was sufficiently long ago.
+        # Since this handler's lock is held by the caller, this is thread-safe.
+        self._is_flush_deferred = (
+            record.levelno < LEVEL_ERROR and
+            time.monotonic() - self._flush_time < self.flush_interval
+        )
+
         # Attempt to emit this record to this logfile and conditionally rotate
         # this logfile in the default non-process-safe manner.
         try:
@@ -225,6 +408,9 @@ class LogHandlerFileRotateSafe(RotatingFileHandler):
             else:
                 raise
         # Else, permit this exception to continue unwinding the call stack.
+        # In any case, permit subsequent external flushes.
+        finally:
+            self._is_flush_deferred = False
 
     # ..................{ PRIVATE                           }..................
     # Note that, while the emit() method defined above *COULD* be reimplemented
@@ -307,3 +493,253 @@ class LogHandlerFileRotateSafe(RotatingFileHandler):
                 'of a (possibly non-existent) log file unique to the current '
                 'process.'.format(ATTEMPTS_MAX)
             ) from exception
+
+# ....................{ SUBCLASSES ~ stream               }....................
+class LogHandlerStreamSansWarnings(StreamHandler):
+    '''
+    Stream handler ignoring all log records with logging levels greater than
+    :attr:`LogLevel.INFO` (e.g., warnings and errors).
+
+    This handler is functionally equivalent to but more efficient than the
+    :class:`StreamHandler` handler filtered by the
+    :class:`betse.util.io.log.logfilter.LogFilterMoreThanInfo` filter, as this
+    handler ignores these records with a single integer comparison rather than
+    by dispatching each log record to that filter.
+    '''
+
+    @no_type_check
+    def handle(self, record: LogRecord) -> bool:
+        '''
+        Emit the passed log record if this record has a logging level less
+        than or equal to :attr:`LogLevel.INFO` *and* is retained by all filters
+        added to this handler.
+
+        Parameters
+        ----------
+        record : LogRecord
+            Logging record to be emitted.
+
+        Returns
+        ----------
+        bool
+            ``True`` only if this record was emitted.
+        '''
+
+        # If this record is a warning or error, silently ignore this record.
+        if record.levelno > LEVEL_INFO:
+            return False
+
+        # Else, defer to our superclass.
+        return super().handle(record)
+
+# ....................{ SUBCLASSES ~ queue                }....................
+class LogHandlerQueue(QueueHandler):
+    '''
+    Queue handler enqueueing each handled log record paired with the subset of
+    all **terminal handlers** (i.e., handlers physically writing log records to
+    standard output, standard error, or disk) accepting that record onto a
+    queue consumed by a :class:`LogListenerQueue` thread.
+
+    This handler offloads all stream and file I/O performed by these terminal
+    handlers from the calling thread onto that listener thread, reducing each
+    logging call in the calling thread to a cheap queue insertion.
+
+    Caveats
+    ----------
+    **The logging levels of these terminal handlers are tested in the calling
+    thread at logging time rather than in the listener thread at output
+    time.** Doing so preserves the synchronous semantics of temporarily
+    changing these levels (e.g., as the :func:`betse.util.io.log.logs.log_exception`
+    function does), which the :class:`QueueListener` superclass would
+    otherwise silently violate by testing these levels only *after* those
+    changes have already been reverted.
+
+    **Log records are output asynchronously.** Log records are thus *not*
+    guaranteed to be interleaved with non-logged output (e.g., via the
+    :func:`print` builtin) in the order in which that output was produced.
+
+    Attributes
+    ----------
+    handlers : tuple
+        Tuple of all terminal handlers to which records handled by this
+        handler are dispatched.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self, queue: object, handlers: tuple) -> None:
+        '''
+        Initialize this queue handler.
+
+        Parameters
+        ----------
+        queue : object
+            Queue onto which this handler enqueues log records, typically a
+            :class:`queue.SimpleQueue` instance.
+        handlers : tuple
+            Tuple of all terminal handlers to which records handled by this
+            handler are dispatched.
+        '''
+
+        # Classify all passed parameters *BEFORE* initializing our superclass,
+        # which sets the "level" property defined below.
+        self.handlers = handlers
+
+        # Initialize our superclass.
+        super().__init__(queue)
+
+    # ..................{ PROPERTIES                        }..................
+    # The "logging.Logger.callHandlers" method tests the "level" attribute of
+    # each handler *BEFORE* calling that handler. Defining this attribute as
+    # the minimum level of all terminal handlers thus avoids enqueueing log
+    # records accepted by no terminal handler -- and preserves the semantics
+    # of the betse.util.io.log.logs.is_level_logged() tester.
+    @property
+    @no_type_check
+    def level(self) -> int:
+        '''
+        Minimum logging level of all terminal handlers.
+        '''
+
+        return min(
+            (handler.level for handler in self.handlers),
+            default=LEVEL_NONE)
+
+
+    @level.setter
+    def level(self, level: int) -> None:
+        '''
+        Silently ignore the passed logging level.
+
+        Since the level of this handler is implied by the levels of all
+        terminal handlers, this setter reduces to a noop. This setter only
+        exists to satisfy the :meth:`Handler.__init__` and
+        :meth:`Handler.setLevel` methods, which unconditionally set this level.
+        '''
+
+        pass
+
+    # ..................{ EMITTERS                          }..................
+    @no_type_check
+    def emit(self, record: LogRecord) -> None:
+        '''
+        Enqueue the passed log record paired with the subset of all terminal
+        handlers whose logging levels currently accept this record.
+
+        Parameters
+        ----------
+        record : LogRecord
+            Logging record to be enqueued.
+        '''
+
+        # Tuple of all terminal handlers accepting this record.
+        handlers = tuple(
+            handler for handler in self.handlers
+            if record.levelno >= handler.level
+        )
+
+        # If no such handler exists, silently reduce to a noop.
+        if not handlers:
+            return
+
+        # Attempt to enqueue this record. The superclass prepare() method
+        # merges all message arguments into this record's message, preventing
+        # this record from referencing mutable objects modified by the
+        # calling thread *BEFORE* this record is output by the listener thread.
+        try:
+            self.enqueue((self.prepare(record), handlers))
+        except Exception:
+            self.handleError(record)
+
+
+class LogListenerQueue(QueueListener):
+    '''
+    Queue listener dispatching each log record enqueued by a
+    :class:`LogHandlerQueue` handler to the terminal handlers paired with that
+    record in a background thread.
+    '''
+
+    # ..................{ HANDLERS                          }..................
+    @no_type_check
+    def handle(self, record_handlers: tuple) -> None:
+        '''
+        Dispatch the passed log record to all terminal handlers paired with
+        that record.
+
+        Parameters
+        ----------
+        record_handlers : tuple
+            2-tuple ``(record, handlers)`` enqueued by the
+            :meth:`LogHandlerQueue.emit` method.
+        '''
+
+        # Log record and all terminal handlers accepting this record.
+        record, handlers = record_handlers
+
+        # For each such handler, output this record. Since an unhandled
+        # exception would silently terminate the listener thread and hence
+        # all subsequent logging, any such exception is reported via the
+        # standard handleError() method instead.
+        for handler in handlers:
+            try:
+                handler.handle(record)
+            except Exception:
+                handler.handleError(record)
+
+# ....................{ FORKERS                           }....................
+def _lock_file_handlers_before_fork() -> None:
+    '''
+    Lock and flush all :class:`LogHandlerFileRotateSafe` handlers *before*
+    forking the current process.
+
+    Holding these locks across this fork prevents other threads (e.g., the
+    :class:`LogListenerQueue` thread) from buffering log records between these
+    flushes and this fork, which the forked process would otherwise inherit
+    and then write a second time on flushing its copy of these buffers.
+    '''
+
+    for handler in tuple(_FILE_HANDLERS):
+        handler.acquire()
+        _FILE_HANDLERS_LOCKED.append(handler)
+
+        # Since failing to flush should *NEVER* prevent forking, silently
+        # ignore any exception. Subsequently writing to this logfile will
+        # report the same exception via the standard handleError() method.
+        try:
+            if handler.stream is not None:
+                handler.stream.flush()
+        except Exception:
+            pass
+
+
+def _unlock_file_handlers_after_fork() -> None:
+    '''
+    Unlock all :class:`LogHandlerFileRotateSafe` handlers locked by the
+    :func:`_lock_file_handlers_before_fork` function *after* forking the
+    current process in the parent process.
+    '''
+
+    for handler in _FILE_HANDLERS_LOCKED:
+        handler.release()
+    _FILE_HANDLERS_LOCKED.clear()
+
+
+def _forget_file_handlers_after_fork() -> None:
+    '''
+    Forget all :class:`LogHandlerFileRotateSafe` handlers locked by the
+    :func:`_lock_file_handlers_before_fork` function *after* forking the
+    current process in the forked process.
+
+    The :mod:`logging` module already reinitializes the locks of all handlers
+    in the forked process. Releasing these locks here would thus be erroneous.
+    '''
+
+    _FILE_HANDLERS_LOCKED.clear()
+
+
+# If the current platform supports forking, register the above functions.
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(
+        before=_lock_file_handlers_before_fork,
+        after_in_parent=_unlock_file_handlers_after_fork,
+        after_in_child=_forget_file_handlers_after_fork,
+    )
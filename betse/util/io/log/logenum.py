@@ -99,3 +99,34 @@ class LogLevel(IntEnum):
     concept of "none" (i.e., of logging nothing), this is an ad-hoc constant
     expected to be larger than the largest constant defined by that module.
     '''
+
+# ....................{ CONSTANTS ~ level                  }....................
+# Integer values of frequently compared logging levels. Accessing a member of
+# an enumeration is an order of magnitude slower than accessing a global
+# integer, which then permits comparisons to reduce to C-level integer
+# comparisons. These constants are intended *ONLY* for use in code called on
+# each log record (e.g., log filters and handlers); all other code should
+# continue to access the corresponding "LogLevel" members.
+
+LEVEL_DEBUG = int(LogLevel.DEBUG)
+'''
+Integer value of the :attr:`LogLevel.DEBUG` logging level.
+'''
+
+
+LEVEL_INFO = int(LogLevel.INFO)
+'''
+Integer value of the :attr:`LogLevel.INFO` logging level.
+'''
+
+
+LEVEL_ERROR = int(LogLevel.ERROR)
+'''
+Integer value of the :attr:`LogLevel.ERROR` logging level.
+'''
+
+
+LEVEL_NONE = int(LogLevel.NONE)
+'''
+Integer value of the :attr:`LogLevel.NONE` logging level.
+'''
@@ -16,9 +16,9 @@ Low-level logging filter subclasses.
 # circularities are best avoided here rather than elsewhere.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 from betse import metadata
-from betse.util.io.log.logenum import LogLevel
-from betse.util.type.types import type_check
+from betse.util.io.log.logenum import LEVEL_DEBUG, LEVEL_INFO
 from logging import Filter, LogRecord
+from typing import no_type_check
 
 # ....................{ CLASSES                            }....................
 class LogFilterThirdPartyDebug(Filter):
@@ -35,18 +35,54 @@ class LogFilterThirdPartyDebug(Filter):
 
     This log filter prevents ignorable debug messages logged by third-party
     frameworks (e.g., Pillow) from polluting this application's debug output.
+
+    Attributes
+    ----------
+    _logger_name_to_is_package : dict
+        Dictionary mapping from the name of each logger previously passed to
+        the :meth:`filter` method to ``True`` only if that name is prefixed by
+        :attr:`_package_name`. Since logger names are typically the fully-
+        qualified names of the submodules declaring those loggers, the size of
+        this dictionary is bounded by the number of such submodules.
+    _package_name : str
+        Name of the top-level package prefixing all retained log record names.
     '''
 
-    @type_check
+    def __init__(self, *args, **kwargs) -> None:
+
+        # Initialize our superclass with all passed parameters.
+        super().__init__(*args, **kwargs)
+
+        # Localize the name of this package, avoiding a module attribute
+        # lookup in the filter() method below.
+        self._package_name = metadata.PACKAGE_NAME
+
+        # Nullify all remaining instance variables for safety.
+        self._logger_name_to_is_package = {}
+
+
+    @no_type_check
     def filter(self, log_record: LogRecord) -> bool:
         '''
         ``True`` only if the passed log record is to be retained.
         '''
 
-        # print('log record name: {}'.format(log_record.name))
-        return (
-            log_record.levelno > LogLevel.DEBUG or
-            log_record.name.startswith(metadata.PACKAGE_NAME))
+        # Name of the logger logging this record.
+        logger_name = log_record.name
+
+        # Attempt to test whether this name is prefixed by this package name
+        # with a dictionary lookup, which is substantially faster than the
+        # equivalent str.startswith() method call.
+        try:
+            is_package = self._logger_name_to_is_package[logger_name]
+        # If this name has yet to be tested, test and cache this name.
+        except KeyError:
+            is_package = self._logger_name_to_is_package[logger_name] = (
+                logger_name.startswith(self._package_name))
+
+        # Test the name of this record first, as most records are logged by
+        # this application rather than third-party frameworks.
+        return is_package or log_record.levelno > LEVEL_DEBUG
 
 
 class LogFilterMoreThanInfo(Filter):
@@ -58,10 +94,10 @@ class LogFilterMoreThanInfo(Filter):
     less than or equal to :attr:`LogLevel.INFO``.
     '''
 
-    @type_check
+    @no_type_check
     def filter(self, log_record: LogRecord) -> bool:
         '''
         ``True`` only if the passed log record is to be retained.
         '''
 
-        return log_record.levelno <= LogLevel.INFO
+        return log_record.levelno <= LEVEL_INFO
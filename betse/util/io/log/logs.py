@@ -100,6 +100,59 @@ def get_logger(logger_name: StrOrNoneTypes = None) -> Logger:
     # Return this logger.
     return logging.getLogger(logger_name)
 
+# ....................{ TESTERS                            }....................
+@type_check
+def is_level_logged(level: LogLevel) -> bool:
+    '''
+    ``True`` only if messages of the passed logging level (e.g.,
+    :attr:`LogLevel.DEBUG`) are currently logged by at least one handler of the
+    root logger.
+
+    The :class:`LogConf` class configures the root logger to accept *all*
+    messages, delegating filtering to the handlers of that logger. The
+    :meth:`Logger.isEnabledFor` method is thus insufficient to decide whether
+    messages of this level are logged; this tester additionally inspects the
+    level of each such handler. These handlers are either:
+
+    * In the main process, the single queue handler added by that class, whose
+      level is the minimum level of the stdout, stderr, and file handlers that
+      handler dispatches to.
+    * In forked processes reinitialized by the
+      :meth:`betse.util.io.log.conf.logconfcls.LogConf.reinit_forked` method,
+      those stdout, stderr, and file handlers themselves.
+
+    Any external handlers added to the root logger (e.g., by pytest's
+    ``caplog`` fixture) are inspected as well. Callers logging messages in
+    performance-critical loops (e.g., once for each animation frame) are
+    advised to call this tester once *before* that loop and avoid logging
+    entirely if this tester returns ``False``.
+
+    Parameters
+    ----------
+    level : LogLevel
+        Logging level to be tested.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if messages of this level are currently logged.
+    '''
+
+    # Root logger, localized for negligible efficiency.
+    logger_root = logging.root
+
+    # Return true only if...
+    return (
+        # This logger accepts messages of this level (as it does by default,
+        # unless an external caller has since raised this logger's level)
+        # *AND*...
+        logger_root.isEnabledFor(level) and
+        # At least one handler of this logger does too. Since the level of
+        # the queue handler is the minimum level of all terminal handlers,
+        # this tests those handlers without iterating over them directly.
+        any(handler.level <= level for handler in logger_root.handlers)
+    )
+
 # ....................{ LOGGERS ~ banner                   }....................
 @type_check
 def log_banner(*args, **kwargs) -> None:
@@ -162,6 +215,11 @@ def log_debug(message: str, *args, **kwargs) -> None:
     Log the passed debug message with the root logger, formatted with the
     passed ``%``-style positional and keyword arguments.
 
+    Since debug messages are usually ignored, callers should pass arguments to
+    be interpolated rather than preformatting this message themselves (e.g.,
+    with an f-string). Callers logging in performance-critical loops should
+    additionally guard this call with the :func:`is_level_logged` tester.
+
     This function expects the :class:`LogConf` class globally configuring
     logging to be instantiated as a singleton.
     '''
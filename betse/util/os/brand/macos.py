@@ -12,7 +12,7 @@ import platform
 from betse.exceptions import BetseOSException
 from betse.util.io.log.logs import log_warning
 from betse.util.type.decorator.decmemo import func_cached
-from ctypes import CDLL, byref, c_int
+from ctypes import CDLL, POINTER, byref, c_int
 
 # ....................{ EXCEPTIONS                         }....................
 def die_unless_macos() -> None:
@@ -93,6 +93,17 @@ def is_aqua() -> bool:
         # Dynamically load this library into the address space of this process.
         security_framework = CDLL(_SECURITY_FRAMEWORK_DYLIB_FILENAME)
 
+        # C function exported by this library, bound exactly once. Declare the
+        # prototype of this function explicitly, preventing ctypes from
+        # inferring the types of passed arguments and the returned value:
+        #     OSStatus SessionGetInfo(
+        #         SecuritySessionId session,
+        #         SecuritySessionId *sessionId,
+        #         SessionAttributeBits *attributes);
+        session_get_info = security_framework.SessionGetInfo
+        session_get_info.argtypes = (c_int, POINTER(c_int), POINTER(c_int))
+        session_get_info.restype = c_int
+
         # Possibly non-unique identifier of the security session to request the
         # attributes of, signifying that of the current process.
         session_id = _SECURITY_SESSION_ID_CURRENT
@@ -112,7 +123,7 @@ def is_aqua() -> bool:
         # * The input non-unique session identifier by value.
         # * The output unique session identifier by reference.
         # * The output session attributes integer by reference.
-        session_errno = security_framework.SessionGetInfo(
+        session_errno = session_get_info(
             session_id, byref(session_id_real), byref(session_attributes))
 
         # This process has access to the Aqua display server if and only if...
@@ -662,14 +662,52 @@ that that API.
 '''
 
 # ....................{ TUPLES : lib ~ matplotlib         }....................
-MatplotlibFigureType = None
-'''
-Type of :mod:`matplotlib` figures if :mod:`matplotlib` is importable *or*
-``None`` otherwise.
+def __getattr__(attr_name: str) -> object:
+    '''
+    Dynamically resolve the passed attribute of this submodule *not* statically
+    defined by this submodule on the first access of that attribute (e.g., by
+    the ``from betse.util.type.types import MatplotlibFigureType`` statement),
+    as implicitly called by Python under :pep:`562`.
+
+    This function currently resolves only the ``MatplotlibFigureType``
+    attribute to the type of :mod:`matplotlib` figures (i.e., the
+    :class:`matplotlib.figure.Figure` class) if :mod:`matplotlib` is
+    importable *or* ``None`` otherwise, permitting callers to avoid importing
+    that class. Since importing that class imports most of :mod:`matplotlib`
+    and since this submodule is imported early in application startup by
+    nearly every other submodule, that class is intentionally imported only on
+    the first access of that attribute rather than at the top level of this
+    submodule.
 
-This class is a synonym of the :class:`matplotlib.figure.Figure` class,
-permitting callers to avoid importing that class.
-'''
+    Parameters
+    ----------
+    attr_name : str
+        Unqualified name of the attribute to be resolved.
+
+    Returns
+    ----------
+    object
+        Value of this attribute.
+
+    Raises
+    ----------
+    AttributeError
+        If this attribute is unrecognized.
+    '''
+
+    # If resolving the type of matplotlib figures, do so.
+    if attr_name == 'MatplotlibFigureType':
+        # If matplotlib is importable, return this type.
+        try:
+            from matplotlib.figure import Figure
+            return Figure
+        # Else, return "None".
+        except ImportError:
+            return None
+
+    # Else, this attribute is unrecognized. Raise the standard exception.
+    raise AttributeError(
+        f'Module "{__name__}" has no attribute "{attr_name}".')
 
 # ....................{ TUPLES : lib ~ numpy              }....................
 NumpyArrayType = None
@@ -712,13 +750,6 @@ to avoid importing that class.
 # guaranteed to raise human-readable exceptions on missing mandatory
 # dependencies, their absence here is ignorable.
 
-# If matplotlib is importable, conditionally define matplotlib-specific types.
-try:
-    from matplotlib.figure import Figure
-    MatplotlibFigureType = Figure
-except:
-    pass
-
 # If NumPy is importable, conditionally define NumPy-specific types.
 try:
     import numpy
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright 2014-2025 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.util.io.log.conf.logconfhandle` submodule.
+'''
+
+# ....................{ TESTS ~ queue                      }....................
+def test_log_handler_queue_level() -> None:
+    '''
+    Test that the level of the
+    :class:`betse.util.io.log.conf.logconfhandle.LogHandlerQueue` handler is
+    the minimum level of all terminal handlers dispatched to by that handler.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.util.io.log.conf.logconfhandle import LogHandlerQueue
+    from betse.util.io.log.logenum import LogLevel
+    from logging import StreamHandler
+    from queue import SimpleQueue
+
+    # Terminal handlers with arbitrary levels.
+    handler_info = StreamHandler()
+    handler_info.setLevel(LogLevel.INFO)
+    handler_warning = StreamHandler()
+    handler_warning.setLevel(LogLevel.WARNING)
+
+    # Queue handler dispatching to these handlers.
+    handler_queue = LogHandlerQueue(
+        queue=SimpleQueue(), handlers=(handler_info, handler_warning))
+
+    # Assert this level to be the minimum of these levels.
+    assert handler_queue.level == LogLevel.INFO
+
+    # Assert this level to track changes to these levels.
+    handler_warning.setLevel(LogLevel.DEBUG)
+    assert handler_queue.level == LogLevel.DEBUG
+
+    # Assert attempts to directly set this level to be silently ignored.
+    handler_queue.setLevel(LogLevel.ERROR)
+    assert handler_queue.level == LogLevel.DEBUG
+
+
+def test_log_handler_queue_dispatch() -> None:
+    '''
+    Test that the
+    :class:`betse.util.io.log.conf.logconfhandle.LogHandlerQueue` handler and
+    :class:`betse.util.io.log.conf.logconfhandle.LogListenerQueue` listener
+    dispatch each log record to *only* the terminal handlers whose levels
+    accept that record at logging time.
+    '''
+
+    # Defer heavyweight imports.
+    import logging
+    from betse.util.io.log.conf.logconfhandle import (
+        LogHandlerQueue, LogListenerQueue)
+    from betse.util.io.log.logenum import LogLevel
+    from io import StringIO
+    from logging import StreamHandler
+    from queue import SimpleQueue
+
+    # Terminal handlers writing to in-memory streams with arbitrary levels.
+    stream_info = StringIO()
+    stream_warning = StringIO()
+    handler_info = StreamHandler(stream_info)
+    handler_info.setLevel(LogLevel.INFO)
+    handler_warning = StreamHandler(stream_warning)
+    handler_warning.setLevel(LogLevel.WARNING)
+
+    # Queue handler and listener dispatching to these handlers.
+    log_queue = SimpleQueue()
+    handler_queue = LogHandlerQueue(
+        queue=log_queue, handlers=(handler_info, handler_warning))
+    listener = LogListenerQueue(log_queue)
+
+    # Non-propagating logger logging only to this queue handler.
+    logger = logging.getLogger('betse_test.logconfhandle.dispatch')
+    logger.propagate = False
+    logger.setLevel(LogLevel.ALL)
+    logger.addHandler(handler_queue)
+
+    # Log records of increasing levels, including an informational record
+    # logged while the first handler is temporarily restricted to warnings.
+    # Since levels are tested at logging time, this record is ignored by that
+    # handler even though that restriction is reverted *BEFORE* the listener
+    # thread outputs this record.
+    listener.start()
+    try:
+        logger.debug('Seven of Nine')
+        logger.info('Annika Hansen')
+        handler_info.setLevel(LogLevel.WARNING)
+        logger.info('Borg drone')
+        handler_info.setLevel(LogLevel.INFO)
+        logger.warning('Unimatrix Zero')
+    # Halt this thread, outputting all enqueued records, and remove this
+    # handler regardless of whether the above logic raised an exception.
+    finally:
+        listener.stop()
+        logger.removeHandler(handler_queue)
+
+    # Assert each handler to have output only the records it accepted.
+    assert stream_info.getvalue() == 'Annika Hansen\nUnimatrix Zero\n'
+    assert stream_warning.getvalue() == 'Unimatrix Zero\n'
+
+# ....................{ TESTS ~ file                       }....................
+def test_log_handler_file_flush(
+    betse_temp_dir: 'py._path.local.LocalPath') -> None:
+    '''
+    Test that the
+    :class:`betse.util.io.log.conf.logconfhandle.LogHandlerFileRotateSafe`
+    handler defers flushing non-error log records until the next error log
+    record, flush interval, or closure of that handler.
+
+    Parameters
+    ----------
+    betse_temp_dir : py._path.local.LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.util.io.log.conf.logconfhandle import LogHandlerFileRotateSafe
+    from betse.util.io.log.logenum import LogLevel
+
+    # Absolute filename of a logfile with arbitrary basename.
+    log_filepath = betse_temp_dir.join('Equinox.log')
+    log_filename = str(log_filepath)
+
+    # Rotating logfile handler.
+    handler_file = LogHandlerFileRotateSafe(
+        filename=log_filename, maxBytes=1024*1024, backupCount=1)
+
+    # Attempt to...
+    try:
+        # Assert a non-error record to be buffered rather than written.
+        handler_file.handle(_make_record('Captain Ransom', LogLevel.INFO))
+        assert log_filepath.read() == ''
+
+        # Assert an error record to flush all buffered records.
+        handler_file.handle(_make_record('Noah Lessing', LogLevel.ERROR))
+        assert log_filepath.read() == 'Captain Ransom\nNoah Lessing\n'
+
+        # Assert a non-error record to be written immediately when flushing
+        # after each record, as in forked processes.
+        handler_file.flush_interval = 0
+        handler_file.handle(_make_record('Marla Gilmore', LogLevel.INFO))
+        assert log_filepath.read().endswith('Marla Gilmore\n')
+
+        # Assert a buffered non-error record to be written on closure.
+        handler_file.flush_interval = 30.0
+        handler_file.handle(_make_record('Max Burke', LogLevel.INFO))
+        assert not log_filepath.read().endswith('Max Burke\n')
+    # Close this handler regardless of whether the above logic raised an
+    # exception.
+    finally:
+        handler_file.close()
+    assert log_filepath.read().endswith('Max Burke\n')
+
+# ....................{ PRIVATE ~ records                  }....................
+def _make_record(message: str, level: int) -> 'logging.LogRecord':
+    '''
+    Log record with the passed message and level.
+    '''
+
+    # Defer heavyweight imports.
+    import logging
+
+    return logging.makeLogRecord({
+        'msg': message,
+        'levelno': level,
+        'levelname': logging.getLevelName(level),
+    })
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright 2014-2025 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.lib.matplotlib` subpackage.
+'''
+
+# ....................{ IMPORTS                            }....................
+from pytest import mark
+
+# ....................{ TESTS                              }....................
+@mark.parametrize('frames_in_memory', (0, 2))
+def test_image_movie_writer_async(
+    betse_temp_dir: 'py._path.local.LocalPath', frames_in_memory: int) -> None:
+    '''
+    Test that the :class:`betse.lib.matplotlib.writer.mplcls.ImageMovieWriter`
+    class writes frame images when asynchronously compressing frames in a
+    background thread that are pixel-for-pixel identical to the frame images
+    written when synchronously doing so in the calling thread.
+
+    Parameters
+    ----------
+    betse_temp_dir : py._path.local.LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    frames_in_memory : int
+        Maximum number of rendered frames retained in memory by this writer.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from PIL import Image
+    from betse.lib.matplotlib.writer.mplcls import ImageMovieWriter
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    # Number of frames to be written, intentionally *NOT* a multiple of the
+    # number of frames retained in memory to exercise partial batches.
+    FRAME_COUNT = 5
+
+    # Figure with a line replotted for each frame.
+    figure = Figure(figsize=(2.0, 1.5))
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+    axes.set_xlim(0, FRAME_COUNT)
+    axes.set_ylim(0, FRAME_COUNT)
+    line, = axes.plot([], [])
+
+    # For each of the asynchronous and synchronous modes of this writer...
+    for is_async in (True, False):
+        # Writer writing frames in this mode.
+        writer = ImageMovieWriter(
+            fps=5, is_async=is_async, frames_in_memory=frames_in_memory)
+
+        # Subdirectory of all frame images written in this mode, created
+        # before writing these images as required by the superclass.
+        frame_dirpath = betse_temp_dir.join('async' if is_async else 'sync')
+        frame_dirpath.ensure(dir=True)
+
+        # Filename template of all frame images written in this mode.
+        frame_filename_template = str(frame_dirpath.join('frame_{:02d}.png'))
+
+        # Write all frames in this mode.
+        writer.setup(figure, frame_filename_template, dpi=40)
+        for frame_number in range(FRAME_COUNT):
+            line.set_data(range(frame_number + 1), range(frame_number + 1))
+            writer.grab_frame()
+        writer.finish()
+
+    # For each frame, assert the images written in both modes to be identical.
+    for frame_number in range(FRAME_COUNT):
+        frame_basename = 'frame_{:02d}.png'.format(frame_number)
+        with Image.open(str(betse_temp_dir.join(
+            'async', frame_basename))) as frame_async, Image.open(str(
+            betse_temp_dir.join('sync', frame_basename))) as frame_sync:
+            assert frame_async.size == frame_sync.size
+            assert np.array_equal(
+                np.asarray(frame_async.convert('RGBA')),
+                np.asarray(frame_sync.convert('RGBA')),
+            )
+
+
+def test_is_blit_figure_supported(monkeypatch: 'pytest.MonkeyPatch') -> None:
+    '''
+    Test that the
+    :func:`betse.lib.matplotlib.mplanim.is_blit_figure_supported` tester
+    rejects both matplotlib versions newer than the maximum version known to
+    be compatible with the
+    :class:`betse.lib.matplotlib.mplanim.FuncAnimationBlitFigure` subclass
+    *and* matplotlib versions no longer defining the private hooks overridden
+    by that subclass.
+
+    Parameters
+    ----------
+    monkeypatch : MonkeyPatch
+        Builtin fixture object permitting object attributes to be safely
+        modified for the duration of this test.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.lib.matplotlib import mplanim
+    from matplotlib.animation import Animation
+
+    # Tester to be tested, localized for brevity.
+    is_blit_figure_supported = mplanim.is_blit_figure_supported
+
+    # Assert this tester to reject matplotlib versions newer than the maximum.
+    monkeypatch.setattr(
+        mplanim, '_BLIT_FIGURE_MATPLOTLIB_VERSION_MAX', '0.0.1')
+    assert is_blit_figure_supported() is False
+    monkeypatch.undo()
+
+    # Assert this tester to reject matplotlib versions no longer defining a
+    # private hook overridden by that subclass, removed from the superclass of
+    # "FuncAnimation" defining this hook.
+    monkeypatch.delattr(Animation, '_on_resize')
+    assert is_blit_figure_supported() is False
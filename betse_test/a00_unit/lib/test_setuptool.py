@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright 2014-2025 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.lib.setuptools.setuptool` submodule.
+'''
+
+# ....................{ TESTS                              }....................
+def test_is_requirement() -> None:
+    '''
+    Test the :func:`betse.lib.setuptools.setuptool.is_requirement` tester
+    against requirements satisfied by installed packages, unsatisfied by the
+    versions of installed packages, and unsatisfied by uninstalled packages.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.lib.setuptools import setuptool
+
+    # Assert requirements satisfied by the installed version of NumPy to be
+    # satisfied.
+    assert setuptool.is_requirement_str('Numpy >= 1.0') is True
+    assert setuptool.is_requirement_str('Numpy >= 1.0', 'PyYAML') is True
+
+    # Assert requirements unsatisfied by that version to be unsatisfied.
+    assert setuptool.is_requirement_str('Numpy >= 9999.0') is False
+    assert setuptool.is_requirement_str('Numpy >= 1.0', 'Numpy < 1.0') is False
+
+    # Assert requirements for an uninstalled package to be unsatisfied.
+    assert setuptool.is_requirement_str('Worf_Son_of_Mogh') is False
+
+
+def test_die_unless_requirement() -> None:
+    '''
+    Test the :func:`betse.lib.setuptools.setuptool.die_unless_requirement`
+    validator against requirements satisfied by installed packages, unsatisfied
+    by the versions of installed packages, and unsatisfied by uninstalled
+    packages.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy, pytest
+    from betse.exceptions import (
+        BetseLibException, BetseLibRequirementVersionException)
+    from betse.lib.setuptools import setuptool
+
+    # Assert requirements satisfied by the installed version of NumPy to be
+    # silently accepted.
+    setuptool.die_unless_requirements_str('Numpy >= 1.0', 'PyYAML')
+
+    # Assert a requirement unsatisfied by that version to raise the expected
+    # exception describing both that requirement and that version.
+    with pytest.raises(BetseLibRequirementVersionException) as exception_info:
+        setuptool.die_unless_requirements_str('Numpy >= 9999.0')
+    exception = exception_info.value
+    assert exception.requirement == 'Numpy>=9999.0'
+    assert exception.version == numpy.__version__
+    assert str(exception) == (
+        'Dependency "Numpy>=9999.0" unsatisfied by '
+        'installed version {}.'.format(numpy.__version__))
+
+    # Assert a requirement for an uninstalled package to raise an exception
+    # reporting this package to be missing.
+    with pytest.raises(BetseLibException) as exception_info:
+        setuptool.die_unless_requirements_str('Worf_Son_of_Mogh')
+    assert str(exception_info.value) == (
+        'Dependency "Worf-Son-of-Mogh" not found.')
+
+
+def test_is_requirement_unversioned(
+    betse_temp_dir: 'py._path.local.LocalPath',
+    monkeypatch: 'pytest.MonkeyPatch',
+) -> None:
+    '''
+    Test the :func:`betse.lib.setuptools.setuptool.is_requirement` tester and
+    :func:`betse.lib.setuptools.setuptool.die_unless_requirement` validator
+    against **unversioned requirements** (i.e., requirements constraining no
+    versions) for packages declaring no versions and packages whose
+    importation fails.
+
+    Parameters
+    ----------
+    betse_temp_dir : py._path.local.LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    monkeypatch : MonkeyPatch
+        Builtin fixture object permitting object attributes to be safely
+        modified for the duration of this test.
+    '''
+
+    # Defer heavyweight imports.
+    import pytest, sys
+    from betse.exceptions import BetseLibException
+    from betse.lib.setuptools import setuptool
+
+    # Names of a package declaring no version and a package whose importation
+    # raises an exception.
+    PACKAGE_NAME_UNVERSIONED = 'betsetestpkgunversioned'
+    PACKAGE_NAME_BROKEN = 'betsetestpkgbroken'
+
+    # Create these packages in this temporary directory.
+    betse_temp_dir.join(PACKAGE_NAME_UNVERSIONED, '__init__.py').write(
+        '', ensure=True)
+    betse_temp_dir.join(PACKAGE_NAME_BROKEN, '__init__.py').write(
+        'raise ImportError("Borg cube detected.")\n', ensure=True)
+
+    # Prepend this directory to the import path for the duration of this test.
+    monkeypatch.syspath_prepend(str(betse_temp_dir))
+
+    # Attempt to...
+    try:
+        # Assert an unversioned requirement for the package declaring no
+        # version to be satisfied.
+        assert setuptool.is_requirement_str(PACKAGE_NAME_UNVERSIONED) is True
+        setuptool.die_unless_requirements_str(PACKAGE_NAME_UNVERSIONED)
+
+        # Assert an unversioned requirement for the package whose importation
+        # fails to be unsatisfied, despite that package being found on the
+        # import path.
+        assert setuptool.is_requirement_str(PACKAGE_NAME_BROKEN) is False
+        with pytest.raises(BetseLibException):
+            setuptool.die_unless_requirements_str(PACKAGE_NAME_BROKEN)
+
+        # Assert a versioned requirement for the package declaring no version
+        # and installed without distribution metadata to be unsatisfied.
+        requirement_versioned = PACKAGE_NAME_UNVERSIONED + ' >= 1.0'
+        assert setuptool.is_requirement_str(requirement_versioned) is False
+        with pytest.raises(BetseLibException):
+            setuptool.die_unless_requirements_str(requirement_versioned)
+    # Unimport these packages regardless of whether the above logic raised an
+    # exception.
+    finally:
+        sys.modules.pop(PACKAGE_NAME_UNVERSIONED, None)
+        sys.modules.pop(PACKAGE_NAME_BROKEN, None)
+
+
+def test_get_requirement_distribution_extras() -> None:
+    '''
+    Test the
+    :func:`betse.lib.setuptools.setuptool.get_requirement_distribution_or_none`
+    getter against requirements requiring extras both provided and *not*
+    provided by the installed distribution of pytest.
+    '''
+
+    # Defer heavyweight imports.
+    import pkg_resources, pytest
+    from betse.lib.setuptools import setuptool
+    from importlib import metadata as importlib_metadata
+
+    # Names of all extras provided by the installed distribution of pytest.
+    pytest_extras = importlib_metadata.distribution('pytest').metadata.get_all(
+        'Provides-Extra', ())
+
+    # If this distribution provides at least one extra, assert a requirement
+    # requiring that extra to be satisfied.
+    if pytest_extras:
+        assert setuptool.get_requirement_distribution_or_none(
+            pkg_resources.Requirement.parse(
+                'pytest[{}]'.format(pytest_extras[0]))) is not None
+
+    # Requirement requiring an extra provided by no distribution.
+    requirement = pkg_resources.Requirement.parse('pytest[Sela]')
+
+    # Assert this requirement to raise the expected exception.
+    with pytest.raises(pkg_resources.UnknownExtra):
+        setuptool.get_requirement_distribution_or_none(requirement)
+
+    # Assert the synopsis of this requirement to note this extra to be missing.
+    assert setuptool.get_requirement_synopsis(requirement).endswith(
+        '[fails to provide the extras of pytest[sela]]')
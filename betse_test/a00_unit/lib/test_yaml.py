@@ -99,3 +99,49 @@ def test_yaml_roundtrip(betse_sim_conf: SimConfTestInternal) -> None:
     assert p.is_ecm == p_sim_ECM_expected
     assert p.cell_polarizability == p_cell_polarizability_expected
     assert p.seed_pickle_basename == p_seed_pickle_basename_expected
+
+
+def test_yaml_load_cache(
+    betse_temp_dir: 'py._path.local.LocalPath') -> None:
+    '''
+    Test that the :func:`betse.lib.yaml.yamls.load` function isolates the
+    containers it caches for non-roundtripped YAML files from the containers
+    it returns, such that modifying a returned container does *not* modify
+    the container returned by a subsequent load of the same unmodified file.
+
+    Parameters
+    ----------
+    betse_temp_dir : py._path.local.LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.lib.yaml import yamls
+
+    # Absolute filename of a YAML file with arbitrary basename.
+    yaml_filepath = betse_temp_dir.join('Tuvix.yaml')
+    yaml_filename = str(yaml_filepath)
+
+    # Write a nested mapping to this file.
+    yaml_filepath.write('crew:\n  names: [Tuvok, Neelix]\n  count: 2\n')
+
+    # Load this file twice without roundtripping, modifying the nested
+    # containers of the first load.
+    yaml_first = yamls.load(yaml_filename, is_roundtrip=False)
+    yaml_first['crew']['names'].append('Tuvix')
+    yaml_first['crew']['count'] = 1
+    yaml_second = yamls.load(yaml_filename, is_roundtrip=False)
+
+    # Assert the second load to be unaffected by these modifications.
+    assert yaml_second == {'crew': {'names': ['Tuvok', 'Neelix'], 'count': 2}}
+    assert yaml_second is not yaml_first
+
+    # Modify the second load and assert a third load to be unaffected.
+    yaml_second['crew']['names'].clear()
+    yaml_third = yamls.load(yaml_filename, is_roundtrip=False)
+    assert yaml_third['crew']['names'] == ['Tuvok', 'Neelix']
+
+    # Modify this file and assert a fourth load to reflect this modification.
+    yaml_filepath.write('crew:\n  names: [Tuvix]\n  count: 1\n')
+    yaml_fourth = yamls.load(yaml_filename, is_roundtrip=False)
+    assert yaml_fourth == {'crew': {'names': ['Tuvix'], 'count': 1}}
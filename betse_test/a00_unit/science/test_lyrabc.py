@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright 2014-2025 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.visual.layer.lyrabc` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+from betse_test._fixture.simconf.simconfclser import SimConfTestInternal
+
+# ....................{ TESTS                              }....................
+def test_layer_color_autoscale_field_magnitudes(
+    betse_sim_conf: SimConfTestInternal) -> None:
+    '''
+    Test that autoscaling the colorbar of the lower layer of a layered
+    animation of vector field magnitudes spatially situated at grid space
+    centres (i.e., the layer created by the
+    :meth:`betse.science.pipe.export.pipeexpanim.SimPipeExportAnimCells._export_field_over_magnitudes`
+    method) clips that colorbar to builtin floats, despite these magnitudes
+    being single-precision Numpy arrays.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.enum.enumphase import SimPhaseKind
+    from betse.science.math.vector.veccls import VectorCellsCache
+    from betse.science.math.vector.vecfldcls import FIELD_DTYPE, VectorField
+    from betse.science.phase.phasecls import SimPhase
+    from betse.science.visual.layer.vector.lyrvecsmooth import (
+        LayerCellsVectorSmoothGrids)
+    from types import SimpleNamespace
+
+    # Simulation phase encapsulating this configuration.
+    phase = SimPhase(kind=SimPhaseKind.SIM, p=betse_sim_conf.p)
+
+    # Vector field of double-precision components for two time steps of a
+    # 3x4 environmental grid.
+    field = VectorField(
+        x=np.arange(24, dtype=np.float64).reshape((2, 3, 4)),
+        y=np.full((2, 3, 4), -2.0, dtype=np.float64),
+    )
+
+    # Assert the magnitudes of this field to be single-precision.
+    assert field.magnitudes.dtype == FIELD_DTYPE
+
+    # Lower layer animating these magnitudes.
+    layer = LayerCellsVectorSmoothGrids(vector=VectorCellsCache(
+        phase=phase, times_grids_centre=field.magnitudes))
+
+    # Parent animation of this layer, reduced to the minimal configuration
+    # required to autoscale this layer's colorbar.
+    layer._visual = SimpleNamespace(
+        conf=SimpleNamespace(is_color_autoscaled=True))
+
+    # Autoscale this layer's colorbar.
+    layer._set_color_range()
+
+    # Assert this colorbar to have been clipped to builtin floats equal to the
+    # minimum and maximum magnitudes.
+    assert type(layer._color_min) is float
+    assert type(layer._color_max) is float
+    assert layer._color_min == 2.0
+    assert layer._color_max == float(np.hypot(np.float32(23), np.float32(2)))
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright 2014-2025 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.pipe.export.pipeexps` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+from betse.util.test.pytest.mark.pytskip import skip_if_os_windows_vanilla
+from betse_test._fixture.simconf.simconfclser import SimConfTestInternal
+from types import SimpleNamespace
+
+# ....................{ TESTS                              }....................
+@skip_if_os_windows_vanilla()
+def test_pipeexps_forked_logging(
+    betse_temp_dir: 'py._path.local.LocalPath') -> None:
+    '''
+    Test that log records logged by worker processes forked by the
+    :func:`betse.science.pipe.export.pipeexps._run_runners_forked` function
+    (and hence initialized by the
+    :func:`betse.science.pipe.export.pipeexps._init_runner_forked` function)
+    are written to the current logfile exactly once *and* that log records
+    logged by the parent process before forking these processes are not
+    duplicated by these processes.
+
+    Parameters
+    ----------
+    betse_temp_dir : py._path.local.LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    import multiprocessing
+    from betse.science.pipe.export import pipeexps
+    from betse.util.io.log import logs
+    from betse.util.io.log.conf import logconf
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Logging configuration and its current logfile.
+    log_conf = logconf.get_log_conf()
+    log_filename_old = log_conf.filename
+
+    # Absolute filename of a temporary logfile.
+    log_filename = str(betse_temp_dir.join('Ro_Laren.log'))
+
+    # Attempt to log to this logfile from both this and forked processes.
+    try:
+        log_conf.filename = log_filename
+        logs.log_info('Parent process logging before forking...')
+
+        # Log from each of two forked worker processes.
+        with ProcessPoolExecutor(
+            max_workers=2,
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=pipeexps._init_runner_forked,
+        ) as executor:
+            worker_indices = list(executor.map(_log_forked, range(2)))
+        assert worker_indices == [0, 1]
+    # Restore the prior logfile, flushing this logfile, regardless of whether
+    # the above logic raised an exception.
+    finally:
+        log_conf.filename = log_filename_old
+
+    # Contents of this logfile.
+    with open(log_filename) as log_file:
+        log_text = log_file.read()
+
+    # Assert these log records to have each been written exactly once.
+    assert log_text.count('Parent process logging before forking...') == 1
+    assert log_text.count('Worker 0 logging...') == 1
+    assert log_text.count('Worker 1 logging...') == 1
+
+
+@skip_if_os_windows_vanilla()
+def test_pipeexps_forked_listener_busy(
+    betse_sim_conf: SimConfTestInternal,
+    betse_temp_dir: 'py._path.local.LocalPath',
+    monkeypatch: 'pytest.MonkeyPatch',
+) -> None:
+    '''
+    Test that the
+    :func:`betse.science.pipe.export.pipeexps._run_runners_forked` function
+    forks its worker processes only after halting the logging listener thread
+    while that thread is busy outputting log records logged by the parent
+    process *and* that all log records logged by both the parent and worker
+    processes are written to the current logfile exactly once.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    betse_temp_dir : py._path.local.LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    monkeypatch : MonkeyPatch
+        Builtin fixture object permitting object attributes to be safely
+        modified for the duration of this test.
+    '''
+
+    # Defer heavyweight imports.
+    import os, threading
+    from betse.science.enum.enumphase import SimPhaseKind
+    from betse.science.phase.phasecallbacks import SimCallbacksNoop
+    from betse.science.phase.phasecls import SimPhase
+    from betse.science.pipe.export import pipeexps
+    from betse.util.io.log import logs
+    from betse.util.io.log.conf import logconf
+
+    # Number of log records logged by the parent process before forking.
+    RECORD_COUNT = 2000
+
+    # Number of runners to be run by worker processes.
+    RUNNER_COUNT = 4
+
+    # Simulation phase encapsulating this configuration, parallelizing
+    # runners across two worker processes.
+    betse_sim_conf.p.anim.after_sim_processes = 2
+    phase = SimPhase(
+        kind=SimPhaseKind.SIM,
+        p=betse_sim_conf.p,
+        callbacks=SimCallbacksNoop(),
+    )
+
+    # Number of threads running in the parent process on each fork.
+    fork_thread_counts = []
+
+    # Record this number on each fork *BEFORE* forking.
+    os_fork = os.fork
+    def _fork() -> int:
+        fork_thread_counts.append(threading.active_count())
+        return os_fork()
+    monkeypatch.setattr(os, 'fork', _fork)
+
+    # Logging configuration and its current logfile.
+    log_conf = logconf.get_log_conf()
+    log_filename_old = log_conf.filename
+
+    # Absolute filename of a temporary logfile.
+    log_filename = str(betse_temp_dir.join('Tasha_Yar.log'))
+
+    # Attempt to log to this logfile from both this and forked processes.
+    try:
+        log_conf.filename = log_filename
+
+        # Occupy the listener thread with outputting many log records.
+        for record_index in range(RECORD_COUNT):
+            logs.log_info('Parent process logging record %d...', record_index)
+
+        # Run runners logging from forked worker processes.
+        pipeexps._run_runners_forked(phase=phase, runners=[
+            (_log_runner_forked, runner_index)
+            for runner_index in range(RUNNER_COUNT)
+        ])
+    # Restore the prior logfile, flushing this logfile, regardless of whether
+    # the above logic raised an exception.
+    finally:
+        log_conf.filename = log_filename_old
+
+    # Assert each worker process to have been forked while no thread other
+    # than the main thread was running (i.e., after halting the listener).
+    assert fork_thread_counts
+    assert all(
+        fork_thread_count == 1 for fork_thread_count in fork_thread_counts)
+
+    # Contents of this logfile.
+    with open(log_filename) as log_file:
+        log_text = log_file.read()
+
+    # Assert these log records to have each been written exactly once.
+    assert log_text.count('Parent process logging record ') == RECORD_COUNT
+    for runner_index in range(RUNNER_COUNT):
+        assert log_text.count(
+            'Runner {} logging...'.format(runner_index)) == 1
+
+# ....................{ PRIVATE ~ workers                  }....................
+def _log_forked(worker_index: int) -> int:
+    '''
+    Log a message identifying the passed worker index from the current forked
+    worker process and return this index.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.util.io.log import logs
+
+    logs.log_info('Worker %d logging...', worker_index)
+    return worker_index
+
+
+def _log_runner_forked(phase: object, runner_index: int) -> None:
+    '''
+    Pipeline runner logging a message identifying the passed runner index
+    (passed in place of the runner configuration) from the current forked
+    worker process.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.util.io.log import logs
+
+    logs.log_info('Runner %d logging...', runner_index)
+
+
+# Metadata describing this runner, as required by the
+# betse.science.pipe.export.pipeexps._run_runner() function.
+_log_runner_forked.metadata = SimpleNamespace(
+    noun_singular_lowercase='test runner', kind='log')